@@ -2,7 +2,29 @@
 import argparse
 import asyncio
 import logging
-from src.generators.wiki_generator import WikiGenerator
+import sys
+from pathlib import Path
+from src.batch import (
+    BatchJob,
+    ResourceGovernor,
+    check_folders,
+    enqueue,
+    expand_sources,
+    load_manifest,
+    load_timings,
+    parse_shard,
+    run_batch,
+    run_pipeline,
+    run_worker,
+    shard_jobs,
+    summarize,
+    write_report,
+)
+from src.generators.cache import RenderCache
+from src.generators.emitters import EMITTERS
+from src.generators.sinks import DirectorySink, create_sink
+from src.generators.wiki_generator import PAGES, WikiGenerator
+from src.service import DocumentationService, parse_address, serve_forever
 
 
 def main():
@@ -11,17 +33,29 @@ def main():
     )
     parser.add_argument(
         "source",
-        nargs="?",
-        help="Path to PBIX file, PBIP folder, or connection string"
+        nargs="*",
+        help="Paths to PBIX files or PBIP folders, connection strings, or glob "
+             "patterns (e.g. 'models/**/*.pbix')"
+    )
+    parser.add_argument(
+        "--manifest",
+        metavar="FILE",
+        help="JSON manifest listing models with per-model engine and options"
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        help="Write per-model results and timings as JSON (input for --timings)"
     )
     parser.add_argument(
         "-o", "--output",
         default="./docs",
-        help="Output directory for documentation pages (default: ./docs)"
+        help="Output directory for documentation pages (default: ./docs). "
+             "A path ending in .zip or .tar.gz writes a single archive instead."
     )
     parser.add_argument(
         "-n", "--name",
-        help="Model name (default: derived from source)"
+        help="Model name (default: derived from source; single source only)"
     )
     
     # Engine selection
@@ -70,6 +104,207 @@ def main():
         help="Shortcut for --engine mcp with Desktop connection string"
     )
     
+    # Performance
+    perf_group = parser.add_argument_group("Performance Options")
+    perf_group.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of models documented concurrently in a batch; the largest "
+             "sources start first (default: 1)"
+    )
+    perf_group.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Overlap extraction and rendering across models: --workers models "
+             "are extracted concurrently while --render-workers render"
+    )
+    perf_group.add_argument(
+        "--render-workers",
+        type=int,
+        default=1,
+        help="Number of models rendered concurrently with --pipeline (default: 1)"
+    )
+    perf_group.add_argument(
+        "--queue-depth",
+        type=int,
+        default=2,
+        help="Maximum number of extracted models waiting to be rendered with "
+             "--pipeline (default: 2)"
+    )
+    perf_group.add_argument(
+        "-j", "--jobs",
+        type=int,
+        help="Number of worker threads rendering pages (default: CPU count)"
+    )
+    perf_group.add_argument(
+        "--max-pending-pages",
+        type=int,
+        default=64,
+        help="Maximum number of rendered pages held in memory before "
+             "writing (default: 64)"
+    )
+    perf_group.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Reuse rendered page fragments across runs from this directory "
+             "(default: disabled)"
+    )
+    
+    # Resource limits
+    limit_group = parser.add_argument_group("Resource Limits")
+    limit_group.add_argument(
+        "--max-rss-mb",
+        type=float,
+        metavar="MB",
+        help="Kill a model's extraction, including any engine server it "
+             "started, when it uses more memory than this; it is retried once "
+             "after the batch, then recorded as failed (default: no limit)"
+    )
+    limit_group.add_argument(
+        "--model-timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Kill a model's extraction after this many seconds, with the "
+             "same retry as --max-rss-mb (default: no limit)"
+    )
+    
+    # CI sharding
+    shard_group = parser.add_argument_group("CI Sharding")
+    shard_group.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Document only shard I of N (e.g. 2/4). Models are packed onto "
+             "shards by cost, the same way on every runner; the models index "
+             "is left to --merge-index"
+    )
+    shard_group.add_argument(
+        "--timings",
+        metavar="REPORT",
+        action="append",
+        help="Balance shards by the per-model times in a previous --report; "
+             "repeat to combine the reports of all shards (default: by file size)"
+    )
+    shard_group.add_argument(
+        "--merge-index",
+        action="store_true",
+        help="Only rebuild README.md in the output directory from the model "
+             "folders it contains (run after collecting all shards)"
+    )
+    
+    # Multi-node work queue
+    queue_group = parser.add_argument_group("Work Queue")
+    queue_group.add_argument(
+        "--enqueue",
+        metavar="QUEUE_DIR",
+        help="Add the sources to a work queue directory on a shared volume "
+             "and exit, instead of documenting them"
+    )
+    queue_group.add_argument(
+        "--worker",
+        metavar="QUEUE_DIR",
+        help="Document models claimed from a work queue until it is drained; "
+             "run on any number of nodes at once (--workers per node)"
+    )
+    queue_group.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=120,
+        help="Claims not renewed for this long are returned to the queue, "
+             "so work of a crashed node is picked up (default: 120)"
+    )
+    queue_group.add_argument(
+        "--lock-dir",
+        metavar="DIR",
+        help="Directory for the locks that coordinate runs writing into one "
+             "output directory. Must be on a volume all writers share "
+             "(default: QUEUE_DIR/locks with --worker, else under the system "
+             "temp directory, which only coordinates runs on one host)"
+    )
+    
+    # Long-running service
+    service_group = parser.add_argument_group("Service")
+    service_group.add_argument(
+        "--serve",
+        metavar="ADDRESS",
+        help="Run a local documentation service on HOST:PORT, PORT or a Unix "
+             "socket path instead of documenting sources. Engines stay warm "
+             "between requests and up to --workers models are documented at once"
+    )
+    
+    # Output
+    parser.add_argument(
+        "--formats",
+        default="markdown",
+        help="Comma-separated output formats: markdown, html, json "
+             "(default: markdown)"
+    )
+    parser.add_argument(
+        "--pages",
+        metavar="PAGES",
+        help="Comma-separated pages to write: home, tables, measures, "
+             "relationships, data_sources (default: all). Only the metadata "
+             "they need is extracted"
+    )
+    parser.add_argument(
+        "--measures-page-limit",
+        type=int,
+        default=1000,
+        metavar="COUNT",
+        help="Split measures into per-table/display-folder pages once "
+             "Measures.md would hold more than COUNT measures (default: 1000)"
+    )
+    parser.add_argument(
+        "--measures-page-bytes",
+        type=int,
+        default=400_000,
+        metavar="BYTES",
+        help="Same as --measures-page-limit, for the estimated page size "
+             "(default: 400000)"
+    )
+    parser.add_argument(
+        "--diagram-max-tables",
+        type=int,
+        default=60,
+        metavar="COUNT",
+        help="Summarize ER diagrams of connected areas larger than COUNT "
+             "tables (default: 60)"
+    )
+    parser.add_argument(
+        "--diagram-max-chars",
+        type=int,
+        default=40_000,
+        metavar="CHARS",
+        help="Summarize ER diagrams whose Mermaid source exceeds CHARS "
+             "characters (default: 40000)"
+    )
+    parser.add_argument(
+        "--neighborhood-hops",
+        type=int,
+        default=1,
+        metavar="K",
+        help="Show tables within K relationships in each table page's diagram "
+             "(default: 1, 0 disables)"
+    )
+    parser.add_argument(
+        "--er-svg",
+        action="store_true",
+        help="Lay out the relationship graph at build time and write a static "
+             "Relationships.svg (no Node.js or Mermaid CLI needed)"
+    )
+    parser.add_argument(
+        "--keep-auto-date-pages",
+        action="store_true",
+        help="Write one page per auto date/time table instead of one shared "
+             "page per identical definition"
+    )
+    parser.add_argument(
+        "--share-definitions",
+        action="store_true",
+        help="Document tables with a lineage tag once under _shared/ and link "
+             "model table pages there (identical copies across models share a page)"
+    )
+    
     # Logging
     parser.add_argument(
         "--verbose", "-v",
@@ -86,33 +321,181 @@ def main():
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
+    if args.merge_index:
+        sink = create_sink(args.output, lock_dir=args.lock_dir)
+        if not isinstance(sink, DirectorySink):
+            parser.error("--merge-index needs an output directory")
+        with WikiGenerator(sink=sink) as generator:
+            generator.write_models_index()
+        return
+    
     # Handle convenience flags
     if args.pbip:
         args.engine = "mcp"
-        args.source = args.pbip
+        args.source = [args.pbip]
     elif args.desktop:
         args.engine = "mcp"
-        args.source = args.desktop
-    elif not args.source:
-        parser.error("source is required (or use --pbip/--desktop)")
+        args.source = [args.desktop]
+    elif args.serve:
+        if args.source or args.manifest or args.worker or args.enqueue:
+            parser.error("--serve takes no sources")
+        try:
+            parse_address(args.serve)
+        except ValueError as e:
+            parser.error(str(e))
+    elif not args.source and not args.manifest and not args.worker:
+        parser.error("source is required (or use --manifest/--pbip/--desktop/--worker/--serve)")
+    if args.enqueue and args.worker:
+        parser.error("--enqueue and --worker are exclusive")
+    if args.worker and (args.source or args.manifest):
+        parser.error("--worker takes its sources from the queue; use --enqueue to add sources")
     
     # Build engine kwargs
-    engine_kwargs = {}
-    if args.engine == "mcp":
-        engine_kwargs = {
-            "server_path": args.mcp_server,
-            "mode": args.mcp_mode,
-            "timeout": args.mcp_timeout,
-            "max_retries": args.mcp_retries,
-        }
-    
-    generator = WikiGenerator(args.output)
-    asyncio.run(generator.generate(
-        args.source,
-        model_name=args.name,
-        engine_type=args.engine,
-        engine_kwargs=engine_kwargs
-    ))
+    mcp_kwargs = {
+        "server_path": args.mcp_server,
+        "mode": args.mcp_mode,
+        "timeout": args.mcp_timeout,
+        "max_retries": args.mcp_retries,
+    }
+    engine_kwargs = mcp_kwargs if args.engine == "mcp" else {}
+    
+    jobs: list[BatchJob] = expand_sources(args.source, args.engine, engine_kwargs)
+    if args.manifest:
+        try:
+            jobs += load_manifest(args.manifest, args.engine, {"mcp": mcp_kwargs})
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    if args.name:
+        if len(jobs) != 1:
+            parser.error("--name requires exactly one source")
+        jobs[0].name = args.name
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.render_workers < 1:
+        parser.error("--render-workers must be at least 1")
+    if args.queue_depth < 1:
+        parser.error("--queue-depth must be at least 1")
+    
+    if args.shard:
+        try:
+            index, count = parse_shard(args.shard)
+            timings = None
+            if args.timings:
+                timings = {}
+                for report in args.timings:
+                    timings.update(load_timings(report))
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        total = len(jobs)
+        jobs = shard_jobs(jobs, index, count, timings)
+        logging.getLogger(__name__).info(
+            f"Shard {index}/{count}: {len(jobs)} of {total} models"
+        )
+        if not jobs:
+            return
+    elif args.timings:
+        parser.error("--timings requires --shard")
+    if args.lease_seconds <= 0:
+        parser.error("--lease-seconds must be positive")
+    
+    if args.enqueue:
+        added = enqueue(args.enqueue, jobs)
+        logging.getLogger(__name__).info(
+            f"Queued {added} of {len(jobs)} models in {args.enqueue}"
+        )
+        return
+    
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.max_pending_pages < 1:
+        parser.error("--max-pending-pages must be at least 1")
+    
+    governor = None
+    if args.max_rss_mb is not None or args.model_timeout is not None:
+        if args.pipeline or args.worker or args.serve:
+            parser.error("--max-rss-mb and --model-timeout cannot be combined with --pipeline, --worker or --serve")
+        try:
+            governor = ResourceGovernor(args.max_rss_mb, args.model_timeout)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    unknown = sorted(set(formats) - set(EMITTERS))
+    if unknown or not formats:
+        parser.error(
+            f"invalid --formats {args.formats!r}; choose from {', '.join(EMITTERS)}"
+        )
+    
+    pages = None
+    if args.pages is not None:
+        pages = [p.strip() for p in args.pages.split(",") if p.strip()]
+        unknown = sorted(set(pages) - set(PAGES))
+        if unknown or not pages:
+            parser.error(f"invalid --pages {args.pages!r}; choose from {', '.join(PAGES)}")
+    
+    lock_dir = args.lock_dir
+    if lock_dir is None and args.worker:
+        # The queue is on a volume every worker shares
+        lock_dir = Path(args.worker) / "locks"
+    
+    with WikiGenerator(
+        sink=create_sink(args.output, lock_dir=lock_dir),
+        jobs=args.jobs,
+        max_pending_pages=args.max_pending_pages,
+        cache=RenderCache(args.cache_dir) if args.cache_dir else None,
+        formats=formats,
+        max_measures_per_page=args.measures_page_limit,
+        max_measures_page_bytes=args.measures_page_bytes,
+        max_diagram_tables=args.diagram_max_tables,
+        max_diagram_chars=args.diagram_max_chars,
+        neighborhood_hops=args.neighborhood_hops,
+        er_svg=args.er_svg,
+        dedupe_auto_date_tables=not args.keep_auto_date_pages,
+        share_definitions=args.share_definitions,
+        write_index=not args.shard,
+        pages=pages
+    ) as generator:
+        if args.serve:
+            service = DocumentationService(
+                generator,
+                concurrency=args.workers,
+                engine_options={"mcp": mcp_kwargs}
+            )
+            try:
+                asyncio.run(serve_forever(service, args.serve))
+            except KeyboardInterrupt:
+                pass
+            return
+        if not args.worker:
+            try:
+                check_folders(generator, jobs)
+            except ValueError as e:
+                parser.error(str(e))
+        if args.worker:
+            batch = run_worker(
+                generator,
+                args.worker,
+                workers=args.workers,
+                lease_seconds=args.lease_seconds
+            )
+        elif args.pipeline:
+            batch = run_pipeline(
+                generator,
+                jobs,
+                extractors=args.workers,
+                renderers=args.render_workers,
+                queue_depth=args.queue_depth
+            )
+        else:
+            batch = run_batch(generator, jobs, workers=args.workers, governor=governor)
+        results = asyncio.run(batch)
+    
+    if args.report:
+        write_report(results, args.report)
+    if len(results) > 1:
+        logging.getLogger(__name__).info(summarize(results))
+    if not all(r.ok for r in results):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1 +1,3 @@
 """Power BI Auto-Documentation Pipeline"""
+
+__version__ = "0.3.1"
@@ -0,0 +1,46 @@
+"""Batch documentation of many Power BI models in one process.
+
+Sources come from command-line arguments, glob patterns or a JSON manifest
+with per-model engine and options. Jobs are scheduled longest-first on a
+pool of workers sharing one WikiGenerator, or pipelined so extraction of
+one model overlaps rendering of another. Large batches can be split into
+cost-balanced shards for parallel CI runners, or spread over several nodes
+through a work queue on a shared volume. A resource governor can run each
+extraction in its own process under memory and time limits.
+"""
+
+from .governor import ResourceGovernor, ResourceLimitExceeded
+from .jobs import BatchJob, expand_sources, load_manifest, schedule
+from .runner import (
+    BatchResult,
+    check_folders,
+    run_batch,
+    run_pipeline,
+    summarize,
+    write_report,
+)
+from .shards import assign_shards, load_timings, parse_shard, shard_jobs
+from .workqueue import enqueue, queue_status, reclaim_expired, run_worker
+
+__all__ = [
+    "BatchJob",
+    "BatchResult",
+    "check_folders",
+    "expand_sources",
+    "load_manifest",
+    "schedule",
+    "ResourceGovernor",
+    "ResourceLimitExceeded",
+    "run_batch",
+    "run_pipeline",
+    "summarize",
+    "write_report",
+    "assign_shards",
+    "load_timings",
+    "parse_shard",
+    "shard_jobs",
+    "enqueue",
+    "queue_status",
+    "reclaim_expired",
+    "run_worker",
+]
@@ -0,0 +1,164 @@
+# src/batch/governor.py
+"""Per-model resource limits for batch extraction.
+
+A pathological model can drive an engine server to many GB of memory or
+hang it. ``ResourceGovernor`` runs each model's extraction in its own
+process session (the extraction process plus any engine servers it starts),
+samples the session's total RSS and enforces a wall-clock timeout. On a
+breach the whole session is killed, so no server outlives its model.
+"""
+
+import asyncio
+import logging
+import os
+import pickle
+import signal
+import sys
+from pathlib import Path
+
+from ..engines import ModelMetadata, get_engine_class
+from .jobs import BatchJob
+
+
+logger = logging.getLogger(__name__)
+
+# Root of the ``src`` package, for the extraction subprocess
+_PACKAGE_ROOT = str(Path(__file__).resolve().parents[2])
+
+
+class ResourceLimitExceeded(RuntimeError):
+    """Raised when an extraction exceeded its memory or time limit."""
+
+
+class ResourceGovernor:
+    """Runs extractions in isolated processes under memory and time limits.
+    
+    Memory is measured by summing the RSS of every process in the
+    extraction's session, read from ``/proc``; where that is unavailable
+    only the timeout is enforced.
+    
+    Attributes:
+        max_rss_mb: Memory ceiling per model in MB (None for no limit)
+        timeout: Wall-clock limit per model in seconds (None for no limit)
+        poll_seconds: Interval between memory samples
+    """
+    
+    def __init__(
+        self,
+        max_rss_mb: float | None = None,
+        timeout: float | None = None,
+        poll_seconds: float = 0.25
+    ):
+        if max_rss_mb is not None and max_rss_mb <= 0:
+            raise ValueError(f"max_rss_mb must be positive, got {max_rss_mb}")
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        self.max_rss_mb = max_rss_mb
+        self.timeout = timeout
+        self.poll_seconds = poll_seconds
+        if max_rss_mb is not None and not os.path.isdir("/proc"):
+            logger.warning("Memory limits need /proc; only the timeout is enforced")
+    
+    async def extract(
+        self,
+        job: BatchJob,
+        include: frozenset[str] | None = None
+    ) -> ModelMetadata:
+        """Extract a job's metadata in a separate process.
+        
+        Args:
+            job: Model to extract
+            include: Metadata parts to extract (None for all)
+        
+        Raises:
+            ResourceLimitExceeded: If the extraction used too much memory,
+                took too long or was killed by a signal (e.g. the OOM killer)
+            RuntimeError: If the engine failed
+        """
+        payload = pickle.dumps(sys.path) + pickle.dumps((
+            job.engine,
+            get_engine_class(job.engine),
+            dict(job.engine_kwargs),
+            job.source,
+            include,
+            logging.getLogger().getEffectiveLevel(),
+        ))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (_PACKAGE_ROOT, env.get("PYTHONPATH")) if p
+        )
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "src.batch.isolated",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=env,
+            start_new_session=True,
+        )
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout if self.timeout is not None else None
+        communicate = asyncio.ensure_future(proc.communicate(payload))
+        breach = None
+        try:
+            while breach is None:
+                done, _ = await asyncio.wait({communicate}, timeout=self.poll_seconds)
+                if done:
+                    break
+                if deadline is not None and loop.time() >= deadline:
+                    breach = f"timed out after {self.timeout:g}s"
+                elif self.max_rss_mb is not None:
+                    rss_mb = session_rss(proc.pid) / 2**20
+                    if rss_mb > self.max_rss_mb:
+                        breach = f"used {rss_mb:.0f} MB (limit {self.max_rss_mb:g} MB)"
+        finally:
+            # Also reaps engine servers left behind by a finished extraction
+            _kill_session(proc)
+            if not communicate.done():
+                await asyncio.shield(communicate)
+        
+        if breach is not None:
+            raise ResourceLimitExceeded(f"Extraction of {job.source} {breach}")
+        stdout, _ = communicate.result()
+        if proc.returncode is not None and proc.returncode < 0:
+            raise ResourceLimitExceeded(
+                f"Extraction of {job.source} was killed by signal {-proc.returncode}"
+            )
+        if proc.returncode != 0 or not stdout:
+            raise RuntimeError(f"Extraction process exited with code {proc.returncode}")
+        
+        status, value = pickle.loads(stdout)
+        if status != "ok":
+            raise RuntimeError(value)
+        return value
+
+
+def session_rss(session_id: int) -> int:
+    """Total resident memory in bytes of all processes in a session."""
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    try:
+        pids = [name for name in os.listdir("/proc") if name.isdigit()]
+    except FileNotFoundError:
+        return 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue  # Exited meanwhile
+        # Fields after the parenthesized command name, which may contain spaces
+        fields = stat[stat.rfind(b")") + 2:].split()
+        if int(fields[3]) == session_id:
+            total += int(fields[21]) * page_size
+    return total
+
+
+def _kill_session(proc: asyncio.subprocess.Process) -> None:
+    """Kill the extraction process and everything it started."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    elif proc.returncode is None:
+        proc.kill()
@@ -0,0 +1,60 @@
+# src/batch/isolated.py
+"""Extraction subprocess started by ``ResourceGovernor``.
+
+Reads the parent's ``sys.path`` and then a pickled ``(engine_type,
+engine_class, engine_kwargs, source, include, log_level)`` tuple from stdin, extracts
+the model and writes a pickled ``("ok", ModelMetadata)`` or
+``("error", message)`` to stdout. Anything the engine prints goes to
+stderr, so it cannot corrupt the result.
+"""
+
+import asyncio
+import logging
+import os
+import pickle
+import sys
+
+from ..engines import get_engine, list_engines, register_engine
+from ..engines.base import ModelMetadata
+
+
+async def _extract(
+    engine_type: str,
+    engine_kwargs: dict,
+    source: str,
+    include: frozenset[str] | None
+) -> ModelMetadata:
+    async with get_engine(engine_type, **engine_kwargs) as engine:
+        await engine.load_model(source)
+        if include is None:
+            return await engine.extract_metadata()
+        return await engine.extract_metadata(include=include)
+
+
+def main() -> None:
+    # Keep the real stdout for the result and send stray output to stderr
+    result = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    
+    # Engine classes are unpickled by module name, as the parent imported them
+    sys.path[:0] = [p for p in pickle.load(sys.stdin.buffer) if p not in sys.path]
+    engine_type, engine_class, engine_kwargs, source, include, log_level = (
+        pickle.load(sys.stdin.buffer)
+    )
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    if engine_type not in list_engines():
+        register_engine(engine_type, engine_class)
+    try:
+        payload = ("ok", asyncio.run(_extract(engine_type, engine_kwargs, source, include)))
+    except Exception as e:
+        payload = ("error", str(e) or type(e).__name__)
+    
+    with result:
+        pickle.dump(payload, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# src/batch/jobs.py
+"""Batch job definitions, source expansion and scheduling."""
+
+import glob
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class BatchJob:
+    """One model to document.
+    
+    Attributes:
+        source: Model source (PBIX file, PBIP folder, connection string)
+        name: Display name (derived from the source if not set)
+        engine: Documentation engine ("pbixray" or "mcp")
+        engine_kwargs: Engine-specific options
+    """
+    source: str
+    name: str | None = None
+    engine: str = "pbixray"
+    engine_kwargs: dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def cost(self) -> int:
+        """Estimated work: size in bytes of the file or folder (0 if unknown)."""
+        path = Path(self.source)
+        try:
+            if path.is_file():
+                return path.stat().st_size
+            if path.is_dir():
+                return sum(
+                    os.path.getsize(os.path.join(root, f))
+                    for root, _, files in os.walk(path)
+                    for f in files
+                )
+        except OSError:
+            pass
+        return 0
+
+
+def expand_sources(
+    patterns: list[str],
+    engine: str = "pbixray",
+    engine_kwargs: dict[str, Any] | None = None
+) -> list[BatchJob]:
+    """Expand sources and glob patterns into jobs.
+    
+    Patterns without matches are kept as literal sources (connection strings,
+    or missing files that should be reported as failures).
+    
+    Args:
+        patterns: Sources or glob patterns (``**`` matches recursively)
+        engine: Engine for every job
+        engine_kwargs: Engine options for every job
+    
+    Returns:
+        Jobs in argument order, without duplicates
+    """
+    sources: dict[str, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else []
+        for source in matches or [pattern]:
+            sources[source] = None
+    return [
+        BatchJob(source, engine=engine, engine_kwargs=dict(engine_kwargs or {}))
+        for source in sources
+    ]
+
+
+def load_manifest(
+    path: str | Path,
+    engine: str = "pbixray",
+    engine_kwargs: dict[str, dict[str, Any]] | None = None
+) -> list[BatchJob]:
+    """Load jobs from a JSON manifest.
+    
+    The manifest is either a list of entries or an object with ``models``
+    (the entries) and optional ``defaults``. Each entry is a source string or
+    an object with ``source`` and optional ``name``, ``engine`` and
+    ``options`` (engine keyword arguments)::
+        
+        {
+          "defaults": {"engine": "pbixray"},
+          "models": [
+            "models/*.pbix",
+            {"source": "models/Sales.SemanticModel", "engine": "mcp",
+             "options": {"timeout": 120}}
+          ]
+        }
+    
+    Relative sources are resolved against the manifest's folder, and sources
+    may be glob patterns. ``name`` is ignored for patterns matching several
+    models.
+    
+    Args:
+        path: Manifest file
+        engine: Engine for entries that don't name one
+        engine_kwargs: Base options per engine, overridden by entry options
+    
+    Returns:
+        Jobs in manifest order
+    
+    Raises:
+        ValueError: If the manifest is malformed
+    """
+    path = Path(path)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid manifest {path}: {e}")
+    
+    if isinstance(data, list):
+        data = {"models": data}
+    if not isinstance(data, dict) or not isinstance(data.get("models"), list):
+        raise ValueError(f"Invalid manifest {path}: expected a list of models")
+    
+    defaults = data.get("defaults") or {}
+    engine_kwargs = engine_kwargs or {}
+    jobs = []
+    for entry in data["models"]:
+        if isinstance(entry, str):
+            entry = {"source": entry}
+        if not isinstance(entry, dict) or not entry.get("source"):
+            raise ValueError(f"Invalid manifest {path}: entry without source: {entry!r}")
+        
+        entry_engine = entry.get("engine") or defaults.get("engine") or engine
+        options = {
+            **engine_kwargs.get(entry_engine, {}),
+            **(defaults.get("options") or {}),
+            **(entry.get("options") or {}),
+        }
+        source = entry["source"]
+        if not os.path.isabs(source) and "://" not in source and not source.startswith("localhost:"):
+            source = str(path.parent / source)
+        
+        expanded = expand_sources([source], entry_engine, options)
+        if len(expanded) == 1:
+            expanded[0].name = entry.get("name")
+        jobs.extend(expanded)
+    return jobs
+
+
+def schedule(jobs: list[BatchJob]) -> list[BatchJob]:
+    """Order jobs longest-first by estimated cost.
+    
+    Starting the biggest models first keeps one large model from becoming
+    the tail of the batch (longest-processing-time-first scheduling).
+    Equal costs keep their input order.
+    """
+    return sorted(jobs, key=lambda job: job.cost, reverse=True)
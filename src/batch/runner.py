@@ -0,0 +1,292 @@
+# src/batch/runner.py
+"""Run batch jobs on a pool of workers sharing one WikiGenerator.
+
+``run_batch`` processes each model start to finish. ``run_pipeline`` splits
+the work into extraction (I/O-bound, waiting on engines) and rendering
+(CPU-bound), connected by a bounded queue, so one model renders while the
+next is being extracted.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..generators.wiki_generator import WikiGenerator
+from ..engines import ModelMetadata
+from .governor import ResourceGovernor, ResourceLimitExceeded
+from .jobs import BatchJob, schedule
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch job.
+    
+    Attributes:
+        job: The job
+        ok: Whether documentation was generated
+        seconds: Time spent extracting and rendering the model, excluding
+                 time spent waiting for a free extractor or renderer
+        error: Error message if the job failed
+        superseded: Whether another node took the job over (work queue runs
+                    only) because this node's lease on it expired, so the
+                    result was not recorded in the queue
+    """
+    job: BatchJob
+    ok: bool
+    seconds: float
+    error: str | None = None
+    superseded: bool = False
+
+
+def check_folders(generator: WikiGenerator, jobs: list[BatchJob]) -> None:
+    """Reject jobs that would be documented into the same model folder.
+    
+    Two sources with the same file name (e.g. ``a/Sales.pbix`` and
+    ``b/Sales.pbix``) map to one folder; documenting both would overwrite
+    one with the other.
+    
+    Raises:
+        ValueError: If two jobs share a model folder
+    """
+    folders: dict[str, BatchJob] = {}
+    for job in jobs:
+        folder = generator.model_folder(
+            generator.resolve_model_name(job.source, job.name)
+        )
+        other = folders.setdefault(folder, job)
+        if other is not job:
+            raise ValueError(
+                f"{other.source} and {job.source} would both be documented in "
+                f"folder '{folder}'; give them distinct names in a manifest"
+            )
+
+
+async def run_batch(
+    generator: WikiGenerator,
+    jobs: list[BatchJob],
+    workers: int = 1,
+    governor: ResourceGovernor | None = None
+) -> list[BatchResult]:
+    """Document every job, ``workers`` models at a time.
+    
+    Jobs start longest-first (see ``schedule``). A failing job is logged and
+    recorded; the remaining jobs still run.
+    
+    With a ``governor``, each model is extracted in its own process under
+    the governor's memory and time limits. A model that exceeds them is
+    killed and set aside while the pool carries on; once the pool is done,
+    set-aside models are retried once, one at a time, so a retry does not
+    compete with other models for memory. A second breach fails the job.
+    
+    Args:
+        generator: Generator shared by all jobs
+        jobs: Models to document
+        workers: Number of models processed concurrently
+        governor: Resource limits for extraction (None to extract in-process)
+    
+    Returns:
+        One result per job, in input order
+    
+    Raises:
+        ValueError: If two jobs share a model folder (see ``check_folders``)
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    check_folders(generator, jobs)
+    
+    index = {id(job): i for i, job in enumerate(jobs)}
+    queue: asyncio.Queue[BatchJob] = asyncio.Queue()
+    for job in schedule(jobs):
+        queue.put_nowait(job)
+    results: dict[int, BatchResult] = {}
+    retries: list[BatchJob] = []
+    
+    async def document(job: BatchJob, retry: bool = False) -> None:
+        start = time.perf_counter()
+        try:
+            if governor is None:
+                await generator.generate(
+                    job.source,
+                    model_name=job.name,
+                    engine_type=job.engine,
+                    engine_kwargs=dict(job.engine_kwargs)
+                )
+            else:
+                metadata = await governor.extract(job, generator.metadata_parts())
+                await generator.render(
+                    metadata, generator.resolve_model_name(job.source, job.name)
+                )
+            result = BatchResult(job, True, time.perf_counter() - start)
+        except ResourceLimitExceeded as e:
+            if not retry:
+                logger.warning(f"{e}; retrying after the batch")
+                retries.append(job)
+                return
+            logger.error(f"Failed to document {job.source}: {e}")
+            result = BatchResult(job, False, time.perf_counter() - start, str(e))
+        except Exception as e:
+            logger.error(f"Failed to document {job.source}: {e}")
+            result = BatchResult(job, False, time.perf_counter() - start, str(e))
+        results[index[id(job)]] = result
+    
+    async def worker() -> None:
+        while not queue.empty():
+            await document(queue.get_nowait())
+    
+    await asyncio.gather(*(worker() for _ in range(min(workers, len(jobs)))))
+    for job in retries:
+        await document(job, retry=True)
+    return [results[i] for i in range(len(jobs))]
+
+
+async def run_pipeline(
+    generator: WikiGenerator,
+    jobs: list[BatchJob],
+    extractors: int = 2,
+    renderers: int = 1,
+    queue_depth: int = 2
+) -> list[BatchResult]:
+    """Document every job with overlapping extraction and rendering.
+    
+    Extractor tasks load models longest-first and put the metadata on a
+    queue; render tasks take it off and write the pages. Extractors wait
+    while the queue is full, so at most ``extractors + queue_depth +
+    renderers`` models are held in memory at once. With enough extractors
+    the wall time approaches the larger of total extraction and total
+    rendering time rather than their sum.
+    
+    Args:
+        generator: Generator shared by all jobs
+        jobs: Models to document
+        extractors: Number of models extracted concurrently
+        renderers: Number of models rendered concurrently
+        queue_depth: Maximum number of extracted models waiting to render
+    
+    Returns:
+        One result per job, in input order
+    
+    Raises:
+        ValueError: If two jobs share a model folder (see ``check_folders``)
+    """
+    for label, value in (
+        ("extractors", extractors),
+        ("renderers", renderers),
+        ("queue_depth", queue_depth),
+    ):
+        if value < 1:
+            raise ValueError(f"{label} must be at least 1, got {value}")
+    check_folders(generator, jobs)
+    
+    index = {id(job): i for i, job in enumerate(jobs)}
+    pending: asyncio.Queue[BatchJob] = asyncio.Queue()
+    for job in schedule(jobs):
+        pending.put_nowait(job)
+    # Jobs carry their extraction time, so time spent queued is not counted.
+    # None tells a render task that extraction is finished.
+    extracted: asyncio.Queue[tuple[BatchJob, ModelMetadata, float] | None] = (
+        asyncio.Queue(maxsize=queue_depth)
+    )
+    results: dict[int, BatchResult] = {}
+    
+    def fail(job: BatchJob, seconds: float, e: Exception) -> None:
+        logger.error(f"Failed to document {job.source}: {e}")
+        results[index[id(job)]] = BatchResult(job, False, seconds, str(e))
+    
+    async def extract() -> None:
+        while not pending.empty():
+            job = pending.get_nowait()
+            start = time.perf_counter()
+            try:
+                metadata = await generator.extract(
+                    job.source,
+                    engine_type=job.engine,
+                    engine_kwargs=dict(job.engine_kwargs)
+                )
+            except Exception as e:
+                fail(job, time.perf_counter() - start, e)
+                continue
+            await extracted.put((job, metadata, time.perf_counter() - start))
+    
+    async def render() -> None:
+        while (item := await extracted.get()) is not None:
+            job, metadata, extract_seconds = item
+            start = time.perf_counter()
+            try:
+                await generator.render(
+                    metadata, generator.resolve_model_name(job.source, job.name)
+                )
+                results[index[id(job)]] = BatchResult(
+                    job, True, extract_seconds + time.perf_counter() - start
+                )
+            except Exception as e:
+                fail(job, extract_seconds + time.perf_counter() - start, e)
+            # Drop the reference before waiting for the next model
+            del item, metadata
+    
+    async def extract_all() -> None:
+        await asyncio.gather(*(extract() for _ in range(min(extractors, len(jobs)))))
+        for _ in range(renderers):
+            await extracted.put(None)
+    
+    tasks = [
+        asyncio.ensure_future(extract_all()),
+        *(asyncio.ensure_future(render()) for _ in range(renderers)),
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # If a task died (or the run was cancelled), the others would block on
+        # the queue forever
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return [results[i] for i in range(len(jobs))]
+
+
+def summarize(results: list[BatchResult]) -> str:
+    """Format a per-model summary of a batch run."""
+    superseded = sum(1 for r in results if r.superseded)
+    failed = sum(1 for r in results if not r.ok and not r.superseded)
+    summary = f"Batch summary: {len(results) - failed - superseded} succeeded, {failed} failed"
+    if superseded:
+        summary += f", {superseded} taken over by other nodes"
+    lines = [summary]
+    for r in results:
+        label = r.job.name or r.job.source
+        if r.superseded:
+            lines.append(f"  ↻ {label} ({r.seconds:.1f}s): lease expired, left to another node")
+        elif r.ok:
+            lines.append(f"  ✓ {label} ({r.seconds:.1f}s)")
+        else:
+            lines.append(f"  ✗ {label} ({r.seconds:.1f}s): {r.error}")
+    return "\n".join(lines)
+
+
+def write_report(results: list[BatchResult], path: str | Path) -> None:
+    """Write per-model results as JSON.
+    
+    A later run can pass the report to ``load_timings`` to balance shards
+    by measured time instead of file size.
+    """
+    report = {
+        "models": [
+            {
+                "source": r.job.source,
+                "name": r.job.name,
+                "engine": r.job.engine,
+                "ok": r.ok,
+                "seconds": round(r.seconds, 3),
+                "error": r.error,
+            }
+            for r in results
+        ]
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
@@ -0,0 +1,123 @@
+# src/batch/shards.py
+"""Deterministic splitting of a batch across parallel runners.
+
+Every runner expands the same sources and computes the same assignment, so
+no coordination is needed: runner ``i`` of ``N`` documents only its share.
+Models are packed longest-first onto the least-loaded shard, using per-model
+timings from a previous run's report where available and file size otherwise.
+"""
+
+import json
+from pathlib import Path
+
+from .jobs import BatchJob
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse a shard specification such as ``"2/4"``.
+    
+    Returns:
+        Tuple of (shard number starting at 1, shard count)
+    
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {spec!r}: expected i/N, e.g. 1/4")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard {spec!r}: need 1 <= i <= N")
+    return index, count
+
+
+def load_timings(path: str | Path) -> dict[str, float]:
+    """Read per-model wall times from a batch report (see ``write_report``).
+    
+    Failed models are included; their time still indicates their cost.
+    
+    Returns:
+        Source to seconds
+    
+    Raises:
+        ValueError: If the report is malformed
+    """
+    path = Path(path)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return {
+            entry["source"]: float(entry["seconds"])
+            for entry in data["models"]
+        }
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid report {path}: {e}")
+
+
+def estimate_costs(
+    jobs: list[BatchJob],
+    timings: dict[str, float] | None = None
+) -> list[float]:
+    """Estimate each job's cost in seconds, or in bytes without timings.
+    
+    Jobs missing from ``timings`` are converted from size to seconds with
+    the overall seconds-per-byte rate of the timed jobs; jobs without a size
+    either get the average timing.
+    """
+    sizes = [job.cost for job in jobs]
+    if not timings:
+        return [float(size) for size in sizes]
+    
+    timed = [(timings[job.source], size) for job, size in zip(jobs, sizes) if job.source in timings]
+    if not timed:
+        return [float(size) for size in sizes]
+    
+    timed_bytes = sum(size for _, size in timed)
+    rate = sum(seconds for seconds, _ in timed) / timed_bytes if timed_bytes else 0.0
+    average = sum(seconds for seconds, _ in timed) / len(timed)
+    
+    costs = []
+    for job, size in zip(jobs, sizes):
+        if job.source in timings:
+            costs.append(timings[job.source])
+        elif size and rate:
+            costs.append(size * rate)
+        else:
+            costs.append(average)
+    return costs
+
+
+def assign_shards(
+    jobs: list[BatchJob],
+    count: int,
+    timings: dict[str, float] | None = None
+) -> list[list[BatchJob]]:
+    """Split jobs into ``count`` shards of about equal total cost.
+    
+    Longest-processing-time-first bin packing: jobs are taken in descending
+    cost and each goes to the shard with the lowest total so far. Ties are
+    broken by source, job count and shard number, so the result does not
+    depend on the order in which sources were listed.
+    
+    Returns:
+        Jobs per shard, each in descending cost
+    """
+    costs = estimate_costs(jobs, timings)
+    order = sorted(range(len(jobs)), key=lambda i: (-costs[i], jobs[i].source))
+    shards: list[list[BatchJob]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for i in order:
+        # Fewest jobs breaks ties, which spreads jobs of unknown (zero) cost
+        target = min(range(count), key=lambda s: (loads[s], len(shards[s]), s))
+        shards[target].append(jobs[i])
+        loads[target] += costs[i]
+    return shards
+
+
+def shard_jobs(
+    jobs: list[BatchJob],
+    index: int,
+    count: int,
+    timings: dict[str, float] | None = None
+) -> list[BatchJob]:
+    """Select the jobs of shard ``index`` (starting at 1) of ``count``."""
+    return assign_shards(jobs, count, timings)[index - 1]
@@ -0,0 +1,383 @@
+# src/batch/workqueue.py
+"""Filesystem work queue for documentation runs spread over several nodes.
+
+Nodes that share a volume (e.g. NFS) coordinate through a queue directory,
+without a broker or central coordinator::
+    
+    queue/
+      pending/   jobs waiting to be claimed
+      claimed/   jobs being documented, each with a ``.lease`` file
+      done/      result records of documented models
+      failed/    result records of models that failed
+
+A node claims a job by renaming it from ``pending/`` to ``claimed/``; the
+rename succeeds for exactly one node. While documenting, the node touches
+the job's lease file every few seconds. A claimed job whose lease has not
+been touched for ``lease_seconds`` belongs to a crashed node: any node moves
+it back to ``pending/`` with its attempt count raised, and after
+``max_attempts`` records it as failed.
+
+Job files are named ``<rank>-<key>.<attempt>.json``; ranks order the queue
+longest-first, and keys identify a source so it is enqueued only once.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..generators.wiki_generator import WikiGenerator
+from .jobs import BatchJob, schedule
+from .runner import BatchResult
+
+
+logger = logging.getLogger(__name__)
+
+STATES = ("pending", "claimed", "done", "failed")
+
+_JOB_FILE = re.compile(r"^(?P<rank>\d+)-(?P<key>[a-z0-9-]+)\.(?P<attempt>\d+)\.json$")
+
+
+@dataclass
+class QueuedJob:
+    """A job file in the queue.
+    
+    Attributes:
+        file_name: Name of the job file
+        rank: Position in the queue (lower runs first)
+        key: Identity of the source
+        attempt: Number of earlier claims whose lease expired
+    """
+    file_name: str
+    rank: int
+    key: str
+    attempt: int
+    
+    @classmethod
+    def parse(cls, file_name: str) -> "QueuedJob | None":
+        """Parse a job file name; returns None for other files."""
+        match = _JOB_FILE.match(file_name)
+        if match is None:
+            return None
+        return cls(file_name, int(match["rank"]), match["key"], int(match["attempt"]))
+    
+    def retry(self) -> "QueuedJob":
+        """The same job with the attempt count raised."""
+        return QueuedJob(
+            f"{self.rank:06d}-{self.key}.{self.attempt + 1}.json",
+            self.rank,
+            self.key,
+            self.attempt + 1,
+        )
+
+
+def job_key(source: str) -> str:
+    """Stable file-name-safe identity of a source."""
+    stem = re.sub(r"[^a-z0-9]+", "-", Path(source).stem.lower()).strip("-")[:40]
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:10]
+    return f"{stem}-{digest}" if stem else digest
+
+
+def init_queue(queue_dir: str | Path) -> Path:
+    """Create the queue folders if needed."""
+    queue_dir = Path(queue_dir)
+    for state in STATES:
+        (queue_dir / state).mkdir(parents=True, exist_ok=True)
+    return queue_dir
+
+
+def enqueue(queue_dir: str | Path, jobs: list[BatchJob]) -> int:
+    """Add jobs to the queue, largest first.
+    
+    Sources already pending, claimed or done are skipped, so enqueueing the
+    same estate twice does not duplicate work. Failed sources are queued
+    again.
+    
+    Returns:
+        Number of jobs added
+    """
+    queue_dir = init_queue(queue_dir)
+    known = {
+        entry.key
+        for state in ("pending", "claimed")
+        for entry in _list(queue_dir / state)
+    }
+    known.update(p.stem for p in (queue_dir / "done").glob("*.json"))
+    start = max((e.rank for e in _list(queue_dir / "pending")), default=-1) + 1
+    
+    added = 0
+    for job in schedule(jobs):
+        # Nodes may run from other working directories
+        source = os.path.abspath(job.source) if os.path.exists(job.source) else job.source
+        key = job_key(source)
+        if key in known:
+            continue
+        known.add(key)
+        (queue_dir / "failed" / f"{key}.json").unlink(missing_ok=True)
+        spec = {
+            "source": source,
+            "name": job.name,
+            "engine": job.engine,
+            "options": job.engine_kwargs,
+        }
+        _write_atomic(
+            queue_dir / "pending" / f"{start + added:06d}-{key}.0.json",
+            json.dumps(spec, indent=2)
+        )
+        added += 1
+    return added
+
+
+def reclaim_expired(
+    queue_dir: str | Path,
+    lease_seconds: float,
+    max_attempts: int = 3
+) -> int:
+    """Return jobs of crashed nodes to the queue.
+    
+    A claimed job is expired when neither its lease file nor, before the
+    first heartbeat, the job file was touched for ``lease_seconds``.
+    
+    Returns:
+        Number of jobs reclaimed or given up
+    """
+    queue_dir = Path(queue_dir)
+    now = time.time()
+    reclaimed = 0
+    for entry in _list(queue_dir / "claimed"):
+        claimed = queue_dir / "claimed" / entry.file_name
+        lease = claimed.with_name(claimed.name + ".lease")
+        try:
+            touched = max(
+                path.stat().st_mtime for path in (claimed, lease) if path.exists()
+            )
+        except (OSError, ValueError):
+            # Finished or reclaimed by another node meanwhile
+            continue
+        if now - touched < lease_seconds:
+            continue
+        
+        retry = entry.retry()
+        try:
+            if retry.attempt >= max_attempts:
+                # The rename decides which node records the failure
+                given_up = queue_dir / "failed" / f"{entry.key}.claim"
+                os.rename(claimed, given_up)
+                spec = json.loads(given_up.read_text(encoding="utf-8"))
+                _write_result(queue_dir, "failed", entry.key, {
+                    "source": spec["source"],
+                    "ok": False,
+                    "error": f"Lease expired {retry.attempt} times",
+                    "attempt": retry.attempt,
+                })
+                given_up.unlink()
+                logger.warning(f"Giving up on {spec['source']}: lease expired {retry.attempt} times")
+            else:
+                os.rename(claimed, queue_dir / "pending" / retry.file_name)
+                logger.warning(f"Reclaimed expired job {entry.key} (attempt {retry.attempt})")
+        except FileNotFoundError:
+            continue
+        lease.unlink(missing_ok=True)
+        reclaimed += 1
+    return reclaimed
+
+
+def claim_next(queue_dir: str | Path, node: str) -> tuple[QueuedJob, BatchJob] | None:
+    """Claim the first pending job.
+    
+    Returns:
+        The claimed job, or None if nothing is pending
+    """
+    queue_dir = Path(queue_dir)
+    for entry in sorted(_list(queue_dir / "pending"), key=lambda e: (e.rank, e.key)):
+        pending = queue_dir / "pending" / entry.file_name
+        claimed = queue_dir / "claimed" / entry.file_name
+        try:
+            # Marks the claim time for reclaim_expired until the first heartbeat
+            os.utime(pending)
+            os.rename(pending, claimed)
+        except FileNotFoundError:
+            continue  # Claimed by another node
+        _write_atomic(claimed.with_name(claimed.name + ".lease"), node)
+        spec = json.loads(claimed.read_text(encoding="utf-8"))
+        return entry, BatchJob(
+            spec["source"],
+            name=spec.get("name"),
+            engine=spec.get("engine", "pbixray"),
+            engine_kwargs=spec.get("options") or {},
+        )
+    return None
+
+
+def queue_status(queue_dir: str | Path) -> dict[str, int]:
+    """Count jobs per state."""
+    queue_dir = Path(queue_dir)
+    return {
+        "pending": len(_list(queue_dir / "pending")),
+        "claimed": len(_list(queue_dir / "claimed")),
+        "done": len(list((queue_dir / "done").glob("*.json"))),
+        "failed": len(list((queue_dir / "failed").glob("*.json"))),
+    }
+
+
+class _Heartbeat:
+    """Touches a lease file on a background thread.
+    
+    A thread keeps the lease alive even while rendering holds the event
+    loop. ``lost`` is set when the job was reclaimed by another node.
+    """
+    
+    def __init__(self, claimed: Path, interval: float):
+        self.claimed = claimed
+        self.lease = claimed.with_name(claimed.name + ".lease")
+        self.interval = interval
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def __enter__(self) -> "_Heartbeat":
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop.set()
+        self._thread.join()
+        self._beat()
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._beat()
+    
+    def _beat(self) -> None:
+        if not self.claimed.exists():
+            self.lost = True
+            return
+        try:
+            os.utime(self.lease)
+        except FileNotFoundError:
+            self.lost = True
+
+
+async def run_worker(
+    generator: WikiGenerator,
+    queue_dir: str | Path,
+    workers: int = 1,
+    node: str | None = None,
+    lease_seconds: float = 120,
+    poll_seconds: float = 5,
+    max_attempts: int = 3
+) -> list[BatchResult]:
+    """Document queued models until the queue is drained.
+    
+    Runs on any number of nodes at once. Each node claims ``workers`` jobs
+    at a time; when nothing is pending but other nodes still hold claims, it
+    keeps polling so work of a crashed node is picked up once its lease
+    expires.
+    
+    Args:
+        generator: Generator for this node's jobs
+        queue_dir: Queue directory on the shared volume
+        workers: Number of models documented concurrently on this node
+        node: Name written to leases and results (default: host:pid)
+        lease_seconds: Time without heartbeat after which a claim expires
+        poll_seconds: Wait between checks while other nodes hold claims
+        max_attempts: Expired claims before a job is recorded as failed
+    
+    Returns:
+        Results of the jobs this node documented, in completion order
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    queue_dir = init_queue(queue_dir)
+    node = node or f"{socket.gethostname()}:{os.getpid()}"
+    results: list[BatchResult] = []
+    
+    async def worker() -> None:
+        while True:
+            await asyncio.to_thread(reclaim_expired, queue_dir, lease_seconds, max_attempts)
+            claim = await asyncio.to_thread(claim_next, queue_dir, node)
+            if claim is None:
+                if not await asyncio.to_thread(_list, queue_dir / "claimed"):
+                    return
+                await asyncio.sleep(poll_seconds)
+                continue
+            
+            entry, job = claim
+            claimed = queue_dir / "claimed" / entry.file_name
+            start = time.perf_counter()
+            with _Heartbeat(claimed, max(lease_seconds / 4, 0.05)) as heartbeat:
+                try:
+                    await generator.generate(
+                        job.source,
+                        model_name=job.name,
+                        engine_type=job.engine,
+                        engine_kwargs=dict(job.engine_kwargs)
+                    )
+                    result = BatchResult(job, True, time.perf_counter() - start)
+                except Exception as e:
+                    logger.error(f"Failed to document {job.source}: {e}")
+                    result = BatchResult(job, False, time.perf_counter() - start, str(e))
+            
+            if heartbeat.lost:
+                logger.warning(f"Lease on {job.source} expired; leaving it to the node that reclaimed it")
+                result.superseded = True
+                results.append(result)
+                continue
+            try:
+                await asyncio.to_thread(_finish, queue_dir, entry, claimed, {
+                    "source": job.source,
+                    "name": job.name,
+                    "node": node,
+                    "ok": result.ok,
+                    "seconds": round(result.seconds, 3),
+                    "error": result.error,
+                    "attempt": entry.attempt,
+                })
+            except OSError as e:
+                # The claim stays behind; its lease expires and the job is retried
+                logger.error(f"Could not record the result of {job.source}: {e}")
+                result = BatchResult(
+                    job, False, result.seconds, f"Could not record result in queue: {e}"
+                )
+            results.append(result)
+    
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return results
+
+
+def _list(folder: Path) -> list[QueuedJob]:
+    """Job files in a queue folder."""
+    try:
+        names = os.listdir(folder)
+    except FileNotFoundError:
+        return []
+    return [entry for entry in map(QueuedJob.parse, names) if entry is not None]
+
+
+def _finish(queue_dir: Path, entry: QueuedJob, claimed: Path, record: dict) -> None:
+    """Record a claimed job's result and release the claim."""
+    _write_result(queue_dir, "done" if record["ok"] else "failed", entry.key, record)
+    claimed.unlink(missing_ok=True)
+    claimed.with_name(claimed.name + ".lease").unlink(missing_ok=True)
+
+
+def _write_result(queue_dir: Path, state: str, key: str, record: dict) -> None:
+    _write_atomic(queue_dir / state / f"{key}.json", json.dumps(record, indent=2))
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write a file via a uniquely named temporary file and a rename."""
+    tmp = path.with_name(f".{path.name}.{socket.gethostname()}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
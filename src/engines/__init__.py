@@ -4,13 +4,27 @@ This module provides a pluggable engine architecture to support multiple
 Power BI documentation backends (pbixray, Power BI Modeling MCP Server, etc.).
 """
 
-from .base import IDocumentationEngine, ModelMetadata
-from .registry import get_engine, register_engine, list_engines
+from .base import (
+    IDocumentationEngine,
+    MetadataChunk,
+    ModelMetadata,
+    METADATA_PARTS,
+    resolve_include,
+)
+from .registry import get_engine, get_engine_class, register_engine, list_engines
+from .pool import EnginePool
+from .lazy import LazyModelMetadata
 
 __all__ = [
     "IDocumentationEngine",
     "ModelMetadata",
+    "MetadataChunk",
+    "METADATA_PARTS",
+    "resolve_include",
     "get_engine",
+    "get_engine_class",
     "register_engine",
     "list_engines",
+    "EnginePool",
+    "LazyModelMetadata",
 ]
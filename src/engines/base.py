@@ -4,8 +4,41 @@ This module defines the abstract interface that all documentation engines must i
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterable
+
+
+# Parts of a model an ``include`` projection can select
+METADATA_PARTS = ("summary", "tables", "columns", "measures", "relationships", "power_query")
+
+
+def resolve_include(include: Iterable[str] | None) -> frozenset[str]:
+    """Validate an ``include`` projection and return the parts to extract.
+    
+    ``None`` selects every part. ``columns`` (table schemas) implies
+    ``tables``.
+    
+    Args:
+        include: Names from ``METADATA_PARTS``, or None
+        
+    Returns:
+        Parts to extract
+        
+    Raises:
+        ValueError: If a name is not a metadata part
+    """
+    if include is None:
+        return frozenset(METADATA_PARTS)
+    parts = frozenset(include)
+    unknown = parts.difference(METADATA_PARTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown metadata parts: {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(METADATA_PARTS)}"
+        )
+    if "columns" in parts:
+        parts |= {"tables"}
+    return parts
 
 
 @dataclass
@@ -19,6 +52,22 @@ class ModelMetadata:
     power_query: dict[str, str] | None = None
 
 
+@dataclass
+class MetadataChunk:
+    """Part of a model's metadata, yielded by ``iter_metadata``.
+    
+    Engines should yield the summary and all relationships before the first
+    table, and each table together with its measures, so consumers can
+    document tables while the rest of the model is still being fetched.
+    """
+    
+    summary: dict[str, Any] | None = None
+    tables: list[Any] = field(default_factory=list)
+    measures: list[Any] = field(default_factory=list)
+    relationships: list[Any] = field(default_factory=list)
+    power_query: dict[str, str] | None = None
+
+
 class IDocumentationEngine(ABC):
     """Abstract interface for Power BI documentation engines.
     
@@ -41,9 +90,16 @@ class IDocumentationEngine(ABC):
         pass
     
     @abstractmethod
-    async def extract_metadata(self) -> ModelMetadata:
+    async def extract_metadata(self, include: Iterable[str] | None = None) -> ModelMetadata:
         """Extract all metadata from the loaded model.
         
+        Engines should skip the calls and parsing needed only for parts
+        outside ``include``; those parts are left empty (``{}``, ``[]`` or
+        None).
+        
+        Args:
+            include: Parts to extract (see ``METADATA_PARTS``; None for all)
+        
         Returns:
             ModelMetadata: Container with all extracted metadata
             
@@ -52,6 +108,52 @@ class IDocumentationEngine(ABC):
         """
         pass
     
+    async def iter_metadata(self, include: Iterable[str] | None = None) -> AsyncIterator[MetadataChunk]:
+        """Extract metadata from the loaded model incrementally.
+        
+        The default implementation yields everything from ``extract_metadata``
+        as one chunk. Engines that fetch tables one at a time should override
+        it to yield each table as soon as it is fetched.
+        
+        Args:
+            include: Parts to extract (see ``METADATA_PARTS``; None for all)
+        
+        Yields:
+            MetadataChunk: Summary, relationships, then tables with their measures
+            
+        Raises:
+            RuntimeError: If no model is loaded or extraction fails
+        """
+        if include is None:
+            # Engines written before projections take no arguments
+            metadata = await self.extract_metadata()
+        else:
+            metadata = await self.extract_metadata(include=include)
+        yield MetadataChunk(
+            summary=metadata.summary,
+            tables=metadata.tables,
+            measures=metadata.measures,
+            relationships=metadata.relationships,
+            power_query=metadata.power_query,
+        )
+    
+    async def extract_table(self, table_name: str) -> MetadataChunk:
+        """Extract the columns and measures of one table.
+        
+        Lets ``LazyModelMetadata`` load tables on first access. Engines that
+        cannot fetch a single table do not need to implement it.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            MetadataChunk: The table with its columns, and its measures
+            
+        Raises:
+            NotImplementedError: If the engine only extracts whole models
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot extract single tables")
+    
     @abstractmethod
     async def close(self) -> None:
         """Close the engine and release resources.
@@ -0,0 +1,255 @@
+"""Model metadata loaded on first access.
+
+Exploratory tools often look at a handful of tables of a large model, yet
+``extract_metadata`` fetches every table's schema first. ``LazyModelMetadata``
+only fetches the summary and table list up front; columns, measures,
+relationships and Power Query are fetched when first asked for::
+    
+    async with get_engine("mcp") as engine:
+        await engine.load_model("./Sales.Dataset")
+        metadata = await LazyModelMetadata.open(engine)
+        columns = await metadata.columns("Sales")
+"""
+
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable
+
+from ..mcp_client.pbixray_tools import Column
+from .base import IDocumentationEngine, ModelMetadata
+
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModelMetadata:
+    """Model metadata whose expensive parts are fetched on first access.
+    
+    The first access to a table fetches its columns and measures together
+    with those of the next tables in model order that are not loaded yet,
+    ``prefetch`` tables at a time, since neighbouring tables tend to be
+    looked at together. Relationships and Power Query are fetched on first
+    access too. Every result is memoized and concurrent requests for the
+    same table share one fetch.
+    
+    Engines without ``extract_table`` load all tables at the first access.
+    The engine must stay open, with the model loaded, while this is used.
+    
+    Attributes:
+        engine: Engine the metadata is fetched from
+        summary: Model summary
+        tables: Tables in model order; columns are filled in as they load
+        prefetch: Number of tables fetched together (and concurrently)
+    """
+    
+    def __init__(
+        self,
+        engine: IDocumentationEngine,
+        summary: dict[str, Any],
+        tables: list[Any],
+        prefetch: int = 8
+    ):
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be at least 1, got {prefetch}")
+        self.engine = engine
+        self.summary = summary
+        self.tables = tables
+        self.prefetch = prefetch
+        self._index = {table.name: i for i, table in enumerate(tables)}
+        self._loading: dict[str, asyncio.Future] = {}
+        self._parts: dict[str, asyncio.Future] = {}
+        self._batches: set[asyncio.Task] = set()
+        self._slots = asyncio.Semaphore(prefetch)
+        self._per_table = (
+            type(engine).extract_table is not IDocumentationEngine.extract_table
+        )
+    
+    @classmethod
+    async def open(
+        cls,
+        engine: IDocumentationEngine,
+        prefetch: int = 8
+    ) -> "LazyModelMetadata":
+        """Fetch the summary and table list of the engine's loaded model.
+        
+        Args:
+            engine: Engine with a model loaded
+            prefetch: Number of tables fetched together
+        
+        Returns:
+            Metadata whose other parts load on first access
+        """
+        metadata = await engine.extract_metadata(include={"summary", "tables"})
+        return cls(engine, metadata.summary, metadata.tables, prefetch)
+    
+    @property
+    def table_names(self) -> list[str]:
+        """Names of the model's tables, in model order."""
+        return [table.name for table in self.tables]
+    
+    def is_loaded(self, table_name: str) -> bool:
+        """Check whether a table's columns and measures have been fetched."""
+        future = self._loading.get(table_name)
+        return (
+            future is not None and future.done() and not future.cancelled()
+            and future.exception() is None
+        )
+    
+    async def table(self, table_name: str) -> Any:
+        """Return a table with its columns loaded.
+        
+        Raises:
+            ValueError: If the model has no table with this name
+        """
+        return (await self._table_details(table_name))[0]
+    
+    async def columns(self, table_name: str) -> list[Column]:
+        """Return a table's columns, fetching them on first access."""
+        return (await self.table(table_name)).columns
+    
+    async def table_measures(self, table_name: str) -> list[Any]:
+        """Return a table's measures (with expressions), fetching them on first access."""
+        return (await self._table_details(table_name))[1]
+    
+    async def measures(self) -> list[Any]:
+        """Return all measures, loading every table."""
+        per_table = await asyncio.gather(*(
+            self.table_measures(name) for name in self.table_names
+        ))
+        return [measure for measures in per_table for measure in measures]
+    
+    async def relationships(self) -> list[Any]:
+        """Return all relationships, fetching them on first access."""
+        async def fetch() -> list[Any]:
+            metadata = await self.engine.extract_metadata(include={"relationships"})
+            return metadata.relationships
+        
+        return await self._once("relationships", fetch)
+    
+    async def power_query(self) -> dict[str, str] | None:
+        """Return the model's Power Query code, fetching it on first access."""
+        async def fetch() -> dict[str, str] | None:
+            metadata = await self.engine.extract_metadata(include={"power_query"})
+            return metadata.power_query
+        
+        return await self._once("power_query", fetch)
+    
+    async def load(self) -> ModelMetadata:
+        """Fetch everything not loaded yet and return it as ``ModelMetadata``."""
+        measures, relationships, power_query = await asyncio.gather(
+            self.measures(), self.relationships(), self.power_query()
+        )
+        return ModelMetadata(
+            summary=self.summary,
+            tables=self.tables,
+            measures=measures,
+            relationships=relationships,
+            power_query=power_query,
+        )
+    
+    async def _once(self, part: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fetch`` once for a part, sharing it with concurrent callers."""
+        future = self._parts.get(part)
+        if future is None:
+            future = self._parts[part] = asyncio.ensure_future(fetch())
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            # Let the next access try again
+            if self._parts.get(part) is future:
+                del self._parts[part]
+            raise
+    
+    async def _table_details(self, table_name: str) -> tuple[Any, list[Any]]:
+        """Return a loaded table and its measures."""
+        if table_name not in self._index:
+            raise ValueError(f"No table named '{table_name}'")
+        if table_name not in self._loading:
+            self._schedule(table_name)
+        return await asyncio.shield(self._loading[table_name])
+    
+    def _schedule(self, table_name: str) -> None:
+        """Start fetching a table and the next tables not loaded yet."""
+        names = self.table_names
+        start = self._index[table_name]
+        siblings = [
+            name for name in names[start + 1:] + names[:start]
+            if name not in self._loading
+        ]
+        if self._per_table:
+            siblings = siblings[:self.prefetch - 1]
+        
+        loop = asyncio.get_running_loop()
+        batch = {name: loop.create_future() for name in [table_name] + siblings}
+        self._loading.update(batch)
+        logger.debug(f"Fetching {len(batch)} tables starting at {table_name}")
+        task = asyncio.create_task(self._fetch(batch))
+        self._batches.add(task)
+        task.add_done_callback(functools.partial(self._batch_done, batch))
+    
+    def _batch_done(self, batch: dict[str, asyncio.Future], task: asyncio.Task) -> None:
+        """Fail the tables a cancelled or crashed batch left unresolved.
+        
+        Waiters would otherwise wait forever, e.g. when the loop shuts down
+        while a prefetch is in flight.
+        """
+        self._batches.discard(task)
+        if task.cancelled():
+            error = RuntimeError(f"Loading tables {list(batch)} was cancelled")
+        else:
+            error = task.exception()
+        if error is not None:
+            self._resolve(batch, [error] * len(batch))
+    
+    async def _fetch(self, batch: dict[str, asyncio.Future]) -> None:
+        """Fetch a batch of tables and resolve their futures."""
+        if self._per_table:
+            results = await asyncio.gather(
+                *(self._fetch_table(name) for name in batch), return_exceptions=True
+            )
+        else:
+            results = await self._fetch_all(list(batch))
+        self._resolve(batch, results)
+    
+    def _resolve(self, batch: dict[str, asyncio.Future], results: list[Any]) -> None:
+        """Resolve a batch's futures with fetched tables or exceptions."""
+        for (name, future), result in zip(batch.items(), results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                # Forget the failure so the next access tries again
+                if self._loading.get(name) is future:
+                    del self._loading[name]
+                future.set_exception(result)
+                future.exception()  # Prefetched tables may never be awaited
+            else:
+                future.set_result(result)
+    
+    async def _fetch_table(self, table_name: str) -> tuple[Any, list[Any]]:
+        """Fetch one table with ``extract_table``."""
+        async with self._slots:
+            chunk = await self.engine.extract_table(table_name)
+        table = self.tables[self._index[table_name]]
+        table.columns = chunk.tables[0].columns if chunk.tables else []
+        return table, chunk.measures
+    
+    async def _fetch_all(self, names: list[str]) -> list[Any]:
+        """Fetch the given tables with one projected ``extract_metadata`` call."""
+        try:
+            metadata = await self.engine.extract_metadata(
+                include={"tables", "columns", "measures"}
+            )
+        except Exception as e:
+            return [e] * len(names)
+        
+        columns = {table.name: table.columns for table in metadata.tables}
+        measures: dict[str, list[Any]] = {}
+        for measure in metadata.measures:
+            measures.setdefault(measure.table, []).append(measure)
+        results = []
+        for name in names:
+            table = self.tables[self._index[name]]
+            table.columns = columns.get(name, [])
+            results.append((table, measures.get(name, [])))
+        return results
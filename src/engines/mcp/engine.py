@@ -9,11 +9,11 @@ import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 
 from ...mcp_client.client import MCPClient
-from ...mcp_client.pbixray_tools import Table, Measure, Relationship
-from ..base import IDocumentationEngine, ModelMetadata
+from ...mcp_client.pbixray_tools import Column, Table, Measure, Relationship
+from ..base import IDocumentationEngine, MetadataChunk, ModelMetadata, resolve_include
 from .config import MCPEngineConfig, MCPMode
 from .discovery import find_powerbi_mcp_server, validate_server_path
 
@@ -45,6 +45,55 @@ def _parse_mcp_result(result) -> dict[str, Any]:
     return {}
 
 
+def _parse_columns(table_data: Any) -> list[Column]:
+    """Parse the columns of a GetSchema result.
+    
+    Args:
+        table_data: GetSchema data ({"TableName": ..., "Columns": [...], "Measures": [...]})
+        
+    Returns:
+        List of columns
+    """
+    if not isinstance(table_data, dict) or "Columns" not in table_data:
+        return []
+    return [
+        Column(
+            name=col.get("name", col.get("ColumnName", "")),
+            data_type=col.get("dataType", col.get("DataType", "string")),
+            is_hidden=col.get("isHidden", col.get("IsHidden", False)),
+        )
+        for col in table_data["Columns"]
+        if isinstance(col, dict)
+    ]
+
+
+def _parse_measures(table_name: str, table_data: Any) -> list[Measure]:
+    """Parse the measures of a GetSchema result.
+    
+    Args:
+        table_name: Name of the table
+        table_data: GetSchema data ({"TableName": ..., "Columns": [...], "Measures": [...]})
+        
+    Returns:
+        List of Measure objects
+    """
+    if not isinstance(table_data, dict) or "Measures" not in table_data:
+        return []
+    return [
+        Measure(
+            name=measure_data.get("name", ""),
+            table=table_name,
+            expression=measure_data.get("expression", ""),
+            description=measure_data.get("description"),
+            format_string=measure_data.get("formatString"),
+            is_hidden=measure_data.get("isHidden", False),
+            display_folder=measure_data.get("displayFolder"),
+        )
+        for measure_data in table_data["Measures"]
+        if isinstance(measure_data, dict)
+    ]
+
+
 class ModelingMCPEngine(IDocumentationEngine):
     """Documentation engine using Power BI Modeling MCP Server.
     
@@ -66,6 +115,7 @@ class ModelingMCPEngine(IDocumentationEngine):
         self._connection = None  # Store the connection context manager
         self._loaded_source: str | None = None
         self._connection_id: str | None = None
+        self._connections: dict[str, str | None] = {}  # Named connections
         self._available_tools: set[str] = set()
     
     async def load_model(self, source: str, **kwargs) -> None:
@@ -76,6 +126,9 @@ class ModelingMCPEngine(IDocumentationEngine):
         - Power BI Desktop connection string (powerbi://...)
         - XMLA endpoint connection string
         
+        Loading another model into an engine that already has a server
+        running disconnects the previous model and reuses the server.
+        
         Args:
             source: Model source (PBIP folder, connection string, etc.)
             **kwargs: Additional options:
@@ -84,8 +137,118 @@ class ModelingMCPEngine(IDocumentationEngine):
                 
         Raises:
             FileNotFoundError: If PBIP folder doesn't exist
-            RuntimeError: If server not found or connection fails
+            RuntimeError: If server not found or connection fails, or if
+                named connections are open and the server does not name
+                every connection
+        """
+        await self._start_server(**kwargs)
+        await self._disconnect()
+        
+        # Connect to the model source
+        connection_id = await self._connect_to_source(source)
+        await self._check_routable(
+            source, connection_id, list(self._connections.values())
+        )
+        self._connection_id = connection_id
+        self._loaded_source = source
+    
+    async def connect(self, source: str, name: str | None = None) -> str:
+        """Open an additional named connection on the running server.
+        
+        Each connection holds its own model, so several PBIP folders or
+        live models can be extracted concurrently on one server by passing
+        ``connection=name`` to ``extract_metadata`` or ``iter_metadata``.
+        Starts the server if it is not running yet.
+        
+        Args:
+            source: Model source (PBIP folder, connection string, etc.)
+            name: Name to refer to the connection by (default: the source)
+            
+        Returns:
+            The connection name
+            
+        Raises:
+            ValueError: If a connection with this name is already open
+            RuntimeError: If the server does not name the connection while
+                other connections are open, so requests could not be routed
+        """
+        name = name or source
+        if name in self._connections:
+            raise ValueError(f"Connection '{name}' is already open")
+        
+        await self._start_server()
+        connection_id = await self._connect_to_source(source)
+        
+        open_ids = list(self._connections.values())
+        if self._loaded_source is not None:
+            open_ids.append(self._connection_id)
+        await self._check_routable(name, connection_id, open_ids)
+        
+        self._connections[name] = connection_id
+        return name
+    
+    async def disconnect(self, name: str) -> None:
+        """Close a named connection opened with ``connect``.
+        
+        Args:
+            name: Connection name
+            
+        Raises:
+            ValueError: If no connection with this name is open
+        """
+        if name not in self._connections:
+            raise ValueError(f"No connection named '{name}'")
+        await self._disconnect_id(self._connections.pop(name))
+    
+    @property
+    def connections(self) -> list[str]:
+        """Names of the open named connections."""
+        return list(self._connections)
+    
+    async def _check_routable(
+        self,
+        name: str,
+        connection_id: str | None,
+        open_ids: list[str | None]
+    ) -> None:
+        """Close a new connection that could not be told apart from others.
+        
+        Unnamed connections rely on the server's "last used" connection, so
+        they cannot be open alongside other connections.
+        
+        Args:
+            name: Connection name or source, for the error message
+            connection_id: Connection name assigned by the server
+            open_ids: Server names of the other open connections
+            
+        Raises:
+            RuntimeError: If the new connection was closed
+        """
+        if open_ids and (connection_id is None or None in open_ids):
+            # An unnamed new connection is the server's last used one
+            await self._disconnect_id(connection_id, last_used=True)
+            raise RuntimeError(
+                f"Cannot open connection '{name}': the server did not name "
+                "every connection, so requests could not be routed to it"
+            )
+    
+    async def _start_server(self, **kwargs) -> None:
+        """Start the MCP server, or reuse it if already running.
+        
+        Args:
+            **kwargs: Options overriding the config (mode, timeout)
+            
+        Raises:
+            RuntimeError: If server not found or fails to start
         """
+        # Reuse a running server unless its mode has to change
+        if self._connection is not None:
+            if MCPMode(kwargs.get("mode", self.config.mode)) == self.config.mode:
+                if "timeout" in kwargs:
+                    self.config.timeout = int(kwargs["timeout"])
+                return
+            await self.close()
+        
         # Discover server if not configured
         if self.config.server_path is None:
             server_path = find_powerbi_mcp_server()
@@ -144,10 +307,6 @@ class ModelingMCPEngine(IDocumentationEngine):
         
         # Discover available tools
         await self._discover_tools()
-        
-        # Connect to the model source
-        await self._connect_to_source(source)
-        self._loaded_source = source
     
     async def _discover_tools(self) -> None:
         """Discover available MCP tools via feature detection."""
@@ -175,33 +334,48 @@ class ModelingMCPEngine(IDocumentationEngine):
                 "table_operations",
             }
     
-    def _build_request(self, operation: str, **params) -> dict:
+    def _build_request(self, operation: str, connection: str | None = None, **params) -> dict:
         """Build request dict with optional connectionName.
         
         Args:
             operation: Operation name
+            connection: Named connection to route the request through
+                        (default: the model loaded with ``load_model``)
             **params: Additional parameters
             
         Returns:
             Request dictionary
+            
+        Raises:
+            ValueError: If no connection with this name is open
         """
         request = {"operation": operation}
         
+        if connection is None:
+            connection_id = self._connection_id
+        elif connection in self._connections:
+            connection_id = self._connections[connection]
+        else:
+            raise ValueError(f"No connection named '{connection}'")
+        
         # Only add connectionName if it's set (None means "last used")
-        if self._connection_id:
-            request["connectionName"] = self._connection_id
+        if connection_id:
+            request["connectionName"] = connection_id
         
         # Add other parameters
         request.update(params)
         
         return request
     
-    async def _connect_to_source(self, source: str) -> None:
+    async def _connect_to_source(self, source: str) -> str | None:
         """Connect to a Power BI model source.
         
         Args:
             source: PBIP folder path or connection string
             
+        Returns:
+            Connection name assigned by the server (None means "last used")
+            
         Raises:
             FileNotFoundError: If PBIP folder doesn't exist
             RuntimeError: If connection fails
@@ -214,22 +388,25 @@ class ModelingMCPEngine(IDocumentationEngine):
         
         if source_path.exists() and source_path.is_dir():
             # PBIP folder - connect via ConnectFolder
-            await self._connect_pbip_folder(str(source_path))
+            return await self._connect_pbip_folder(str(source_path))
         elif source.startswith("powerbi://") or source.startswith("localhost:"):
             # Connection string - connect via Connect
-            await self._connect_via_connection_string(source)
+            return await self._connect_via_connection_string(source)
         else:
             raise ValueError(
                 f"Unsupported source type: {source}. "
                 "Expected PBIP folder or connection string (powerbi://...)"
             )
     
-    async def _connect_pbip_folder(self, folder_path: str) -> None:
+    async def _connect_pbip_folder(self, folder_path: str) -> str | None:
         """Connect to a PBIP folder.
         
         Args:
             folder_path: Path to PBIP folder
             
+        Returns:
+            Connection name assigned by the server
+            
         Raises:
             RuntimeError: If connection fails
         """
@@ -250,26 +427,32 @@ class ModelingMCPEngine(IDocumentationEngine):
             parsed = _parse_mcp_result(result)
             
             # Extract connection ID from result
+            connection_id = None
             if parsed.get("success") and "data" in parsed:
-                self._connection_id = parsed["data"].get("connectionName")
-                logger.info(f"Connected with connection ID: {self._connection_id}")
+                connection_id = parsed["data"].get("connectionName")
+                logger.info(f"Connected with connection ID: {connection_id}")
             else:
                 logger.warning("No connection ID returned, using default")
+            return connection_id
         
         except Exception as e:
             raise RuntimeError(f"Failed to connect to PBIP folder: {e}")
     
-    async def _connect_via_connection_string(self, connection_string: str) -> None:
+    async def _connect_via_connection_string(self, connection_string: str) -> str | None:
         """Connect via connection string.
         
         Args:
             connection_string: Connection string (powerbi://... or localhost:port)
             
+        Returns:
+            Connection name assigned by the server (None means "last used")
+            
         Raises:
             RuntimeError: If connection fails
         """
         logger.info(f"Connecting to: {connection_string}")
         
+        connection_id = None
         try:
             # Parse connection string
             if connection_string.startswith("powerbi://"):
@@ -300,17 +483,17 @@ class ModelingMCPEngine(IDocumentationEngine):
                         # Extract connection name from data
                         data = parsed["data"]
                         if isinstance(data, dict):
-                            self._connection_id = data.get("connectionName") or data.get("name")
+                            connection_id = data.get("connectionName") or data.get("name")
                         elif isinstance(data, str):
-                            self._connection_id = data
+                            connection_id = data
                     
-                    if not self._connection_id:
+                    if not connection_id:
                         # If no connection ID returned, MCP might use "last used"
                         # Try to get the connection list to find the name
                         logger.warning("No connection ID in result, MCP may be using 'last used' connection")
-                        self._connection_id = None  # Will use implicit "last used" connection
+                        connection_id = None  # Will use implicit "last used" connection
                     
-                    logger.info(f"Connected with connection ID: {self._connection_id}")
+                    logger.info(f"Connected with connection ID: {connection_id}")
                 else:
                     raise ValueError(
                         f"Invalid Fabric connection string format. Expected: "
@@ -338,44 +521,69 @@ class ModelingMCPEngine(IDocumentationEngine):
                 if parsed.get("success") and "data" in parsed:
                     data = parsed["data"]
                     if isinstance(data, dict):
-                        self._connection_id = data.get("connectionName") or data.get("name")
+                        connection_id = data.get("connectionName") or data.get("name")
                     elif isinstance(data, str):
-                        self._connection_id = data
+                        connection_id = data
                 
-                if not self._connection_id:
+                if not connection_id:
                     logger.warning("No connection ID in result, MCP may be using 'last used' connection")
-                    self._connection_id = None
+                    connection_id = None
                
-                logger.info(f"Connected with connection ID: {self._connection_id}")
+                logger.info(f"Connected with connection ID: {connection_id}")
         
         except Exception as e:
             raise RuntimeError(f"Failed to connect: {e}")
+        
+        return connection_id
     
-    async def extract_metadata(self) -> ModelMetadata:
+    async def extract_metadata(
+        self,
+        include: Iterable[str] | None = None,
+        connection: str | None = None
+    ) -> ModelMetadata:
         """Extract all metadata from the loaded model.
         
+        Args:
+            include: Parts to extract (see ``METADATA_PARTS``; None for all).
+                     Skipped parts cost no server calls.
+            connection: Named connection to extract from (default: the
+                        model loaded with ``load_model``)
+        
         Returns:
             ModelMetadata: Container with all extracted metadata
             
         Raises:
             RuntimeError: If no model is loaded
+            ValueError: If no connection with this name is open
         """
         if self.mcp_client is None:
             raise RuntimeError("No model loaded. Call load_model() first.")
+        if connection is not None and connection not in self._connections:
+            raise ValueError(f"No connection named '{connection}'")
         
+        parts = resolve_include(include)
         logger.info("Extracting metadata from model...")
         
         # Extract model summary
-        summary = await self._get_model_info()
-        
-        # Extract tables
-        tables = await self._get_tables()
+        summary = await self._get_model_info(connection) if "summary" in parts else {}
+        
+        # Extract tables, with their schemas only if requested
+        tables = []
+        if "columns" in parts:
+            tables = await self._get_tables(connection)
+        elif "tables" in parts:
+            tables = [
+                self._make_table(table_data, [])
+                for table_data in await self._list_tables(connection)
+            ]
         
         # Extract measures
-        measures = await self._get_measures()
+        measures = await self._get_measures(connection) if "measures" in parts else []
         
         # Extract relationships
-        relationships = await self._get_relationships()
+        relationships = []
+        if "relationships" in parts:
+            relationships = await self._get_relationships(connection)
         
         logger.info(
             f"Extracted {len(tables)} tables, {len(measures)} measures, "
@@ -390,16 +598,133 @@ class ModelingMCPEngine(IDocumentationEngine):
             power_query=None,  # Not supported via Modeling MCP yet
         )
     
-    async def _get_model_info(self) -> dict[str, Any]:
+    async def iter_metadata(
+        self,
+        include: Iterable[str] | None = None,
+        connection: str | None = None
+    ) -> AsyncIterator[MetadataChunk]:
+        """Extract metadata one table at a time.
+        
+        Yields the summary and relationships first, then each table with its
+        measures as soon as its schema has been fetched.
+        
+        Args:
+            include: Parts to extract (see ``METADATA_PARTS``; None for all)
+            connection: Named connection to extract from (default: the
+                        model loaded with ``load_model``)
+        
+        Yields:
+            MetadataChunk: Summary and relationships, then one chunk per table
+            
+        Raises:
+            RuntimeError: If no model is loaded
+            ValueError: If no connection with this name is open
+        """
+        if self.mcp_client is None:
+            raise RuntimeError("No model loaded. Call load_model() first.")
+        if connection is not None and connection not in self._connections:
+            raise ValueError(f"No connection named '{connection}'")
+        
+        parts = resolve_include(include)
+        logger.info("Streaming metadata from model...")
+        
+        yield MetadataChunk(
+            summary=await self._get_model_info(connection) if "summary" in parts else None,
+            relationships=(
+                await self._get_relationships(connection) if "relationships" in parts else []
+            ),
+        )
+        if not parts & {"tables", "measures"}:
+            return
+        
+        for table_data in await self._list_tables(connection):
+            table_name = table_data.get("name", "")
+            # One GetSchema call returns both the columns and the measures
+            schema = None
+            if parts & {"columns", "measures"}:
+                schema = await self._get_schema_data(table_name, connection)
+            columns = []
+            if "columns" in parts and schema is not None:
+                columns = _parse_columns(schema)
+            yield MetadataChunk(
+                tables=[self._make_table(table_data, columns)] if "tables" in parts else [],
+                measures=(
+                    _parse_measures(table_name, schema)
+                    if "measures" in parts and schema is not None else []
+                ),
+            )
+    
+    async def extract_table(
+        self,
+        table_name: str,
+        connection: str | None = None
+    ) -> MetadataChunk:
+        """Extract one table's columns and measures with a single GetSchema call.
+        
+        Args:
+            table_name: Name of the table
+            connection: Named connection (default: the loaded model)
+            
+        Returns:
+            MetadataChunk: The table with its columns, and its measures
+            
+        Raises:
+            RuntimeError: If no model is loaded or the server call fails
+        """
+        if self.mcp_client is None:
+            raise RuntimeError("No model loaded. Call load_model() first.")
+        
+        result = await self.mcp_client.call_tool(
+            "table_operations",
+            {"request": self._build_request("GetSchema", connection, tableName=table_name)}
+        )
+        parsed = _parse_mcp_result(result)
+        if not parsed.get("success") or "data" not in parsed:
+            raise RuntimeError(f"Failed to get schema for table {table_name}")
+        
+        table_data = parsed["data"]
+        return MetadataChunk(
+            tables=[Table(name=table_name, columns=_parse_columns(table_data))],
+            measures=_parse_measures(table_name, table_data),
+        )
+    
+    async def _list_tables(self, connection: str | None = None) -> list[dict[str, Any]]:
+        """List the model's tables without fetching their schemas.
+        
+        Args:
+            connection: Named connection (default: the loaded model)
+            
+        Returns:
+            Raw table entries from the server
+        """
+        try:
+            result = await self.mcp_client.call_tool(
+                "table_operations",
+                {"request": self._build_request("List", connection)}
+            )
+            
+            parsed = _parse_mcp_result(result)
+            if parsed.get("success") and "data" in parsed:
+                return [t for t in parsed["data"] if isinstance(t, dict)]
+            return []
+        
+        except Exception as e:
+            logger.error(f"Failed to get tables: {e}")
+            return []
+    
+    async def _get_model_info(self, connection: str | None = None) -> dict[str, Any]:
         """Get model summary information.
         
+        Args:
+            connection: Named connection (default: the loaded model)
+            
         Returns:
             Dictionary with model summary
         """
         try:
             result = await self.mcp_client.call_tool(
                 "model_operations",
-                {"request": self._build_request("Get")}
+                {"request": self._build_request("Get", connection)}
             )
             
             parsed = _parse_mcp_result(result)
@@ -418,16 +743,19 @@ class ModelingMCPEngine(IDocumentationEngine):
             logger.warning(f"Failed to get model info: {e}")
             return {"name": "Unknown"}
     
-    async def _get_tables(self) -> list[Table]:
+    async def _get_tables(self, connection: str | None = None) -> list[Table]:
         """Get all tables from the model.
         
+        Args:
+            connection: Named connection (default: the loaded model)
+            
         Returns:
             List of Table objects
         """
         try:
             result = await self.mcp_client.call_tool(
                 "table_operations",
-                {"request": self._build_request("List")}
+                {"request": self._build_request("List", connection)}
             )
             
             parsed = _parse_mcp_result(result)
@@ -437,13 +765,9 @@ class ModelingMCPEngine(IDocumentationEngine):
                 for table_data in parsed["data"]:
                     if isinstance(table_data, dict):
                         # Get table schema
-                        schema = await self._get_table_schema(table_data.get("name", ""))
+                        schema = await self._get_table_schema(table_data.get("name", ""), connection)
                         
-                        tables.append(Table(
-                            name=table_data.get("name", ""),
-                            columns=schema,
-                            row_count=None,  # Not available via Modeling MCP
-                        ))
+                        tables.append(self._make_table(table_data, schema))
             
             return tables
         
@@ -451,45 +775,70 @@ class ModelingMCPEngine(IDocumentationEngine):
             logger.error(f"Failed to get tables: {e}")
             return []
     
-    async def _get_table_schema(self, table_name: str) -> list[dict]:
-        """Get schema for a specific table.
+    @staticmethod
+    def _make_table(table_data: dict[str, Any], columns: list[Column]) -> Table:
+        """Build a Table from a server table entry.
+        
+        Args:
+            table_data: Table entry returned by table_operations List
+            columns: Columns of the table
+            
+        Returns:
+            Table object
+        """
+        return Table(
+            name=table_data.get("name", ""),
+            columns=columns,
+            row_count=None,  # Not available via Modeling MCP
+            lineage_tag=table_data.get("lineageTag") or table_data.get("LineageTag"),
+        )
+    
+    async def _get_schema_data(self, table_name: str, connection: str | None = None) -> Any:
+        """Fetch the raw GetSchema result of a table.
         
         Args:
             table_name: Name of the table
+            connection: Named connection (default: the loaded model)
             
         Returns:
-            List of column definitions
+            Table structure including columns and measures, or None if the
+            call failed
         """
         try:
             result = await self.mcp_client.call_tool(
                 "table_operations",
-                {"request": self._build_request("GetSchema", tableName=table_name)}
+                {"request": self._build_request("GetSchema", connection, tableName=table_name)}
             )
             
             parsed = _parse_mcp_result(result)
             if parsed.get("success") and "data" in parsed:
-                table_data = parsed["data"]
-                # GetSchema returns {"TableName":"X", "Columns":[], "Measures":[], "Relationships":[]}
-                if isinstance(table_data, dict) and "Columns" in table_data:
-                    columns = []
-                    for col in table_data["Columns"]:
-                        if isinstance(col, dict):
-                            columns.append({
-                                "ColumnName": col.get("name", col.get("ColumnName", "")),
-                                "DataType": col.get("dataType", col.get("DataType", "string")),
-                                "IsHidden": col.get("isHidden", col.get("IsHidden", False)),
-                            })
-                    return columns
+                return parsed["data"]
             
-            return []
+            return None
         
         except Exception as e:
             logger.warning(f"Failed to get schema for table {table_name}: {e}")
-            return []
+            return None
+    
+    async def _get_table_schema(self, table_name: str, connection: str | None = None) -> list[Column]:
+        """Get schema for a specific table.
+        
+        Args:
+            table_name: Name of the table
+            connection: Named connection (default: the loaded model)
+            
+        Returns:
+            List of columns
+        """
+        table_data = await self._get_schema_data(table_name, connection)
+        return [] if table_data is None else _parse_columns(table_data)
     
-    async def _get_measures(self) -> list[Measure]:
+    async def _get_measures(self, connection: str | None = None) -> list[Measure]:
         """Get all measures from the model.
         
+        Args:
+            connection: Named connection (default: the loaded model)
+            
         Returns:
             List of Measure objects
         """
@@ -498,12 +847,7 @@ class ModelingMCPEngine(IDocumentationEngine):
             # We need to query each table for its measures
             result = await self.mcp_client.call_tool(
                 "table_operations",
-                {
-                    "request": {
-                        "operation": "List",
-                        "connectionName": self._connection_id,
-                    }
-                }
+                {"request": self._build_request("List", connection)}
             )
             
             measures = []
@@ -513,7 +857,7 @@ class ModelingMCPEngine(IDocumentationEngine):
                     if isinstance(table_data, dict):
                         table_name = table_data.get("name", "")
                         # Get measures for this table
-                        table_measures = await self._get_table_measures(table_name)
+                        table_measures = await self._get_table_measures(table_name, connection)
                         measures.extend(table_measures)
             
             return measures
@@ -522,55 +866,26 @@ class ModelingMCPEngine(IDocumentationEngine):
             logger.error(f"Failed to get measures: {e}")
             return []
     
-    async def _get_table_measures(self, table_name: str) -> list[Measure]:
+    async def _get_table_measures(self, table_name: str, connection: str | None = None) -> list[Measure]:
         """Get measures for a specific table.
         
         Args:
             table_name: Name of the table
+            connection: Named connection (default: the loaded model)
             
         Returns:
             List of Measure objects
         """
-        try:
-            # Use GetSchema which returns table structure including measures
-            result = await self.mcp_client.call_tool(
-                "table_operations",
-                {
-                    "request": {
-                        "operation": "GetSchema",
-                        "connectionName": self._connection_id,
-                        "tableName": table_name,
-                    }
-                }
-            )
-            
-            measures = []
-            parsed = _parse_mcp_result(result)
-            if parsed.get("success") and "data" in parsed:
-                table_data = parsed["data"]
-                # GetSchema returns {"TableName":"X", "Columns":[], "Measures":[], "Relationships":[]}
-                if isinstance(table_data, dict) and "Measures" in table_data:
-                    for measure_data in table_data["Measures"]:
-                        if isinstance(measure_data, dict):
-                            measures.append(Measure(
-                                name=measure_data.get("name", ""),
-                                table=table_name,
-                                expression=measure_data.get("expression", ""),
-                                description=measure_data.get("description"),
-                                format_string=measure_data.get("formatString"),
-                                is_hidden=measure_data.get("isHidden", False),
-                                display_folder=measure_data.get("displayFolder"),
-                            ))
-            
-            return measures
-        
-        except Exception as e:
-            logger.warning(f"Failed to get measures for table {table_name}: {e}")
-            return []
+        # GetSchema returns the table structure including measures
+        table_data = await self._get_schema_data(table_name, connection)
+        return [] if table_data is None else _parse_measures(table_name, table_data)
     
-    async def _get_relationships(self) -> list[Relationship]:
+    async def _get_relationships(self, connection: str | None = None) -> list[Relationship]:
         """Get all relationships from the model.
         
+        Args:
+            connection: Named connection (default: the loaded model)
+            
         Returns:
             List of Relationship objects
         """
@@ -578,12 +893,7 @@ class ModelingMCPEngine(IDocumentationEngine):
             # Try relationship_operations List to get all model relationships
             result = await self.mcp_client.call_tool(
                 "relationship_operations",
-                {
-                    "request": {
-                        "operation": "List",
-                        "connectionName": self._connection_id,
-                    }
-                }
+                {"request": self._build_request("List", connection)}
             )
             
             relationships = []
@@ -618,23 +928,39 @@ class ModelingMCPEngine(IDocumentationEngine):
                 self._connection = None
                 self.mcp_client = None  # type: ignore
     
-    async def close(self) -> None:
-        """Close the MCP connection and release resources."""
-        if self._connection_id and self.mcp_client:
+    async def _disconnect(self) -> None:
+        """Disconnect from the loaded model, keeping the server running."""
+        await self._disconnect_id(self._connection_id)
+        self._loaded_source = None
+        self._connection_id = None
+    
+    async def _disconnect_id(
+        self,
+        connection_id: str | None,
+        last_used: bool = False
+    ) -> None:
+        """Close one server connection, logging failures.
+        
+        Args:
+            connection_id: Connection name assigned by the server
+            last_used: Close the server's last used connection when
+                ``connection_id`` is None
+        """
+        if (connection_id or last_used) and self.mcp_client:
+            request = {"operation": "Disconnect"}
+            if connection_id:
+                request["connectionName"] = connection_id
             try:
                 # Disconnect from model
                 await self.mcp_client.call_tool(
-                    "connection_operations",
-                    {
-                        "request": {
-                            "operation": "Disconnect",
-                            "connectionName": self._connection_id,
-                        }
-                    }
+                    "connection_operations", {"request": request}
                 )
             except Exception as e:
                 logger.warning(f"Error disconnecting: {e}")
-        
+    
+    async def close(self) -> None:
+        """Close the MCP connection and release resources."""
+        for name in list(self._connections):
+            await self._disconnect_id(self._connections.pop(name))
+        await self._disconnect()
         await self._cleanup()
-        self._loaded_source = None
-        self._connection_id = None
@@ -1,11 +1,12 @@
 """PBIXRay engine implementation."""
 
+import asyncio
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 
 from ...mcp_client.client import MCPClient
-from ...mcp_client.pbixray_tools import PBIXRayClient
-from ..base import IDocumentationEngine, ModelMetadata
+from ...mcp_client.pbixray_tools import Measure, PBIXRayClient, Table, as_columns
+from ..base import IDocumentationEngine, MetadataChunk, ModelMetadata, resolve_include
 
 
 class PBIXRayEngine(IDocumentationEngine):
@@ -29,10 +30,15 @@ class PBIXRayEngine(IDocumentationEngine):
         self.mcp_client: MCPClient | None = None
         self.pbi_client: PBIXRayClient | None = None
         self._loaded_source: str | None = None
+        # All measures of the loaded file, fetched once for extract_table()
+        self._measures: asyncio.Future | None = None
     
     async def load_model(self, source: str, **kwargs) -> None:
         """Load a PBIX file.
         
+        Loading another file into an engine that already has a server
+        running reuses the server.
+        
         Args:
             source: Path to PBIX file
             **kwargs: Ignored for pbixray engine
@@ -44,6 +50,12 @@ class PBIXRayEngine(IDocumentationEngine):
         if not Path(source).exists():
             raise FileNotFoundError(f"PBIX file not found: {source}")
         
+        self._measures = None
+        if self.pbi_client is not None:
+            await self.pbi_client.load_pbix(source)
+            self._loaded_source = source
+            return
+        
         if not Path(self.server_script_path).exists():
             raise RuntimeError(
                 f"pbixray-mcp-server not found at {self.server_script_path}"
@@ -62,9 +74,12 @@ class PBIXRayEngine(IDocumentationEngine):
         await self.pbi_client.load_pbix(source)
         self._loaded_source = source
     
-    async def extract_metadata(self) -> ModelMetadata:
+    async def extract_metadata(self, include: Iterable[str] | None = None) -> ModelMetadata:
         """Extract all metadata from the loaded PBIX file.
         
+        Args:
+            include: Parts to extract (see ``METADATA_PARTS``; None for all)
+        
         Returns:
             ModelMetadata: Container with all extracted metadata
             
@@ -74,22 +89,28 @@ class PBIXRayEngine(IDocumentationEngine):
         if self.pbi_client is None:
             raise RuntimeError("No model loaded. Call load_model() first.")
         
-        # Extract all metadata
-        summary = await self.pbi_client.get_model_summary()
-        tables = await self.pbi_client.get_tables()
-        measures = await self.pbi_client.get_measures()
-        relationships = await self.pbi_client.get_relationships()
+        parts = resolve_include(include)
+        
+        # Extract the requested metadata
+        summary = await self.pbi_client.get_model_summary() if "summary" in parts else {}
+        tables = await self.pbi_client.get_tables() if "tables" in parts else []
+        measures = await self.pbi_client.get_measures() if "measures" in parts else []
+        relationships = (
+            await self.pbi_client.get_relationships() if "relationships" in parts else []
+        )
         
         # Get schema for each table
-        for table in tables:
-            schema = await self.pbi_client.get_schema(table.name)
-            if isinstance(schema, list):
-                table.columns = schema
-            elif isinstance(schema, dict) and 'columns' in schema:
-                table.columns = schema['columns']
+        if "columns" in parts:
+            for table in tables:
+                schema = await self.pbi_client.get_schema(table.name)
+                columns = _schema_columns(schema)
+                if columns is not None:
+                    table.columns = columns
         
         # Get Power Query code
-        power_query = await self.pbi_client.get_power_query()
+        power_query = None
+        if "power_query" in parts:
+            power_query = await self.pbi_client.get_power_query()
         
         return ModelMetadata(
             summary=summary,
@@ -99,6 +120,94 @@ class PBIXRayEngine(IDocumentationEngine):
             power_query={"query": power_query} if power_query else None,
         )
     
+    async def iter_metadata(self, include: Iterable[str] | None = None) -> AsyncIterator[MetadataChunk]:
+        """Extract metadata one table at a time.
+        
+        Yields the summary and relationships first, then each table with its
+        measures as soon as its schema has been fetched, and the Power Query
+        code last. PBIXRay returns all measures at once, so they are fetched
+        before the first table.
+        
+        Args:
+            include: Parts to extract (see ``METADATA_PARTS``; None for all)
+        
+        Yields:
+            MetadataChunk: Summary and relationships, then one chunk per table
+            
+        Raises:
+            RuntimeError: If no model is loaded
+        """
+        if self.pbi_client is None:
+            raise RuntimeError("No model loaded. Call load_model() first.")
+        
+        parts = resolve_include(include)
+        
+        yield MetadataChunk(
+            summary=await self.pbi_client.get_model_summary() if "summary" in parts else None,
+            relationships=(
+                await self.pbi_client.get_relationships() if "relationships" in parts else []
+            ),
+        )
+        
+        measures: dict[str, list[Measure]] = {}
+        if "measures" in parts:
+            for measure in await self.pbi_client.get_measures():
+                measures.setdefault(measure.table, []).append(measure)
+        
+        if "tables" in parts:
+            for table in await self.pbi_client.get_tables():
+                if "columns" in parts:
+                    schema = await self.pbi_client.get_schema(table.name)
+                    columns = _schema_columns(schema)
+                    if columns is not None:
+                        table.columns = columns
+                yield MetadataChunk(tables=[table], measures=measures.pop(table.name, []))
+        
+        # Measures of tables that were not listed (or not requested)
+        leftover = [m for table_measures in measures.values() for m in table_measures]
+        if leftover:
+            yield MetadataChunk(measures=leftover)
+        
+        if "power_query" in parts:
+            power_query = await self.pbi_client.get_power_query()
+            if power_query:
+                yield MetadataChunk(power_query={"query": power_query})
+    
+    async def extract_table(self, table_name: str) -> MetadataChunk:
+        """Extract one table's columns and measures.
+        
+        PBIXRay returns all measures at once, so they are fetched on the
+        first call and shared by the following calls for the same file.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            MetadataChunk: The table with its columns, and its measures
+            
+        Raises:
+            RuntimeError: If no model is loaded
+        """
+        if self.pbi_client is None:
+            raise RuntimeError("No model loaded. Call load_model() first.")
+        
+        if self._measures is None:
+            self._measures = asyncio.ensure_future(self.pbi_client.get_measures())
+        measures = self._measures
+        schema = await self.pbi_client.get_schema(table_name)
+        try:
+            all_measures: list[Measure] = await asyncio.shield(measures)
+        except Exception:
+            # Let the next call try again
+            if self._measures is measures:
+                self._measures = None
+            raise
+        
+        return MetadataChunk(
+            tables=[Table(name=table_name, columns=_schema_columns(schema) or [])],
+            measures=[m for m in all_measures if m.table == table_name],
+        )
+    
     async def close(self) -> None:
         """Close the MCP connection and release resources."""
         if hasattr(self, '_connection') and self._connection is not None:
@@ -106,3 +215,12 @@ class PBIXRayEngine(IDocumentationEngine):
             self.mcp_client = None  # type: ignore
             self.pbi_client = None
             self._loaded_source = None
+
+
+def _schema_columns(schema: Any) -> list | None:
+    """Columns of a ``get_schema`` result, or None if it has none."""
+    if isinstance(schema, list):
+        return as_columns(schema)
+    if isinstance(schema, dict) and 'columns' in schema:
+        return as_columns(schema['columns'])
+    return None
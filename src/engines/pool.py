@@ -0,0 +1,218 @@
+"""Pool of warm documentation engines.
+
+Starting an engine launches its MCP server, which costs far more than
+extracting a small model. ``EnginePool`` keeps engines running between
+models: each engine loads one model after another on the same server.
+
+Every engine is owned by one long-lived task that enters, uses and closes
+it, because MCP stdio connections must be closed by the task that opened
+them.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from .base import ModelMetadata
+from .registry import get_engine
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Lane:
+    """Engines of one type and configuration, sharing a queue of sources."""
+    engine_type: str
+    engine_kwargs: dict[str, Any]
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    workers: set[asyncio.Task] = field(default_factory=set)
+    idle: int = 0
+    start_failures: int = 0  # Consecutive engines that failed to start
+
+
+class EnginePool:
+    """Extracts models on warm engines, started on demand.
+    
+    Engines are grouped by type and options. A group starts another engine
+    when a model is waiting and all its engines are busy, up to
+    ``max_engines``; engines then stay up until ``close``. An engine whose
+    extraction fails is closed and replaced on demand, so one broken model
+    cannot leave a server in a bad state for the next.
+    
+    An engine that fails to start (e.g. a missing MCP server) is retried
+    after a growing delay; after ``max_start_failures`` failures in a row
+    the models waiting for it are failed instead.
+    
+    Attributes:
+        max_engines: Maximum number of running engines per type and options
+        max_start_failures: Failed starts in a row before waiting models fail
+        start_backoff: Delay in seconds before retrying a failed start,
+                       doubled after each further failure
+    """
+    
+    def __init__(
+        self,
+        max_engines: int = 2,
+        max_start_failures: int = 3,
+        start_backoff: float = 0.5
+    ):
+        if max_engines < 1:
+            raise ValueError(f"max_engines must be at least 1, got {max_engines}")
+        if max_start_failures < 1:
+            raise ValueError(
+                f"max_start_failures must be at least 1, got {max_start_failures}"
+            )
+        self.max_engines = max_engines
+        self.max_start_failures = max_start_failures
+        self.start_backoff = start_backoff
+        self._lanes: dict[str, _Lane] = {}
+        self._closed = False
+    
+    async def extract(
+        self,
+        source: str,
+        engine_type: str = "pbixray",
+        engine_kwargs: dict[str, Any] | None = None,
+        include: Iterable[str] | None = None
+    ) -> ModelMetadata:
+        """Load a model on a warm engine and extract its metadata.
+        
+        Args:
+            source: Model source (PBIX file, PBIP folder, connection string)
+            engine_type: Documentation engine to use
+            engine_kwargs: Engine-specific configuration options
+            include: Metadata parts to extract (see ``METADATA_PARTS``;
+                     None for all)
+        
+        Returns:
+            Extracted model metadata
+        """
+        if self._closed:
+            raise RuntimeError("EnginePool is closed")
+        engine_kwargs = engine_kwargs or {}
+        key = json.dumps([engine_type, engine_kwargs], sort_keys=True, default=repr)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane(engine_type, dict(engine_kwargs))
+        
+        future = asyncio.get_running_loop().create_future()
+        lane.queue.put_nowait((source, include, future))
+        self._scale(lane)
+        return await future
+    
+    def stats(self) -> dict[str, int]:
+        """Number of running, idle and waiting engines and models."""
+        lanes = self._lanes.values()
+        return {
+            "engines": sum(len(lane.workers) for lane in lanes),
+            "idle": sum(lane.idle for lane in lanes),
+            "waiting": sum(lane.queue.qsize() for lane in lanes),
+        }
+    
+    async def close(self) -> None:
+        """Close every engine, failing models that are still waiting."""
+        self._closed = True
+        for lane in self._lanes.values():
+            while not lane.queue.empty():
+                *_, future = lane.queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("EnginePool is closed"))
+            for _ in lane.workers:
+                lane.queue.put_nowait(None)
+        await asyncio.gather(
+            *(task for lane in self._lanes.values() for task in lane.workers),
+            return_exceptions=True
+        )
+        self._lanes.clear()
+    
+    def _scale(self, lane: _Lane) -> None:
+        """Start an engine if models are waiting and every engine is busy."""
+        if self._closed or lane.queue.qsize() <= lane.idle:
+            return
+        if len(lane.workers) >= self.max_engines:
+            return
+        task = asyncio.create_task(self._serve(lane))
+        lane.workers.add(task)
+        
+        def done(task: asyncio.Task) -> None:
+            lane.workers.discard(task)
+            # Replace an engine that stopped after a failure
+            self._scale(lane)
+        
+        task.add_done_callback(done)
+    
+    async def _serve(self, lane: _Lane) -> None:
+        """Run one engine until the pool closes or an extraction fails."""
+        logger.info(f"Starting warm {lane.engine_type} engine")
+        try:
+            engine = get_engine(lane.engine_type, **lane.engine_kwargs)
+        except Exception as e:
+            # Fail the model that asked for the engine
+            item = None if lane.queue.empty() else lane.queue.get_nowait()
+            if item is not None and not item[-1].done():
+                item[-1].set_exception(RuntimeError(f"Engine initialization failed: {e}"))
+            return
+        failed = None
+        started = False
+        try:
+            async with engine:
+                started = True
+                lane.start_failures = 0
+                while True:
+                    lane.idle += 1
+                    try:
+                        item = await lane.queue.get()
+                    finally:
+                        lane.idle -= 1
+                    if item is None:
+                        return
+                    source, include, future = item
+                    if future.done():
+                        continue  # Caller gave up
+                    try:
+                        logger.info(f"Loading model from: {source}")
+                        await engine.load_model(source)
+                        if include is None:
+                            metadata = await engine.extract_metadata()
+                        else:
+                            metadata = await engine.extract_metadata(include=include)
+                    except Exception as e:
+                        failed = (future, e)
+                        logger.warning(f"Closing {lane.engine_type} engine after failure on {source}")
+                        break
+                    if not future.done():
+                        future.set_result(metadata)
+        except Exception as e:
+            if started:
+                raise
+            await self._start_failed(lane, e)
+        finally:
+            # Report a failure once the engine is closed and out of the pool
+            if failed is not None:
+                lane.workers.discard(asyncio.current_task())
+                future, error = failed
+                if not future.done():
+                    future.set_exception(error)
+    
+    async def _start_failed(self, lane: _Lane, error: Exception) -> None:
+        """Back off before the next start, or fail the waiting models."""
+        lane.start_failures += 1
+        if lane.start_failures < self.max_start_failures:
+            delay = self.start_backoff * 2 ** (lane.start_failures - 1)
+            logger.warning(
+                f"{lane.engine_type} engine failed to start ({error}); retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            return
+        
+        logger.error(
+            f"{lane.engine_type} engine failed to start {lane.start_failures} times: {error}"
+        )
+        lane.start_failures = 0  # Later requests try again
+        while not lane.queue.empty():
+            item = lane.queue.get_nowait()
+            if item is not None and not item[-1].done():
+                item[-1].set_exception(RuntimeError(f"Engine failed to start: {error}"))
@@ -48,6 +48,27 @@ def list_engines() -> list[str]:
     return list(_ENGINE_REGISTRY.keys())
 
 
+def get_engine_class(engine_type: str) -> type[IDocumentationEngine]:
+    """Look up the class registered for an engine type.
+    
+    Args:
+        engine_type: Engine identifier
+        
+    Returns:
+        Registered engine class
+        
+    Raises:
+        ValueError: If engine type not found
+    """
+    if engine_type not in _ENGINE_REGISTRY:
+        available = ", ".join(list_engines())
+        raise ValueError(
+            f"Unknown engine type: {engine_type}. "
+            f"Available engines: {available}"
+        )
+    return _ENGINE_REGISTRY[engine_type]
+
+
 def get_engine(
     engine_type: str = "pbixray",
     **engine_kwargs: Any
@@ -94,14 +115,7 @@ def get_engine(
         ... )
         >>> engine = get_engine("mcp", config=config)
     """
-    if engine_type not in _ENGINE_REGISTRY:
-        available = ", ".join(list_engines())
-        raise ValueError(
-            f"Unknown engine type: {engine_type}. "
-            f"Available engines: {available}"
-        )
-    
-    engine_class = _ENGINE_REGISTRY[engine_type]
+    engine_class = get_engine_class(engine_type)
     
     # Handle engine-specific initialization
     if engine_type == "mcp":
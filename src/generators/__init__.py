@@ -1 +1,8 @@
 """Wiki generators for Power BI documentation"""
+
+from .many import ModelResult, document_many
+
+__all__ = [
+    "ModelResult",
+    "document_many",
+]
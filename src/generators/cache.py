@@ -0,0 +1,266 @@
+# src/generators/cache.py
+"""Persistent memoization of rendered documentation fragments.
+
+Each rendered unit (a table page, one table's section of Measures.md, a
+relationship row) is keyed by a fingerprint of its inputs plus the renderer
+version. On later runs only fragments whose inputs changed are re-rendered;
+everything else is spliced in from the cache.
+
+The renderer version hashes the source of the modules that produce the
+fragments together with the package version, so editing a renderer
+invalidates the cache without a version bump.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import importlib.util
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from .. import __version__
+
+
+logger = logging.getLogger(__name__)
+
+# Modules whose code determines the content of cached fragments
+RENDERER_MODULES = (
+    "cache",
+    "document",
+    "emitters",
+    "graph",
+    "layout",
+    "mermaid",
+    "pages",
+)
+
+
+@functools.cache
+def renderer_version() -> str:
+    """Compute the version cached fragments are keyed on.
+    
+    Returns:
+        Package version plus a hash of the renderer modules' source
+    """
+    digest = hashlib.sha256()
+    for name in RENDERER_MODULES:
+        spec = importlib.util.find_spec(f"{__package__}.{name}")
+        try:
+            digest.update(Path(spec.origin).read_bytes())
+        except (AttributeError, TypeError, OSError):
+            # No source to hash (e.g. a frozen build); rely on the version
+            logger.debug(f"No source for renderer module {name}")
+    return f"{__version__}+{digest.hexdigest()[:16]}"
+
+
+def fingerprint(*parts: Any) -> str:
+    """Compute a stable content hash of render inputs.
+    
+    Args:
+        *parts: JSON-serializable values, dataclasses or objects with a
+                ``to_dict()`` method
+    
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = json.dumps(
+        parts,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_encode,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _encode(obj: Any) -> Any:
+    """JSON fallback encoder for metadata objects."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        encoded = {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+        encoded["__type__"] = type(obj).__name__
+        return encoded
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    return repr(obj)
+
+
+class RenderCache:
+    """SQLite-backed store of rendered fragments.
+    
+    Safe to share between the render worker threads of one process; SQLite's
+    own locking covers concurrent processes using the same cache directory.
+    Each open records when its renderer version was last used. Entries of
+    versions unused for ``max_age_days`` are dropped, so installs of
+    different versions can share a cache without evicting each other.
+    
+    Attributes:
+        hits: Number of fragments served from the cache
+        misses: Number of fragments rendered and stored
+    """
+    
+    FILENAME = "render-cache.sqlite3"
+    
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        version: str | None = None,
+        max_age_days: float | None = 30
+    ):
+        """Open (or create) the cache.
+        
+        Args:
+            cache_dir: Directory holding the cache database
+            version: Renderer version; fragments from other versions are
+                     never reused (default: ``renderer_version()``)
+            max_age_days: Drop the entries of other versions not used for
+                          this long (None to keep them until ``prune``)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.version = version = version or renderer_version()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending = 0
+        
+        self._db = sqlite3.connect(
+            self.cache_dir / self.FILENAME,
+            timeout=30,
+            check_same_thread=False,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS fragments ("
+            " kind TEXT NOT NULL,"
+            " fingerprint TEXT NOT NULL,"
+            " version TEXT NOT NULL,"
+            " content TEXT NOT NULL,"
+            " PRIMARY KEY (kind, fingerprint, version))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS versions ("
+            " version TEXT PRIMARY KEY,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "INSERT OR REPLACE INTO versions VALUES (?, ?)", (version, time.time())
+        )
+        self._db.commit()
+        if max_age_days is not None:
+            self.prune(max_age_days)
+    
+    def prune(self, max_age_days: float = 0) -> int:
+        """Drop the entries of other renderer versions that fell out of use.
+        
+        Args:
+            max_age_days: Keep versions used within this many days (0 drops
+                          every other version)
+        
+        Returns:
+            Number of fragments dropped
+        """
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM versions WHERE version != ? AND last_used <= ?",
+                (self.version, cutoff),
+            )
+            # Also drops fragments of versions from before usage was recorded
+            dropped = self._db.execute(
+                "DELETE FROM fragments WHERE version NOT IN (SELECT version FROM versions)"
+            ).rowcount
+            self._db.commit()
+        if dropped:
+            logger.debug(f"Render cache: dropped {dropped} fragments of unused versions")
+        return dropped
+    
+    def get(self, kind: str, key: str) -> str | None:
+        """Look up a cached fragment.
+        
+        Args:
+            kind: Fragment kind (e.g. "table-page")
+            key: Input fingerprint
+        
+        Returns:
+            Cached content, or None on a miss
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content FROM fragments"
+                " WHERE kind = ? AND fingerprint = ? AND version = ?",
+                (kind, key, self.version),
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, kind: str, key: str, content: str) -> None:
+        """Store a rendered fragment.
+        
+        Args:
+            kind: Fragment kind
+            key: Input fingerprint
+            content: Rendered content
+        """
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO fragments VALUES (?, ?, ?, ?)",
+                (kind, key, self.version, content),
+            )
+            self._pending += 1
+            if self._pending >= 500:
+                self._db.commit()
+                self._pending = 0
+    
+    def memoize(self, kind: str, render: Callable[..., str]) -> Callable[..., str]:
+        """Wrap a render function so its output is cached by input fingerprint.
+        
+        Args:
+            kind: Fragment kind used to namespace the cache entries
+            render: Pure function from metadata objects to rendered text
+        
+        Returns:
+            Function with the same signature that consults the cache first
+        """
+        @functools.wraps(render)
+        def cached(*args: Any) -> str:
+            return self.get_or_render(
+                kind, fingerprint(kind, *args), lambda: render(*args)
+            )
+        
+        return cached
+    
+    def get_or_render(self, kind: str, key: str, render: Callable[[], str]) -> str:
+        """Return a cached fragment, rendering and storing it on a miss.
+        
+        Args:
+            kind: Fragment kind
+            key: Input fingerprint
+            render: Produces the fragment when it isn't cached
+        
+        Returns:
+            Fragment content
+        """
+        content = self.get(kind, key)
+        if content is not None:
+            with self._lock:
+                self.hits += 1
+            return content
+        
+        content = render()
+        self.put(kind, key, content)
+        with self._lock:
+            self.misses += 1
+        return content
+    
+    def close(self) -> None:
+        """Commit pending entries and close the database."""
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+        logger.debug(f"Render cache: {self.hits} hits, {self.misses} misses")
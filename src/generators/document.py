@@ -0,0 +1,156 @@
+# src/generators/document.py
+"""Format-neutral document tree for generated pages.
+
+Page builders in ``pages.py`` describe each page once as a tree of blocks
+(headings, paragraphs, tables, code blocks, diagrams). Emitters in
+``emitters.py`` serialize the same tree to Markdown, HTML or JSON, so every
+output format shares one metadata walk and one set of escaping rules.
+
+Text stored in the tree is always raw; escaping is the emitter's job.
+"""
+
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Union
+
+from .cache import fingerprint
+
+
+# Inline content
+
+@dataclass
+class Strong:
+    """Emphasized (bold) text."""
+    text: str
+
+
+@dataclass
+class Code:
+    """Inline code span."""
+    text: str
+
+
+@dataclass
+class Link:
+    """Link to another generated page.
+    
+    Attributes:
+        text: Link text
+        target: Page name without extension (e.g. "Table-sales"), resolved
+                to a file name by each emitter. May contain a folder prefix.
+    """
+    text: str
+    target: str
+
+
+Inline = Union[str, Strong, Code, Link]
+
+
+# Blocks
+
+@dataclass
+class Heading:
+    """Section heading (level 1 is the page title)."""
+    text: str
+    level: int = 2
+
+
+@dataclass
+class Paragraph:
+    """Run of inline content."""
+    content: list[Inline]
+
+
+@dataclass
+class Note:
+    """Highlighted aside, rendered as a block quote."""
+    content: list[Inline]
+
+
+@dataclass
+class BulletList:
+    """Unordered list; each item is a run of inline content."""
+    items: list[list[Inline]]
+
+
+@dataclass
+class Table:
+    """Data table.
+    
+    Rows are lists of cells (each an inline run or a single inline), or
+    Sections whose builder returns such a row so it can be cached on its own.
+    """
+    headers: list[str]
+    rows: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class CodeBlock:
+    """Fenced code listing."""
+    code: str
+    language: str = ""
+
+
+@dataclass
+class Diagram:
+    """Diagram source to be rendered by the viewer (e.g. Mermaid)."""
+    source: str
+    kind: str = "mermaid"
+
+
+@dataclass
+class Image:
+    """Image file stored next to the page (e.g. a pre-rendered SVG)."""
+    src: str
+    alt: str = ""
+
+
+@dataclass
+class Rule:
+    """Horizontal separator."""
+
+
+@dataclass(eq=False)
+class Section:
+    """Lazily built, independently cacheable part of a page.
+    
+    The builder runs at most once, however many formats are emitted, and not
+    at all when every emitter finds the section in the render cache.
+    
+    Attributes:
+        kind: Fragment kind used to namespace cache entries
+        inputs: Arguments passed to the builder; also fingerprinted
+        builder: Function returning the section's blocks (or one table row)
+    """
+    kind: str
+    inputs: tuple
+    builder: Callable[..., Any]
+    
+    @functools.cached_property
+    def content(self) -> Any:
+        """Built blocks (or row cells)."""
+        return self.builder(*self.inputs)
+    
+    @functools.cached_property
+    def key(self) -> str:
+        """Fingerprint of the section inputs."""
+        return fingerprint(self.kind, *self.inputs)
+
+
+Block = Union[
+    Heading, Paragraph, Note, BulletList, Table, CodeBlock, Diagram, Image, Rule, Section
+]
+
+
+@dataclass
+class Page:
+    """One generated page.
+    
+    Attributes:
+        name: Page name without extension (e.g. "Home", "Table-sales")
+        title: Human-readable page title
+        blocks: Page body, starting with the title heading
+    """
+    name: str
+    title: str
+    blocks: list[Block]
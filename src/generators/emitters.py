@@ -0,0 +1,326 @@
+# src/generators/emitters.py
+"""Serializers from the document tree to output formats.
+
+Each emitter turns a ``Page`` into the text of one file. Sections are
+serialized on their own so their output can be cached per format and spliced
+into the page.
+"""
+
+import html
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+from ..utils.markdown import create_table_row, format_code_block
+from .cache import RenderCache
+from .document import (
+    Block,
+    BulletList,
+    Code,
+    CodeBlock,
+    Diagram,
+    Heading,
+    Image,
+    Inline,
+    Link,
+    Note,
+    Page,
+    Paragraph,
+    Rule,
+    Section,
+    Strong,
+    Table,
+)
+
+
+class Emitter(ABC):
+    """Base class for document tree serializers.
+    
+    Attributes:
+        name: Format name (e.g. "markdown")
+        extension: File extension including the dot
+        cache: Optional render cache for Section output
+    """
+    
+    name: str
+    extension: str
+    
+    def __init__(self, cache: RenderCache | None = None):
+        self.cache = cache
+    
+    def emit(self, page: Page) -> str:
+        """Serialize a complete page."""
+        parts = [self._section_or_block(block) for block in page.blocks]
+        return self.document(page, [p for p in parts if p])
+    
+    def page_file(self, page_name: str) -> str:
+        """File name for a page in this format."""
+        return f"{page_name}{self.extension}"
+    
+    def read_title(self, content: str) -> str | None:
+        """Read the title back from a page written in this format."""
+        return None
+    
+    @abstractmethod
+    def document(self, page: Page, parts: list[str]) -> str:
+        """Assemble serialized top-level blocks into the final file."""
+        pass
+    
+    @abstractmethod
+    def block(self, block: Block) -> str:
+        """Serialize one non-section block."""
+        pass
+    
+    @abstractmethod
+    def join(self, parts: list[str]) -> str:
+        """Join serialized sibling blocks."""
+        pass
+    
+    @abstractmethod
+    def row(self, cells: list[Any]) -> str:
+        """Serialize one table row."""
+        pass
+    
+    def _section_or_block(self, block: Block) -> str:
+        if isinstance(block, Section):
+            return self._cached(block, lambda: self.join(
+                [p for p in (self._section_or_block(b) for b in block.content) if p]
+            ))
+        return self.block(block)
+    
+    def _row(self, row: Any) -> str:
+        if isinstance(row, Section):
+            return self._cached(row, lambda: self.row(row.content))
+        return self.row(row)
+    
+    def _cached(self, section: Section, serialize) -> str:
+        if self.cache is None:
+            return serialize()
+        return self.cache.get_or_render(f"{self.name}:{section.kind}", section.key, serialize)
+
+
+class MarkdownEmitter(Emitter):
+    """GitHub-flavored Markdown with Mermaid code fences."""
+    
+    name = "markdown"
+    extension = ".md"
+    
+    def document(self, page: Page, parts: list[str]) -> str:
+        return "\n\n".join(parts) + "\n"
+    
+    def read_title(self, content: str) -> str | None:
+        first_line = content.split("\n", 1)[0]
+        return first_line[2:] if first_line.startswith("# ") else None
+    
+    def join(self, parts: list[str]) -> str:
+        return "\n\n".join(parts)
+    
+    def block(self, block: Block) -> str:
+        if isinstance(block, Heading):
+            return f"{'#' * block.level} {block.text}"
+        if isinstance(block, Paragraph):
+            return self.inline(block.content)
+        if isinstance(block, Note):
+            return f"> {self.inline(block.content)}"
+        if isinstance(block, BulletList):
+            return "\n".join(f"- {self.inline(item)}" for item in block.items)
+        if isinstance(block, Table):
+            header = create_table_row(block.headers)
+            separator = "|" + "|".join("-" * (len(h) + 2) for h in block.headers) + "|"
+            return "\n".join([header, separator] + [self._row(r) for r in block.rows])
+        if isinstance(block, CodeBlock):
+            return format_code_block(block.code, block.language)
+        if isinstance(block, Diagram):
+            return format_code_block(block.source, block.kind)
+        if isinstance(block, Image):
+            return f"![{block.alt}]({block.src})"
+        if isinstance(block, Rule):
+            return "---"
+        raise TypeError(f"Unsupported block: {type(block).__name__}")
+    
+    def row(self, cells: list[Any]) -> str:
+        return create_table_row([self.inline(cell, in_table=True) for cell in cells])
+    
+    def inline(self, content: Inline | list[Inline], in_table: bool = False) -> str:
+        """Serialize inline content; table cells also escape pipes."""
+        if not isinstance(content, list):
+            content = [content]
+        
+        def esc(text: str) -> str:
+            return text.replace("|", "\\|") if in_table else text
+        
+        out = []
+        for item in content:
+            if isinstance(item, Strong):
+                out.append(f"**{esc(item.text)}**")
+            elif isinstance(item, Code):
+                out.append(f"`{esc(item.text)}`")
+            elif isinstance(item, Link):
+                out.append(f"[{esc(item.text)}]({self.page_file(item.target)})")
+            else:
+                out.append(esc(str(item)))
+        return "".join(out)
+
+
+class HtmlEmitter(Emitter):
+    """Standalone HTML pages; Mermaid diagrams are rendered client-side."""
+    
+    name = "html"
+    extension = ".html"
+    
+    MERMAID_SCRIPT = (
+        '<script type="module">'
+        'import mermaid from "https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.esm.min.mjs";'
+        "mermaid.initialize({startOnLoad: true});"
+        "</script>"
+    )
+    
+    def document(self, page: Page, parts: list[str]) -> str:
+        body = "\n".join(parts)
+        script = f"\n{self.MERMAID_SCRIPT}" if 'class="mermaid"' in body else ""
+        return (
+            "<!DOCTYPE html>\n"
+            f'<html>\n<head>\n<meta charset="utf-8">\n<title>{html.escape(page.title)}</title>\n</head>\n'
+            f"<body>\n{body}{script}\n</body>\n</html>\n"
+        )
+    
+    def read_title(self, content: str) -> str | None:
+        start = content.find("<title>")
+        end = content.find("</title>", start)
+        if start == -1 or end == -1:
+            return None
+        return html.unescape(content[start + len("<title>"):end])
+    
+    def join(self, parts: list[str]) -> str:
+        return "\n".join(parts)
+    
+    def block(self, block: Block) -> str:
+        if isinstance(block, Heading):
+            return f"<h{block.level}>{html.escape(block.text)}</h{block.level}>"
+        if isinstance(block, Paragraph):
+            return f"<p>{self.inline(block.content)}</p>"
+        if isinstance(block, Note):
+            return f"<blockquote>{self.inline(block.content)}</blockquote>"
+        if isinstance(block, BulletList):
+            items = "".join(f"<li>{self.inline(item)}</li>" for item in block.items)
+            return f"<ul>{items}</ul>"
+        if isinstance(block, Table):
+            head = "".join(f"<th>{html.escape(h)}</th>" for h in block.headers)
+            rows = "\n".join(self._row(r) for r in block.rows)
+            return f"<table>\n<thead><tr>{head}</tr></thead>\n<tbody>\n{rows}\n</tbody>\n</table>"
+        if isinstance(block, CodeBlock):
+            lang = f' class="language-{html.escape(block.language)}"' if block.language else ""
+            return f"<pre><code{lang}>{html.escape(block.code)}</code></pre>"
+        if isinstance(block, Diagram):
+            return f'<pre class="{html.escape(block.kind)}">{html.escape(block.source)}</pre>'
+        if isinstance(block, Image):
+            return f'<img src="{html.escape(block.src)}" alt="{html.escape(block.alt)}">'
+        if isinstance(block, Rule):
+            return "<hr>"
+        raise TypeError(f"Unsupported block: {type(block).__name__}")
+    
+    def row(self, cells: list[Any]) -> str:
+        return "<tr>" + "".join(f"<td>{self.inline(c)}</td>" for c in cells) + "</tr>"
+    
+    def inline(self, content: Inline | list[Inline]) -> str:
+        """Serialize inline content with HTML escaping."""
+        if not isinstance(content, list):
+            content = [content]
+        out = []
+        for item in content:
+            if isinstance(item, Strong):
+                out.append(f"<strong>{html.escape(item.text)}</strong>")
+            elif isinstance(item, Code):
+                out.append(f"<code>{html.escape(item.text)}</code>")
+            elif isinstance(item, Link):
+                href = html.escape(self.page_file(item.target))
+                out.append(f'<a href="{href}">{html.escape(item.text)}</a>')
+            else:
+                out.append(html.escape(str(item)))
+        return "".join(out)
+
+
+class JsonEmitter(Emitter):
+    """Machine-readable JSON; one object per page with typed blocks."""
+    
+    name = "json"
+    extension = ".json"
+    
+    def document(self, page: Page, parts: list[str]) -> str:
+        header = json.dumps({"name": page.name, "title": page.title}, ensure_ascii=False)
+        return f'{header[:-1]}, "blocks": [{", ".join(parts)}]}}\n'
+    
+    def read_title(self, content: str) -> str | None:
+        try:
+            return json.loads(content).get("title")
+        except (ValueError, AttributeError):
+            return None
+    
+    def join(self, parts: list[str]) -> str:
+        return ", ".join(parts)
+    
+    def block(self, block: Block) -> str:
+        if isinstance(block, Table):
+            # Rows are serialized one by one so cached rows can be spliced in
+            headers = json.dumps(block.headers, ensure_ascii=False)
+            rows = ", ".join(self._row(r) for r in block.rows)
+            return f'{{"type": "table", "headers": {headers}, "rows": [{rows}]}}'
+        return json.dumps(self._block_data(block), ensure_ascii=False)
+    
+    def row(self, cells: list[Any]) -> str:
+        return json.dumps([self._inline_data(c) for c in cells], ensure_ascii=False)
+    
+    def _block_data(self, block: Block) -> dict:
+        if isinstance(block, Heading):
+            return {"type": "heading", "level": block.level, "text": block.text}
+        if isinstance(block, (Paragraph, Note)):
+            kind = "paragraph" if isinstance(block, Paragraph) else "note"
+            return {"type": kind, "content": self._inline_data(block.content)}
+        if isinstance(block, BulletList):
+            return {"type": "list", "items": [self._inline_data(i) for i in block.items]}
+        if isinstance(block, CodeBlock):
+            return {"type": "code", "language": block.language, "code": block.code}
+        if isinstance(block, Diagram):
+            return {"type": "diagram", "kind": block.kind, "source": block.source}
+        if isinstance(block, Image):
+            return {"type": "image", "src": block.src, "alt": block.alt}
+        if isinstance(block, Rule):
+            return {"type": "rule"}
+        raise TypeError(f"Unsupported block: {type(block).__name__}")
+    
+    def _inline_data(self, content: Inline | list[Inline]) -> Any:
+        if isinstance(content, list):
+            return [self._inline_data(c) for c in content]
+        if isinstance(content, Strong):
+            return {"strong": content.text}
+        if isinstance(content, Code):
+            return {"code": content.text}
+        if isinstance(content, Link):
+            return {"link": content.text, "target": content.target}
+        return str(content)
+
+
+EMITTERS: dict[str, type[Emitter]] = {
+    "markdown": MarkdownEmitter,
+    "html": HtmlEmitter,
+    "json": JsonEmitter,
+}
+
+
+def get_emitter(name: str, cache: RenderCache | None = None) -> Emitter:
+    """Create an emitter by format name.
+    
+    Args:
+        name: Format name ("markdown", "html" or "json")
+        cache: Optional render cache for section output
+    
+    Returns:
+        Emitter instance
+    
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if name not in EMITTERS:
+        available = ", ".join(EMITTERS)
+        raise ValueError(f"Unknown output format: {name}. Available formats: {available}")
+    return EMITTERS[name](cache)
@@ -0,0 +1,178 @@
+# src/generators/graph.py
+"""Relationship graph utilities.
+
+Builds an undirected adjacency index over model relationships once, so
+diagram generation can split the model into connected components and
+extract neighborhoods without rescanning the relationship list.
+"""
+
+import re
+from collections import deque
+
+from ..mcp_client.pbixray_tools import Relationship
+
+
+_AUTO_DATE_PATTERN = re.compile(r"^(LocalDateTable|DateTableTemplate)(_[0-9a-fA-F-]+)?$")
+
+
+def is_auto_date_table(name: str) -> bool:
+    """Check whether a table is one of Power BI's auto date/time tables."""
+    return bool(_AUTO_DATE_PATTERN.match(name))
+
+
+class RelationshipGraph:
+    """Undirected adjacency index over model relationships.
+    
+    Relationships with an empty table name are ignored. Tables that only
+    appear in relationships are added as nodes.
+    
+    Attributes:
+        tables: All table names, in model order
+        relationships: Valid relationships, in model order
+        auto_date_tables: Names of Power BI auto date/time tables
+    """
+    
+    def __init__(self, relationships: list[Relationship], tables: list[str]):
+        self.tables: list[str] = list(dict.fromkeys(tables))
+        self.relationships: list[Relationship] = []
+        self._adjacency: dict[str, list[int]] = {name: [] for name in self.tables}
+        
+        for rel in relationships:
+            if not rel.from_table or not rel.to_table:
+                continue
+            index = len(self.relationships)
+            self.relationships.append(rel)
+            for name in (rel.from_table, rel.to_table):
+                if name not in self._adjacency:
+                    self._adjacency[name] = []
+                    self.tables.append(name)
+            self._adjacency[rel.from_table].append(index)
+            if rel.to_table != rel.from_table:
+                self._adjacency[rel.to_table].append(index)
+        
+        self.auto_date_tables: set[str] = {
+            name for name in self.tables if is_auto_date_table(name)
+        }
+    
+    def auto_date_owners(self) -> dict[str, list[tuple[str, str]]]:
+        """Map each auto date/time table to the (table, column) pairs using it.
+        
+        Templates and unused copies map to an empty list.
+        """
+        owners: dict[str, list[tuple[str, str]]] = {
+            name: [] for name in self.tables if name in self.auto_date_tables
+        }
+        for rel in self.relationships:
+            if rel.to_table in owners and rel.from_table not in owners:
+                owners[rel.to_table].append((rel.from_table, rel.from_column))
+        return owners
+    
+    def edges(self, table: str) -> list[Relationship]:
+        """Relationships touching a table."""
+        return [self.relationships[i] for i in self._adjacency.get(table, [])]
+    
+    def neighbors(self, table: str) -> list[str]:
+        """Tables directly related to a table, in relationship order."""
+        seen: dict[str, None] = {}
+        for rel in self.edges(table):
+            other = rel.to_table if rel.from_table == table else rel.from_table
+            if other != table:
+                seen[other] = None
+        return list(seen)
+    
+    def degree(self, table: str) -> int:
+        """Number of relationships touching a table."""
+        return len(self._adjacency.get(table, []))
+    
+    def components(self, exclude: set[str] | None = None) -> list[list[str]]:
+        """Split the graph into connected components in O(V + E).
+        
+        Args:
+            exclude: Tables to leave out of the graph entirely
+        
+        Returns:
+            Components (lists of table names in BFS order), largest first
+        """
+        exclude = exclude or set()
+        visited = set(exclude)
+        components = []
+        
+        for start in self.tables:
+            if start in visited:
+                continue
+            visited.add(start)
+            component = []
+            queue = deque([start])
+            while queue:
+                table = queue.popleft()
+                component.append(table)
+                for other in self.neighbors(table):
+                    if other not in visited:
+                        visited.add(other)
+                        queue.append(other)
+            components.append(component)
+        
+        # Stable sort keeps model order among equally sized components
+        components.sort(key=len, reverse=True)
+        return components
+    
+    def subgraph_edges(self, tables: set[str]) -> list[Relationship]:
+        """Relationships with both ends inside a set of tables, in model order."""
+        indices = {
+            i
+            for table in tables
+            for i in self._adjacency.get(table, [])
+        }
+        return [
+            self.relationships[i]
+            for i in sorted(indices)
+            if self.relationships[i].from_table in tables
+            and self.relationships[i].to_table in tables
+        ]
+    
+    def neighborhood(
+        self,
+        table: str,
+        hops: int = 1,
+        max_tables: int | None = None,
+        exclude: set[str] | None = None
+    ) -> tuple[list[str], list[Relationship], bool]:
+        """Collect the tables within ``hops`` relationships of a table.
+        
+        Only the edges of the collected tables are scanned, so a diagram
+        costs time in proportion to what it shows rather than to the model.
+        
+        Args:
+            table: Center table
+            hops: Maximum distance from the center table
+            max_tables: Stop collecting once this many tables were found
+            exclude: Tables to leave out (unless they are the center)
+        
+        Returns:
+            Tuple of (tables in BFS order, every relationship between them in
+            model order, whether the neighborhood was cut off by ``max_tables``)
+        """
+        exclude = exclude or set()
+        depth = {table: 0}
+        truncated = False
+        queue = deque([table])
+        
+        while queue:
+            current = queue.popleft()
+            if depth[current] >= hops:
+                continue
+            for i in self._adjacency.get(current, []):
+                rel = self.relationships[i]
+                other = rel.to_table if rel.from_table == current else rel.from_table
+                if other in exclude and other != table:
+                    continue
+                if other not in depth:
+                    if max_tables is not None and len(depth) >= max_tables:
+                        truncated = True
+                        continue
+                    depth[other] = depth[current] + 1
+                    queue.append(other)
+        
+        # Include edges between tables of the outer ring, which the search
+        # above never scans
+        return list(depth), self.subgraph_edges(set(depth)), truncated
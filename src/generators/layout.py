@@ -0,0 +1,304 @@
+# src/generators/layout.py
+"""Layered (Sugiyama-style) layout of the relationship graph.
+
+Browsers lay out Mermaid diagrams on every page view, which gets slow for
+models with hundreds of tables. This module computes the layout once at build
+time, in pure Python, and renders it as a static SVG:
+
+1. Break cycles by reversing DFS back edges
+2. Assign layers by longest path, so fact tables sit above their dimensions
+3. Split edges spanning several layers with dummy nodes
+4. Reduce crossings with alternating barycenter sweeps
+5. Place nodes left to right within each layer and center the layers
+"""
+
+import html
+from collections import deque
+from dataclasses import dataclass, field
+
+from ..mcp_client.pbixray_tools import Relationship
+from .graph import RelationshipGraph
+
+
+NODE_HEIGHT = 28
+LAYER_GAP = 90
+NODE_GAP = 24
+MARGIN = 20
+CHAR_WIDTH = 7
+DUMMY_WIDTH = 8
+
+
+@dataclass
+class LayoutNode:
+    """Positioned node; (x, y) is the top-left corner."""
+    name: str
+    layer: int
+    width: float
+    x: float = 0.0
+    y: float = 0.0
+    dummy: bool = False
+
+
+@dataclass
+class LayoutEdge:
+    """Relationship routed through the layers as a polyline."""
+    relationship: Relationship
+    points: list[tuple[float, float]] = field(default_factory=list)
+
+
+@dataclass
+class GraphLayout:
+    """Result of ``layered_layout``.
+    
+    Attributes:
+        nodes: Table nodes by name (dummy nodes are not included)
+        edges: Routed relationships
+        width: Drawing width
+        height: Drawing height
+    """
+    nodes: dict[str, LayoutNode]
+    edges: list[LayoutEdge]
+    width: float
+    height: float
+
+
+def layered_layout(
+    graph: RelationshipGraph,
+    exclude: set[str] | None = None,
+    sweeps: int = 8
+) -> GraphLayout:
+    """Compute a layered layout of all related tables.
+    
+    Args:
+        graph: Adjacency index of the model
+        exclude: Tables to leave out (e.g. auto date/time tables)
+        sweeps: Number of barycenter passes (alternating down and up)
+    
+    Returns:
+        Layout of every table with at least one drawn relationship
+    """
+    exclude = exclude or set()
+    relationships = [
+        r for r in graph.relationships
+        if r.from_table != r.to_table
+        and r.from_table not in exclude
+        and r.to_table not in exclude
+    ]
+    
+    # Initial order follows the connected components, so each stays together
+    order = [
+        t
+        for component in graph.components(exclude)
+        for t in component
+    ]
+    related = {t for r in relationships for t in (r.from_table, r.to_table)}
+    tables = [t for t in order if t in related]
+    
+    # Edges point from the many side (facts) to the one side (dimensions)
+    succ: dict[str, list[str]] = {t: [] for t in tables}
+    for r in relationships:
+        succ[r.from_table].append(r.to_table)
+    reversed_edges = _back_edges(tables, succ)
+    
+    directed = []
+    for r in relationships:
+        u, v = r.from_table, r.to_table
+        if (u, v) in reversed_edges:
+            u, v = v, u
+        directed.append((u, v, r))
+    
+    layer = _longest_path_layers(tables, [(u, v) for u, v, _ in directed])
+    
+    # Split long edges into unit-length segments through dummy nodes
+    nodes = {t: LayoutNode(t, layer[t], _node_width(t)) for t in tables}
+    up: dict[str, list[str]] = {t: [] for t in tables}
+    down: dict[str, list[str]] = {t: [] for t in tables}
+    chains: list[tuple[Relationship, list[str], bool]] = []
+    for i, (u, v, r) in enumerate(directed):
+        chain = [u]
+        for k in range(layer[u] + 1, layer[v]):
+            name = f"\0{i}:{k}"
+            nodes[name] = LayoutNode(name, k, DUMMY_WIDTH, dummy=True)
+            up[name], down[name] = [], []
+            chain.append(name)
+        chain.append(v)
+        for a, b in zip(chain, chain[1:]):
+            down[a].append(b)
+            up[b].append(a)
+        chains.append((r, chain, u != r.from_table))
+    
+    layers: list[list[str]] = [[] for _ in range(max(layer.values(), default=-1) + 1)]
+    for name, node in nodes.items():
+        layers[node.layer].append(name)
+    
+    _reduce_crossings(layers, up, down, sweeps)
+    width, height = _assign_coordinates(layers, nodes)
+    
+    edges = []
+    for r, chain, flipped in chains:
+        points = []
+        for i, name in enumerate(chain):
+            node = nodes[name]
+            cx = node.x + node.width / 2
+            if node.dummy:
+                points.append((cx, node.y + NODE_HEIGHT / 2))
+            else:
+                # Leave the upper table at its bottom, enter the lower at its top
+                points.append((cx, node.y + (NODE_HEIGHT if i == 0 else 0)))
+        if flipped:
+            points.reverse()
+        edges.append(LayoutEdge(r, points))
+    
+    return GraphLayout(
+        {t: nodes[t] for t in tables},
+        edges,
+        width,
+        height,
+    )
+
+
+def render_svg(layout: GraphLayout, title: str = "Entity Relationship Layout") -> str:
+    """Render a layout as a standalone SVG document.
+    
+    Inactive relationships are drawn dashed; hovering an edge shows the
+    columns it joins.
+    """
+    width = round(layout.width)
+    height = round(layout.height)
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="12">',
+        f"<title>{html.escape(title)}</title>",
+        "<style>"
+        ".rel{fill:none;stroke:#888;stroke-width:1.2}"
+        ".inactive{stroke-dasharray:4 3}"
+        ".table rect{fill:#eef3fb;stroke:#4a6fa5;rx:4}"
+        "</style>",
+        '<g class="relationships">',
+    ]
+    for edge in layout.edges:
+        r = edge.relationship
+        points = " ".join(f"{x:.1f},{y:.1f}" for x, y in edge.points)
+        css = "rel" if r.is_active else "rel inactive"
+        label = html.escape(
+            f"{r.from_table}[{r.from_column}] → {r.to_table}[{r.to_column}]"
+        )
+        lines.append(f'<polyline class="{css}" points="{points}"><title>{label}</title></polyline>')
+    lines.append("</g>")
+    
+    lines.append('<g class="tables">')
+    for node in layout.nodes.values():
+        name = html.escape(node.name)
+        lines.append(
+            f'<g class="table"><rect x="{node.x:.1f}" y="{node.y:.1f}" '
+            f'width="{node.width:.1f}" height="{NODE_HEIGHT}"/>'
+            f'<text x="{node.x + node.width / 2:.1f}" y="{node.y + NODE_HEIGHT / 2 + 4:.1f}" '
+            f'text-anchor="middle">{name}</text></g>'
+        )
+    lines.append("</g>")
+    lines.append("</svg>")
+    return "\n".join(lines) + "\n"
+
+
+def _node_width(name: str) -> float:
+    """Estimated box width for a table name."""
+    return max(60, len(name) * CHAR_WIDTH + 20)
+
+
+def _back_edges(
+    tables: list[str],
+    succ: dict[str, list[str]]
+) -> set[tuple[str, str]]:
+    """Find edges whose reversal makes the graph acyclic (iterative DFS)."""
+    state: dict[str, int] = {}  # 1 = on stack, 2 = done
+    back = set()
+    for root in tables:
+        if root in state:
+            continue
+        state[root] = 1
+        stack = [(root, iter(succ[root]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if state.get(child) == 1:
+                    back.add((node, child))
+                elif child not in state:
+                    state[child] = 1
+                    stack.append((child, iter(succ[child])))
+                    break
+            else:
+                state[node] = 2
+                stack.pop()
+    return back
+
+
+def _longest_path_layers(
+    tables: list[str],
+    edges: list[tuple[str, str]]
+) -> dict[str, int]:
+    """Layer each node one below its deepest predecessor (Kahn's algorithm)."""
+    succ: dict[str, list[str]] = {t: [] for t in tables}
+    indegree = {t: 0 for t in tables}
+    for u, v in edges:
+        succ[u].append(v)
+        indegree[v] += 1
+    
+    layer = {t: 0 for t in tables}
+    queue = deque(t for t in tables if indegree[t] == 0)
+    while queue:
+        u = queue.popleft()
+        for v in succ[u]:
+            layer[v] = max(layer[v], layer[u] + 1)
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                queue.append(v)
+    return layer
+
+
+def _reduce_crossings(
+    layers: list[list[str]],
+    up: dict[str, list[str]],
+    down: dict[str, list[str]],
+    sweeps: int
+) -> None:
+    """Reorder layers in place by the barycenter of neighboring positions."""
+    
+    def reorder(layer: list[str], neighbors: dict[str, list[str]], pos: dict[str, int]) -> None:
+        keys = {}
+        for i, name in enumerate(layer):
+            adjacent = neighbors[name]
+            # Nodes without neighbors on that side keep their position
+            keys[name] = sum(pos[n] for n in adjacent) / len(adjacent) if adjacent else i
+        layer.sort(key=keys.__getitem__)
+    
+    for sweep in range(sweeps):
+        if sweep % 2 == 0:
+            indices, neighbors, offset = range(1, len(layers)), up, -1
+        else:
+            indices, neighbors, offset = range(len(layers) - 2, -1, -1), down, 1
+        for i in indices:
+            pos = {name: p for p, name in enumerate(layers[i + offset])}
+            reorder(layers[i], neighbors, pos)
+
+
+def _assign_coordinates(
+    layers: list[list[str]],
+    nodes: dict[str, LayoutNode]
+) -> tuple[float, float]:
+    """Place nodes left to right in each layer and center layers horizontally."""
+    widths = [
+        sum(nodes[n].width for n in layer) + NODE_GAP * max(len(layer) - 1, 0)
+        for layer in layers
+    ]
+    total = max(widths, default=0)
+    
+    for i, layer in enumerate(layers):
+        x = MARGIN + (total - widths[i]) / 2
+        for name in layer:
+            node = nodes[name]
+            node.x = x
+            node.y = MARGIN + i * (NODE_HEIGHT + LAYER_GAP)
+            x += node.width + NODE_GAP
+    
+    height = len(layers) * NODE_HEIGHT + max(len(layers) - 1, 0) * LAYER_GAP
+    return total + 2 * MARGIN, height + 2 * MARGIN
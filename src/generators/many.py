@@ -0,0 +1,142 @@
+# src/generators/many.py
+"""Library API for documenting many models concurrently.
+
+``document_many`` fans a stream of sources out over warm engines and one
+shared ``WikiGenerator`` (with its render pool, writer and render cache) and
+yields each model's result as soon as it is done::
+    
+    async for result in document_many(sources, concurrency=8, generator=gen):
+        if not result.ok:
+            print(result.source, result.error)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterable
+
+from ..engines import EnginePool, ModelMetadata
+from .wiki_generator import WikiGenerator
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelResult:
+    """Outcome of documenting one model.
+    
+    Attributes:
+        source: Model source
+        name: Display name of the model
+        ok: Whether documentation was generated
+        metadata: Extracted metadata (None if extraction failed)
+        pages: Paths of the files written, relative to the documentation root
+        extract_seconds: Time spent loading and extracting the model
+        render_seconds: Time spent rendering and writing its pages
+        error: Error message if the model failed
+    """
+    source: str
+    name: str
+    ok: bool
+    metadata: ModelMetadata | None = None
+    pages: list[str] = field(default_factory=list)
+    extract_seconds: float = 0.0
+    render_seconds: float = 0.0
+    error: str | None = None
+    
+    @property
+    def seconds(self) -> float:
+        """Total time spent on the model."""
+        return self.extract_seconds + self.render_seconds
+
+
+async def document_many(
+    sources: Iterable[str],
+    concurrency: int = 4,
+    engine_type: str = "pbixray",
+    engine_kwargs: dict[str, Any] | None = None,
+    generator: WikiGenerator | None = None,
+    pool: EnginePool | None = None
+) -> AsyncIterator[ModelResult]:
+    """Document models concurrently, yielding results in completion order.
+    
+    Sources are consumed lazily, so at most ``concurrency`` models are in
+    flight no matter how many are passed. A failing model is yielded as a
+    failed result; the others carry on. Closing the iterator early cancels
+    the models still in flight.
+    
+    Args:
+        sources: Model sources (PBIX files, PBIP folders, connection strings)
+        concurrency: Maximum number of models documented at once
+        engine_type: Documentation engine to use
+        engine_kwargs: Engine-specific configuration options
+        generator: Generator writing the pages (default: one writing to
+                   ``./docs``, closed when iteration ends)
+        pool: Warm engines to extract with (default: a pool of
+              ``concurrency`` engines, closed when iteration ends)
+    
+    Yields:
+        One result per source
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    own_generator = generator is None
+    own_pool = pool is None
+    generator = generator or WikiGenerator("docs")
+    pool = pool or EnginePool(max_engines=concurrency)
+    
+    async def document(source: str) -> ModelResult:
+        name = generator.resolve_model_name(source)
+        start = time.perf_counter()
+        try:
+            metadata = await pool.extract(
+                source, engine_type, engine_kwargs, generator.metadata_parts()
+            )
+        except Exception as e:
+            logger.error(f"Failed to extract {source}: {e}")
+            return ModelResult(
+                source, name, False,
+                extract_seconds=time.perf_counter() - start,
+                error=str(e) or type(e).__name__,
+            )
+        extracted = time.perf_counter()
+        try:
+            pages = await generator.render(metadata, name)
+        except Exception as e:
+            logger.error(f"Failed to document {source}: {e}")
+            return ModelResult(
+                source, name, False, metadata,
+                extract_seconds=extracted - start,
+                render_seconds=time.perf_counter() - extracted,
+                error=str(e) or type(e).__name__,
+            )
+        return ModelResult(
+            source, name, True, metadata, pages,
+            extract_seconds=extracted - start,
+            render_seconds=time.perf_counter() - extracted,
+        )
+    
+    remaining = iter(sources)
+    running: set[asyncio.Task] = set()
+    try:
+        while True:
+            while len(running) < concurrency:
+                source = next(remaining, None)
+                if source is None:
+                    break
+                running.add(asyncio.create_task(document(source)))
+            if not running:
+                return
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        if own_pool:
+            await pool.close()
+        if own_generator:
+            generator.close()
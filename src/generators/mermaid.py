@@ -1,5 +1,47 @@
 # src/generators/mermaid.py
+from dataclasses import dataclass, field
+
 from ..mcp_client.pbixray_tools import Relationship
+from .graph import RelationshipGraph
+
+
+# Mermaid's default maxTextSize is 50,000 characters
+DEFAULT_MAX_DIAGRAM_CHARS = 40_000
+DEFAULT_MAX_DIAGRAM_TABLES = 60
+
+
+@dataclass
+class ERDiagram:
+    """One Mermaid ER diagram covering a connected part of the model.
+    
+    Attributes:
+        title: Diagram heading (named after the most connected table)
+        tables: All tables in the connected component
+        source: Mermaid source
+        summarized: Whether the diagram only shows the most connected tables
+            because the full component exceeded the size budget
+        connections: Table to related tables, for summarized diagrams
+    """
+    title: str
+    tables: list[str]
+    source: str
+    summarized: bool = False
+    connections: dict[str, list[str]] = field(default_factory=dict)
+
+
+@dataclass
+class ERLayout:
+    """Relationship diagrams split by connected component and subject area.
+    
+    Attributes:
+        diagrams: One diagram per component with two or more tables
+        standalone_tables: Tables without relationships
+        auto_date_tables: Power BI auto date/time tables, kept out of the
+            diagrams, with the (table, column) pairs that use them
+    """
+    diagrams: list[ERDiagram]
+    standalone_tables: list[str]
+    auto_date_tables: dict[str, list[tuple[str, str]]]
 
 
 def generate_er_diagram(
@@ -49,3 +91,134 @@ def _sanitize_name(name: str) -> str:
     # Remove other problematic characters
     sanitized = "".join(c for c in sanitized if c.isalnum() or c == "_")
     return sanitized
+
+
+def plan_er_diagrams(
+    relationships: list[Relationship],
+    tables: list[str],
+    max_tables: int = DEFAULT_MAX_DIAGRAM_TABLES,
+    max_chars: int = DEFAULT_MAX_DIAGRAM_CHARS,
+    graph: RelationshipGraph | None = None
+) -> ERLayout:
+    """Split the relationship graph into per-component ER diagrams.
+    
+    Auto date/time tables are separated into their own subject area and
+    tables without relationships are listed instead of drawn. Each remaining
+    connected component gets its own diagram; a component over the table or
+    character budget is drawn as a summary of its most connected tables.
+    
+    Args:
+        relationships: All relationships in the model
+        tables: All table names in the model
+        max_tables: Maximum number of tables drawn in one diagram
+        max_chars: Maximum Mermaid source length of one diagram
+        graph: Prebuilt adjacency index (built from the arguments if omitted)
+    
+    Returns:
+        Diagram layout for the Relationships page
+    """
+    graph = graph or RelationshipGraph(relationships, tables)
+    
+    auto_date = graph.auto_date_owners()
+    
+    diagrams = []
+    standalone = []
+    for component in graph.components(exclude=set(auto_date)):
+        if len(component) == 1 and not graph.subgraph_edges(set(component)):
+            standalone.append(component[0])
+            continue
+        diagrams.append(_component_diagram(graph, component, max_tables, max_chars))
+    
+    return ERLayout(diagrams, standalone, auto_date)
+
+
+def neighborhood_diagram(
+    graph: RelationshipGraph,
+    table: str,
+    hops: int = 1,
+    max_tables: int = DEFAULT_MAX_DIAGRAM_TABLES
+) -> ERDiagram | None:
+    """Build the ER diagram of a table's k-hop neighborhood.
+    
+    Auto date/time tables are left out unless the table is one itself.
+    
+    Args:
+        graph: Adjacency index of the model
+        table: Center table
+        hops: Number of relationship hops to include
+        max_tables: Maximum number of tables drawn
+    
+    Returns:
+        Diagram (``summarized`` when the neighborhood was cut off), or None
+        if the table has no relationships
+    """
+    tables, edges, truncated = graph.neighborhood(
+        table, hops, max_tables, exclude=graph.auto_date_tables
+    )
+    if not edges:
+        return None
+    return ERDiagram(table, tables, _render_edges(edges), summarized=truncated)
+
+
+def _component_diagram(
+    graph: RelationshipGraph,
+    component: list[str],
+    max_tables: int,
+    max_chars: int
+) -> ERDiagram:
+    """Build the diagram for one component, summarizing it if over budget."""
+    members = set(component)
+    hub = max(component, key=graph.degree)
+    title = f"{hub} ({len(component)} tables)"
+    
+    if len(component) <= max_tables:
+        source = _render_edges(graph.subgraph_edges(members))
+        if len(source) <= max_chars:
+            return ERDiagram(title, component, source)
+    
+    # Summarize: keep the most connected tables and collapse parallel edges
+    ranked = sorted(component, key=graph.degree, reverse=True)
+    keep = min(max_tables, len(ranked))
+    while True:
+        shown = set(ranked[:keep])
+        source = _render_summary(graph.subgraph_edges(shown))
+        if len(source) <= max_chars or keep <= 2:
+            break
+        keep //= 2
+    
+    connections = {
+        table: [t for t in graph.neighbors(table) if t in members]
+        for table in component
+    }
+    return ERDiagram(title, component, source, summarized=True, connections=connections)
+
+
+def _render_edges(relationships: list[Relationship]) -> str:
+    """Render relationships as a Mermaid erDiagram."""
+    lines = ["erDiagram"]
+    for rel in relationships:
+        cardinality = "||--o{" if rel.is_active else "||..o{"
+        lines.append(
+            f'    {_sanitize_name(rel.to_table)} '
+            f'{cardinality} '
+            f'{_sanitize_name(rel.from_table)} : '
+            f'"{rel.from_column}"'
+        )
+    return "\n".join(lines)
+
+
+def _render_summary(relationships: list[Relationship]) -> str:
+    """Render relationships with one edge per table pair and a count label."""
+    pairs: dict[tuple[str, str], list[Relationship]] = {}
+    for rel in relationships:
+        pairs.setdefault((rel.to_table, rel.from_table), []).append(rel)
+    
+    lines = ["erDiagram"]
+    for (to_table, from_table), rels in pairs.items():
+        cardinality = "||--o{" if any(r.is_active for r in rels) else "||..o{"
+        label = rels[0].from_column if len(rels) == 1 else f"{len(rels)} relationships"
+        lines.append(
+            f'    {_sanitize_name(to_table)} {cardinality} '
+            f'{_sanitize_name(from_table)} : "{label}"'
+        )
+    return "\n".join(lines)
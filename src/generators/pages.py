@@ -1,144 +1,406 @@
 # src/generators/pages.py
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from ..mcp_client.pbixray_tools import Table, Measure, Relationship
+from typing import Any
 
+from ..mcp_client.pbixray_tools import Column, Table, Measure, Relationship
+from . import document as doc
+from .document import Page, Section, Strong, Code, Link
+from .cache import fingerprint
+from .emitters import MarkdownEmitter
+from .mermaid import ERDiagram, ERLayout
 
-def generate_home_page(
+
+# Column keys that name the owning table rather than describe the column
+_TABLE_NAME_KEYS = {"TableName", "tableName", "table_name", "Table"}
+
+
+@dataclass
+class SharedTableGroup:
+    """Structurally identical auto date/time tables documented on one page.
+    
+    Attributes:
+        page: Shared page name
+        tables: Member tables, in model order
+        owners: Member table name to the (table, column) pairs using it
+    """
+    page: str
+    tables: list[Table]
+    owners: dict[str, list[tuple[str, str]]]
+    
+    @property
+    def title(self) -> str:
+        return f"Auto Date Table ({len(self.tables)} copies)"
+
+
+def build_home_page(
     model_name: str,
     summary: dict,
     tables: list[Table],
-    measures: list[Measure]
-) -> str:
-    """Generate the wiki home page."""
+    measures: list[Measure],
+    shared_tables: list[SharedTableGroup] | None = None
+) -> Page:
+    """Build the wiki home page.
+    
+    Tables in ``shared_tables`` are listed once per group, linking to the
+    shared page.
+    """
     
     table_count = len(tables)
     measure_count = len(measures)
+    shared_tables = shared_tables or []
+    shared = {t.name for group in shared_tables for t in group.tables}
     
     # Build table of contents
-    table_links = "\n".join(
-        f"- [{t.name}](Table-{_slugify(t.name)}.md)"
+    table_links = [
+        [Link(t.name, f"Table-{_slugify(t.name)}")]
         for t in tables
-    )
+        if t.name not in shared
+    ] + [
+        [Link(group.title, group.page)]
+        for group in shared_tables
+    ]
     
     # Extract model size from summary with multiple field name attempts
     model_size = 'N/A'
     if isinstance(summary, dict):
         # Try various field names (PascalCase, snake_case, etc.)
-        model_size = (summary.get('SizeBytes') or 
-                      summary.get('size_bytes') or 
-                      summary.get('ModelSize') or 
-                      summary.get('model_size') or 
-                      summary.get('Size') or 
-                      summary.get('size') or 
+        model_size = (summary.get('SizeBytes') or
+                      summary.get('size_bytes') or
+                      summary.get('ModelSize') or
+                      summary.get('model_size') or
+                      summary.get('Size') or
+                      summary.get('size') or
                       'N/A')
     
-    return f"""# {model_name} - Semantic Model Documentation
-
-> Auto-generated on {datetime.now().strftime("%Y-%m-%d %H:%M UTC")}
-
-## Model Overview
-
-| Metric | Value |
-|--------|-------|
-| Tables | {table_count} |
-| Measures | {measure_count} |
-| Model Size | {model_size} bytes |
-
-## Quick Navigation
-
-### Tables
-
-{table_links}
-
-### Other Pages
-
-- [All Measures](Measures.md)
-- [Relationships](Relationships.md)
-- [Data Sources](Data-Sources.md)
-
----
-
-This documentation is automatically generated from the PBIX file. For questions or issues, contact the BI team.
-"""
+    return Page("Home", model_name, [
+        doc.Heading(f"{model_name} - Semantic Model Documentation", 1),
+        doc.Note([f"Auto-generated on {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}"]),
+        doc.Heading("Model Overview"),
+        doc.Table(["Metric", "Value"], [
+            ["Tables", str(table_count)],
+            ["Measures", str(measure_count)],
+            ["Model Size", f"{model_size} bytes"],
+        ]),
+        doc.Heading("Quick Navigation"),
+        doc.Heading("Tables", 3),
+        doc.BulletList(table_links),
+        doc.Heading("Other Pages", 3),
+        doc.BulletList([
+            [Link("All Measures", "Measures")],
+            [Link("Relationships", "Relationships")],
+            [Link("Data Sources", "Data-Sources")],
+        ]),
+        doc.Rule(),
+        doc.Paragraph([
+            "This documentation is automatically generated from the PBIX file. "
+            "For questions or issues, contact the BI team."
+        ]),
+    ])
+
+
+def build_table_page(
+    table: Table,
+    measures: list[Measure],
+    measure_pages: dict[str, str] | None = None,
+    neighborhood: ERDiagram | None = None,
+    shared_page: str | None = None
+) -> Page:
+    """Build a documentation page for a table.
+    
+    Args:
+        table: Table to document
+        measures: Measures (only those of this table are listed)
+        measure_pages: Measure name to measures page name, for models whose
+                       measures are sharded across pages (default: "Measures")
+        neighborhood: ER diagram of the tables around this one, if any
+        shared_page: Link target of a shared definition page; columns and
+                     measures are documented there instead
+    """
+    return Page(
+        f"Table-{_slugify(table.name)}",
+        table.name,
+        [Section(
+            "table-page",
+            (table, measures, measure_pages or {}, neighborhood, shared_page),
+            _table_page_blocks
+        )]
+    )
 
 
-def generate_table_page(
+def _table_page_blocks(
     table: Table,
-    measures: list[Measure]
-) -> str:
-    """Generate a documentation page for a table."""
+    measures: list[Measure],
+    measure_pages: dict[str, str],
+    neighborhood: ERDiagram | None,
+    shared_page: str | None = None
+) -> list[doc.Block]:
+    """Body of a table page."""
+    
+    blocks: list[doc.Block] = [
+        doc.Heading(f"Table: {table.name}", 1),
+        doc.Heading("Overview"),
+        doc.Paragraph([
+            Strong("Row Count"),
+            f": {table.row_count if table.row_count is not None else 'N/A'}",
+        ]),
+    ]
+    
+    if shared_page is None:
+        blocks += _columns_blocks(table)
+    else:
+        blocks += [
+            doc.Heading("Definition"),
+            doc.Paragraph([
+                "Columns and measures are documented on the ",
+                Link("shared definition", shared_page),
+                ", used by every model with an identical copy of this table.",
+            ]),
+        ]
     
-    # Build columns table
+    if neighborhood is not None:
+        blocks += [doc.Heading("Related Tables"), doc.Diagram(neighborhood.source)]
+        if neighborhood.summarized:
+            blocks.append(doc.Note([
+                f"Showing {len(neighborhood.tables)} nearest tables. See ",
+                Link("Relationships", "Relationships"),
+                " for the full model.",
+            ]))
+    
+    if shared_page is None:
+        blocks += _measures_blocks(table, measures, measure_pages)
+    
+    return blocks + [doc.Rule(), doc.Paragraph([Link("← Back to Home", "Home")])]
+
+
+def _columns_blocks(table: Table) -> list[doc.Block]:
+    """Columns section of a table page."""
     columns_rows = []
     if table.columns:
         for col in table.columns:
-            # Handle both dict and object column formats
-            if isinstance(col, dict):
-                # Try various field name combinations (observed: ColumnName, PandasDataType)
-                col_name = (col.get("ColumnName") or col.get("Name") or 
-                           col.get("name") or col.get("column_name") or "")
-                col_type = (col.get("PandasDataType") or col.get("DataType") or 
-                           col.get("dataType") or col.get("data_type") or "Unknown")
-                col_desc = (col.get("Description") or col.get("description") or "")
-            else:
-                col_name = getattr(col, 'ColumnName', getattr(col, 'name', getattr(col, 'Name', '')))
-                col_type = getattr(col, 'PandasDataType', getattr(col, 'data_type', getattr(col, 'DataType', 'Unknown')))
-                col_desc = getattr(col, 'description', getattr(col, 'Description', ''))
-            
-            # Escape pipe characters in descriptions
-            col_desc = col_desc.replace("|", "\\|") if col_desc else ""
-            columns_rows.append(f"| {col_name} | {col_type} | {col_desc} |")
-    
-    columns_table = "\n".join(columns_rows) if columns_rows else "| No columns available | | |"
+            col_name, col_type, col_desc = column_fields(col)
+            columns_rows.append([col_name, col_type, col_desc])
     
+    if not columns_rows:
+        columns_rows = [["No columns available", "", ""]]
+    
+    return [
+        doc.Heading("Columns"),
+        doc.Table(["Column Name", "Data Type", "Description"], columns_rows),
+    ]
+
+
+def _measures_blocks(
+    table: Table,
+    measures: list[Measure],
+    measure_pages: dict[str, str] | None
+) -> list[doc.Block]:
+    """Measures section of a table page.
+    
+    Measure names link to the measures page unless ``measure_pages`` is
+    None (pages outside a model folder).
+    """
     # Find measures in this table
     table_measures = [m for m in measures if m.table == table.name]
-    measures_section = ""
-    
-    if table_measures:
-        measures_rows = []
-        for m in table_measures:
-            # Clean expression: escape pipes, replace newlines with spaces, limit length
-            if m.expression:
-                expr = m.expression.replace("|", "\\|").replace("\n", " ").replace("\r", "")
-                # Collapse multiple spaces
-                expr = " ".join(expr.split())
-                # Limit to 50 chars
-                expr = expr[:50] + "..." if len(expr) > 50 else expr
-            else:
-                expr = ""
+    
+    if not table_measures:
+        return []
+    
+    measures_rows = []
+    for m in table_measures:
+        # Clean expression: replace newlines with spaces, limit length
+        if m.expression:
+            expr = m.expression.replace("\n", " ").replace("\r", "")
+            # Collapse multiple spaces
+            expr = " ".join(expr.split())
+            # Limit to 50 chars
+            expr = expr[:50] + "..." if len(expr) > 50 else expr
+        else:
+            expr = ""
+        if measure_pages is None:
+            name = m.name
+        else:
             # Link to Measures page without anchor - GitHub's auto-generated anchors are unpredictable
-            measures_rows.append(f"| [{m.name}](Measures.md) | `{expr}` |")
-        
-        measures_section = f"""
-## Measures
+            name = Link(m.name, measure_pages.get(m.name, "Measures"))
+        measures_rows.append([name, Code(expr)])
+    
+    return [
+        doc.Heading("Measures"),
+        doc.Table(["Measure", "Expression"], measures_rows),
+    ]
 
-| Measure | Expression |
-|---------|------------|
-{chr(10).join(measures_rows)}
-"""
+
+def shared_table_key(table: Table, measures: list[Measure]) -> str | None:
+    """Identity of a table definition shared across models.
+    
+    Tables match when they have the same name and lineage tag and the same
+    structure (see structural_hash).
     
-    return f"""# Table: {table.name}
+    Args:
+        table: Table to identify
+        measures: Measures of this table
+    
+    Returns:
+        Key, or None if the table has no lineage tag
+    """
+    if not table.lineage_tag:
+        return None
+    return fingerprint(
+        "shared-table", table.name, table.lineage_tag, structural_hash(table, measures)
+    )
 
-## Overview
 
-**Row Count**: {table.row_count if table.row_count is not None else 'N/A'}
+def shared_table_page_name(table: Table, key: str) -> str:
+    """Page name of a shared table definition."""
+    return f"Table-{_slugify(table.name)}-{key[:8]}"
 
-## Columns
 
-| Column Name | Data Type | Description |
-|-------------|-----------|-------------|
-{columns_table}
-{measures_section}
+def build_shared_definition_page(
+    table: Table,
+    measures: list[Measure],
+    page_name: str
+) -> Page:
+    """Build the model-independent definition page of a shared table.
+    
+    Args:
+        table: Table to document
+        measures: Measures of this table
+        page_name: Page name from shared_table_page_name
+    """
+    return Page(page_name, table.name, [
+        doc.Heading(f"Table: {table.name}", 1),
+        doc.Note([
+            "Shared definition (lineage tag ",
+            Code(table.lineage_tag or ""),
+            "), identical in every model that links here",
+        ]),
+        *_columns_blocks(table),
+        *_measures_blocks(table, measures, None),
+    ])
+
+
+def column_fields(col: Any) -> tuple[str, str, str]:
+    """Extract (name, data type, description) from a column definition.
+    
+    Handles both dict and object column formats, with the field names
+    observed across engines (ColumnName, PandasDataType, DataType, ...).
+    """
+    if isinstance(col, Column):
+        return col.name, col.data_type or "Unknown", col.description or ""
+    if isinstance(col, dict):
+        # Try various field name combinations (observed: ColumnName, PandasDataType)
+        col_name = (col.get("ColumnName") or col.get("Name") or
+                   col.get("name") or col.get("column_name") or "")
+        col_type = (col.get("PandasDataType") or col.get("DataType") or
+                   col.get("dataType") or col.get("data_type") or "Unknown")
+        col_desc = (col.get("Description") or col.get("description") or "")
+    else:
+        col_name = getattr(col, 'ColumnName', getattr(col, 'name', getattr(col, 'Name', '')))
+        col_type = getattr(col, 'PandasDataType', getattr(col, 'data_type', getattr(col, 'DataType', 'Unknown')))
+        col_desc = getattr(col, 'description', getattr(col, 'Description', ''))
+    
+    return str(col_name), str(col_type), col_desc or ""
 
----
 
-[← Back to Home](Home.md)
-"""
+def structural_hash(table: Table, measures: list[Measure]) -> str:
+    """Fingerprint a table's definition independently of its name.
+    
+    Args:
+        table: Table to fingerprint
+        measures: Measures of this table (their expressions are included)
+    
+    Returns:
+        Hash shared by tables with identical columns and expressions
+    """
+    columns = [
+        {k: v for k, v in col.items() if k not in _TABLE_NAME_KEYS}
+        if isinstance(col, (dict, Column)) else column_fields(col)
+        for col in table.columns or []
+    ]
+    expressions = [(m.name, m.expression) for m in measures]
+    return fingerprint("table-structure", columns, expressions)
+
+
+def group_auto_date_tables(
+    tables: list[Table],
+    measures: list[Measure],
+    owners: dict[str, list[tuple[str, str]]]
+) -> list[SharedTableGroup]:
+    """Group structurally identical auto date/time tables.
+    
+    Args:
+        tables: All tables in the model
+        measures: All measures in the model
+        owners: Auto date/time table name to the columns using it, from
+                RelationshipGraph.auto_date_owners
+    
+    Returns:
+        Groups with at least two members, in model order. Tables in a group
+        are documented on the group's page instead of their own.
+    """
+    measures_by_table: dict[str, list[Measure]] = {}
+    for m in measures:
+        measures_by_table.setdefault(m.table, []).append(m)
+    
+    groups: dict[str, list[Table]] = {}
+    for table in tables:
+        if table.name in owners:
+            key = structural_hash(table, measures_by_table.get(table.name, []))
+            groups.setdefault(key, []).append(table)
+    
+    return [
+        SharedTableGroup(
+            f"Table-auto-date-{key[:8]}",
+            members,
+            {t.name: owners[t.name] for t in members},
+        )
+        for key, members in groups.items()
+        if len(members) > 1
+    ]
+
+
+def build_shared_table_page(group: SharedTableGroup) -> Page:
+    """Build the shared page of a group of identical auto date/time tables."""
+    return Page(
+        group.page,
+        group.title,
+        [Section("shared-table-page", (group,), _shared_table_page_blocks)]
+    )
 
 
-def generate_measures_page(measures: list[Measure]) -> str:
-    """Generate a page documenting all measures."""
+def _shared_table_page_blocks(group: SharedTableGroup) -> list[doc.Block]:
+    """Body of a shared auto date/time table page."""
+    
+    columns_rows = [list(column_fields(col)) for col in group.tables[0].columns or []]
+    if not columns_rows:
+        columns_rows = [["No columns available", "", ""]]
+    
+    instance_rows = []
+    for table in group.tables:
+        used_by = group.owners.get(table.name) or []
+        if not used_by:
+            instance_rows.append([table.name, ""])
+        for owner, column in used_by:
+            instance_rows.append([table.name, f"{owner}[{column}]"])
+    
+    return [
+        doc.Heading("Auto Date Table", 1),
+        doc.Note([
+            f"{len(group.tables)} structurally identical auto date/time tables "
+            "share this definition"
+        ]),
+        doc.Heading("Columns"),
+        doc.Table(["Column Name", "Data Type", "Description"], columns_rows),
+        doc.Heading("Instances"),
+        doc.Table(["Table", "Used By Column"], instance_rows),
+        doc.Rule(),
+        doc.Paragraph([Link("← Back to Home", "Home")]),
+    ]
+
+
+def build_measures_page(measures: list[Measure]) -> Page:
+    """Build a page documenting all measures."""
     
     # Group measures by table
     measures_by_table = {}
@@ -147,89 +409,372 @@ def generate_measures_page(measures: list[Measure]) -> str:
             measures_by_table[m.table] = []
         measures_by_table[m.table].append(m)
     
-    content = f"""# All Measures
+    blocks: list[doc.Block] = [
+        doc.Heading("All Measures", 1),
+        doc.Note([f"Total Measures: {len(measures)}"]),
+    ]
+    
+    for table_name in sorted(measures_by_table.keys()):
+        blocks.append(Section(
+            "measures-section",
+            (table_name, measures_by_table[table_name]),
+            build_measures_section
+        ))
+    
+    blocks.append(doc.Paragraph([Link("← Back to Home", "Home")]))
+    return Page("Measures", "All Measures", blocks)
 
-> Total Measures: {len(measures)}
 
-"""
+@dataclass
+class MeasureShard:
+    """A page holding part of the model's measures.
     
-    for table_name in sorted(measures_by_table.keys()):
-        content += f"\n## {table_name}\n\n"
-        
-        for m in measures_by_table[table_name]:
-            content += f"### {m.name}\n\n"
-            
-            if m.description:
-                content += f"**Description**: {m.description}\n\n"
-            
-            if m.format_string:
-                content += f"**Format**: `{m.format_string}`\n\n"
-            
-            if m.display_folder:
-                content += f"**Display Folder**: {m.display_folder}\n\n"
-            
-            content += f"""**Expression**:
-```dax
-{m.expression}
-```
-
----
-
-"""
-    
-    content += "\n[← Back to Home](Home.md)\n"
-    return content
+    Attributes:
+        page: Page name (e.g. "Measures-sales")
+        table: Table the measures belong to
+        folder: Display folder, if the table was split by folder
+        measures: Measures on this page
+    """
+    page: str
+    table: str
+    folder: str | None
+    measures: list[Measure]
+    
+    @property
+    def title(self) -> str:
+        """Human-readable page title."""
+        return f"{self.table} / {self.folder}" if self.folder else self.table
+
+
+def shard_measures(
+    measures: list[Measure],
+    max_measures: int,
+    max_bytes: int
+) -> list[MeasureShard]:
+    """Split measures across pages once a single Measures page gets too big.
+    
+    Measures are grouped by table; a table that still exceeds the limits is
+    split by display folder, and an oversized folder into numbered parts.
+    Page size is estimated from the measure text, without rendering.
+    
+    Args:
+        measures: All measures in the model
+        max_measures: Maximum number of measures per page
+        max_bytes: Approximate maximum page size in bytes
+    
+    Returns:
+        Shards in page order, or an empty list if everything fits on the
+        single Measures page
+    """
+    if measures_fit(measures, max_measures, max_bytes):
+        return []
+    
+    by_table: dict[str, list[Measure]] = {}
+    for m in measures:
+        by_table.setdefault(m.table, []).append(m)
+    
+    shards: list[MeasureShard] = []
+    used: set[str] = {"Measures"}
+    for table_name in sorted(by_table):
+        _shard_table(table_name, by_table[table_name], max_measures, max_bytes, used, shards)
+    return shards
 
 
-def generate_relationships_page(
-    relationships: list[Relationship],
-    er_diagram: str
-) -> str:
-    """Generate a page documenting relationships."""
+def measures_fit(measures: list[Measure], max_measures: int, max_bytes: int) -> bool:
+    """Check whether measures fit on a single page within the limits."""
+    return len(measures) <= max_measures and measures_size(measures) <= max_bytes
+
+
+def measures_size(measures: list[Measure]) -> int:
+    """Estimate the rendered Markdown size of measures."""
+    return sum(map(_measure_size, measures))
+
+
+def table_measure_pages(
+    table_name: str,
+    measures: list[Measure],
+    max_measures: int,
+    max_bytes: int
+) -> dict[str, str]:
+    """Map one table's measures to their pages in a sharded model.
     
-    content = f"""# Relationships
+    Needs only the table's own measures, so table pages can link to their
+    measures before the rest of the model is known. Matches ``shard_measures``
+    unless another table's page names collide with this table's.
+    
+    Returns:
+        Measure name to page name
+    """
+    shards: list[MeasureShard] = []
+    _shard_table(table_name, measures, max_measures, max_bytes, {"Measures"}, shards)
+    return {m.name: shard.page for shard in shards for m in shard.measures}
+
+
+def _shard_table(
+    table_name: str,
+    measures: list[Measure],
+    max_measures: int,
+    max_bytes: int,
+    used: set[str],
+    shards: list[MeasureShard]
+) -> None:
+    """Append one table's shards, skipping page names in ``used``."""
+    def add(name: str, folder: str | None, group: list[Measure]) -> None:
+        page, n = name, 2
+        while page in used:
+            page, n = f"{name}-{n}", n + 1
+        used.add(page)
+        shards.append(MeasureShard(page, table_name, folder, group))
+    
+    base = f"Measures-{_page_slug(table_name)}"
+    if measures_fit(measures, max_measures, max_bytes):
+        add(base, None, measures)
+        return
+    
+    by_folder: dict[str, list[Measure]] = {}
+    for m in measures:
+        by_folder.setdefault(m.display_folder or "", []).append(m)
+    
+    for folder in sorted(by_folder):
+        name = f"{base}-{_page_slug(folder)}" if folder else base
+        for part in _chunk_measures(by_folder[folder], max_measures, max_bytes):
+            add(name, folder or None, part)
+
+
+def _chunk_measures(
+    measures: list[Measure],
+    max_measures: int,
+    max_bytes: int
+) -> list[list[Measure]]:
+    """Split measures into consecutive runs within the page limits."""
+    chunks: list[list[Measure]] = [[]]
+    size = 0
+    for m in measures:
+        m_size = _measure_size(m)
+        if chunks[-1] and (len(chunks[-1]) >= max_measures or size + m_size > max_bytes):
+            chunks.append([])
+            size = 0
+        chunks[-1].append(m)
+        size += m_size
+    return chunks
+
+
+def _measure_size(m: Measure) -> int:
+    """Estimate the rendered Markdown size of a measure."""
+    return (
+        len(m.name) + len(m.expression or "") + len(m.description or "")
+        + len(m.format_string or "") + len(m.display_folder or "") + 80
+    )
+
 
-> Total Relationships: {len(relationships)}
+def build_measures_index_page(measures: list[Measure], shards: list[MeasureShard]) -> Page:
+    """Build the Measures navigation page for a sharded model."""
+    
+    rows = [
+        [Link(shard.title, shard.page), shard.table, shard.folder or "", str(len(shard.measures))]
+        for shard in shards
+    ]
+    
+    return Page("Measures", "All Measures", [
+        doc.Heading("All Measures", 1),
+        doc.Note([f"Total Measures: {len(measures)} across {len(shards)} pages"]),
+        doc.Table(["Page", "Table", "Display Folder", "Measures"], rows),
+        doc.Rule(),
+        doc.Paragraph([Link("← Back to Home", "Home")]),
+    ])
+
+
+def build_measures_shard_page(shard: MeasureShard) -> Page:
+    """Build one page of a sharded measures listing."""
+    
+    return Page(shard.page, f"Measures: {shard.title}", [
+        doc.Heading(f"Measures: {shard.title}", 1),
+        doc.Note([f"{len(shard.measures)} measures · ", Link("All Measures", "Measures")]),
+        Section("measures-section", (shard.table, shard.measures), build_measures_section),
+        doc.Paragraph([Link("← Back to All Measures", "Measures")]),
+    ])
 
-## Entity Relationship Diagram
 
-```mermaid
-{er_diagram}
-```
+def build_measures_section(table_name: str, measures: list[Measure]) -> list[doc.Block]:
+    """Build the Measures.md section for one table's measures."""
+    
+    blocks: list[doc.Block] = [doc.Heading(table_name)]
+    
+    for m in measures:
+        blocks.append(doc.Heading(m.name, 3))
+        
+        if m.description:
+            blocks.append(doc.Paragraph([Strong("Description"), f": {m.description}"]))
+        
+        if m.format_string:
+            blocks.append(doc.Paragraph([Strong("Format"), ": ", Code(m.format_string)]))
+        
+        if m.display_folder:
+            blocks.append(doc.Paragraph([Strong("Display Folder"), f": {m.display_folder}"]))
+        
+        blocks += [
+            doc.Paragraph([Strong("Expression"), ":"]),
+            doc.CodeBlock(m.expression, "dax"),
+            doc.Rule(),
+        ]
+    
+    return blocks
 
-## Relationship Details
 
-| From Table | From Column | To Table | To Column | Active | Cross Filter |
-|------------|-------------|----------|-----------|--------|--------------|
-"""
+def build_relationships_page(
+    relationships: list[Relationship],
+    er_diagram: str | ERLayout,
+    layout_image: str | None = None
+) -> Page:
+    """Build a page documenting relationships.
+    
+    Args:
+        relationships: All relationships in the model
+        er_diagram: A single Mermaid diagram, or a per-component layout from
+                    mermaid.plan_er_diagrams
+        layout_image: File name of a pre-rendered layout of the whole model,
+                      shown above the diagrams
+    """
+    
+    rows = [
+        Section("relationship-row", (r,), relationship_row)
+        for r in relationships
+    ]
+    
+    if isinstance(er_diagram, str):
+        diagram_blocks = [
+            doc.Heading("Entity Relationship Diagram"),
+            doc.Diagram(er_diagram),
+        ]
+    else:
+        diagram_blocks = _er_layout_blocks(er_diagram)
     
-    for r in relationships:
-        active = "✓" if r.is_active else "✗"
-        content += f"| {r.from_table} | {r.from_column} | {r.to_table} | {r.to_column} | {active} | {r.cross_filter_direction} |\n"
+    if layout_image:
+        diagram_blocks = [
+            doc.Heading("Model Layout"),
+            doc.Image(layout_image, "Entity relationship layout"),
+        ] + diagram_blocks
     
-    content += "\n---\n\n[← Back to Home](Home.md)\n"
-    return content
+    return Page("Relationships", "Relationships", [
+        doc.Heading("Relationships", 1),
+        doc.Note([f"Total Relationships: {len(relationships)}"]),
+        *diagram_blocks,
+        doc.Heading("Relationship Details"),
+        doc.Table(
+            ["From Table", "From Column", "To Table", "To Column", "Active", "Cross Filter"],
+            rows
+        ),
+        doc.Rule(),
+        doc.Paragraph([Link("← Back to Home", "Home")]),
+    ])
+
+
+def _er_layout_blocks(layout: ERLayout) -> list[doc.Block]:
+    """Diagram sections of the Relationships page, one per component."""
+    
+    blocks: list[doc.Block] = [doc.Heading("Entity Relationship Diagrams")]
+    
+    for diagram in layout.diagrams:
+        blocks.append(doc.Heading(diagram.title, 3))
+        if diagram.summarized:
+            blocks.append(doc.Note([
+                "This area is too large to draw in full; the diagram shows its "
+                "most connected tables and the table below lists every connection."
+            ]))
+        blocks.append(doc.Diagram(diagram.source))
+        if diagram.summarized:
+            blocks.append(doc.Table(["Table", "Related Tables"], [
+                [table, ", ".join(related)]
+                for table, related in diagram.connections.items()
+            ]))
+    
+    if layout.standalone_tables:
+        blocks += [
+            doc.Heading("Standalone Tables", 3),
+            doc.BulletList([
+                [Link(t, f"Table-{_slugify(t)}")] for t in layout.standalone_tables
+            ]),
+        ]
+    
+    if layout.auto_date_tables:
+        rows = [
+            [table, f"{owner}[{column}]"]
+            for table, owners in layout.auto_date_tables.items()
+            for owner, column in owners
+        ] + [
+            [table, ""]
+            for table, owners in layout.auto_date_tables.items()
+            if not owners
+        ]
+        blocks += [
+            doc.Heading("Auto Date Tables", 3),
+            doc.Note([f"{len(layout.auto_date_tables)} auto date/time tables, not drawn above"]),
+            doc.Table(["Auto Date Table", "Used By Column"], rows),
+        ]
+    
+    return blocks
+
 
+def relationship_row(r: Relationship) -> list[str]:
+    """Build the relationship details table row for one relationship."""
+    active = "✓" if r.is_active else "✗"
+    return [r.from_table, r.from_column, r.to_table, r.to_column, active, r.cross_filter_direction]
 
-def generate_data_sources_page(power_query: str) -> str:
-    """Generate a page documenting data sources and Power Query."""
+
+def build_data_sources_page(power_query: Any) -> Page:
+    """Build a page documenting data sources and Power Query."""
     
-    return f"""# Data Sources
+    return Page("Data-Sources", "Data Sources", [
+        doc.Heading("Data Sources", 1),
+        doc.Heading("Power Query / M Code"),
+        doc.Paragraph([
+            "The following Power Query code defines the data sources and "
+            "transformations for this model:"
+        ]),
+        doc.CodeBlock(str(power_query), "powerquery"),
+        doc.Rule(),
+        doc.Paragraph([Link("← Back to Home", "Home")]),
+    ])
 
-## Power Query / M Code
 
-The following Power Query code defines the data sources and transformations for this model:
+def generate_home_page(
+    model_name: str,
+    summary: dict,
+    tables: list[Table],
+    measures: list[Measure]
+) -> str:
+    """Generate the wiki home page as Markdown."""
+    return MarkdownEmitter().emit(build_home_page(model_name, summary, tables, measures))
+
+
+def generate_table_page(table: Table, measures: list[Measure]) -> str:
+    """Generate a documentation page for a table as Markdown."""
+    return MarkdownEmitter().emit(build_table_page(table, measures))
+
 
-```powerquery
-{power_query}
-```
+def generate_measures_page(measures: list[Measure]) -> str:
+    """Generate a page documenting all measures as Markdown."""
+    return MarkdownEmitter().emit(build_measures_page(measures))
+
+
+def generate_relationships_page(
+    relationships: list[Relationship],
+    er_diagram: str | ERLayout
+) -> str:
+    """Generate a page documenting relationships as Markdown."""
+    return MarkdownEmitter().emit(build_relationships_page(relationships, er_diagram))
 
----
 
-[← Back to Home](Home.md)
-"""
+def generate_data_sources_page(power_query: Any) -> str:
+    """Generate a page documenting data sources and Power Query as Markdown."""
+    return MarkdownEmitter().emit(build_data_sources_page(power_query))
 
 
 def _slugify(text: str) -> str:
     """Convert text to URL-safe slug."""
     return text.lower().replace(" ", "-").replace("_", "-")
+
+
+def _page_slug(text: str) -> str:
+    """Convert free text (e.g. nested display folders) to a file-name-safe slug."""
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "other"
@@ -0,0 +1,374 @@
+# src/generators/sinks.py
+"""Output sinks for generated documentation.
+
+A sink receives generated files as ``(relative_path, content)`` pairs, where
+paths use forward slashes and are relative to the documentation root
+(e.g. ``"sales-model/Home.md"``). This keeps the generators independent of
+where the documentation ends up: a folder on disk, a single archive, or memory.
+
+Several writers may share a documentation root (e.g. concurrent runs against
+one directory). They coordinate through ``OutputSink.lock``: a model folder
+is locked while it is generated, and the models index while it is rebuilt.
+"""
+
+import hashlib
+import io
+import os
+import socket
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive lock on a file, shared by threads and processes.
+    
+    Follows the ``threading.Lock`` interface. The lock belongs to the open
+    file, so two ``FileLock`` objects for the same path exclude each other
+    even within one process, and the operating system releases it when the
+    holding process dies. Not reentrant.
+    
+    Attributes:
+        path: Lock file, created if missing
+    """
+    
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._fd: int | None = None
+    
+    def acquire(self, blocking: bool = True) -> bool:
+        """Acquire the lock.
+        
+        Args:
+            blocking: Wait for the lock instead of failing when it is held
+        
+        Returns:
+            Whether the lock was acquired
+        """
+        if self._fd is not None:
+            raise RuntimeError(f"Lock {self.path} is already held")
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if not _try_lock(fd):
+                if not blocking:
+                    os.close(fd)
+                    return False
+                _wait_lock(fd)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+    
+    def release(self) -> None:
+        """Release the lock."""
+        if self._fd is None:
+            raise RuntimeError(f"Lock {self.path} is not held")
+        fd, self._fd = self._fd, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+    
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive lock on an open file without waiting."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _wait_lock(fd: int) -> None:
+    """Take an exclusive lock on an open file, waiting until it is free."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    while not _try_lock(fd):
+        time.sleep(0.05)
+
+
+class OutputSink(ABC):
+    """Destination for generated documentation files.
+    
+    Implementations must be safe to call from multiple threads.
+    
+    Attributes:
+        supports_overwrite: Whether a path may be written more than once.
+            Streamed archives cannot replace entries, so shared files such as
+            the models index are written once when the sink is closed.
+    """
+    
+    supports_overwrite: bool = True
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._folders: set[str] = set()
+        self._named_locks: dict[str, threading.Lock] = {}
+    
+    @abstractmethod
+    def write_text(self, path: str, content: str) -> None:
+        """Write a text file.
+        
+        Args:
+            path: Relative path using forward slashes
+            content: File content (encoded as UTF-8)
+        """
+        pass
+    
+    def read_text(self, path: str) -> str | None:
+        """Read back a previously written file.
+        
+        Args:
+            path: Relative path using forward slashes
+        
+        Returns:
+            File content, or None if the file doesn't exist or the sink is
+            write-only
+        
+        Raises:
+            ValueError: If the path is absolute or leaves the root
+        """
+        return None
+    
+    def list_folders(self) -> list[str]:
+        """List top-level folders (one per documented model).
+        
+        Returns:
+            Sorted folder names
+        """
+        with self._lock:
+            return sorted(self._folders)
+    
+    def lock(self, name: str):
+        """Return the lock guarding a shared path of the documentation.
+        
+        Writers hold a model folder's lock while generating into it, and the
+        models index lock while rebuilding it, so concurrent writers neither
+        interleave pages of one model nor lose each other's index entries.
+        
+        The default lock only coordinates writers within this process, as
+        other sinks cannot be shared between processes.
+        
+        Args:
+            name: Top-level file or folder name
+        
+        Returns:
+            Lock with the ``threading.Lock`` interface
+        """
+        with self._lock:
+            return self._named_locks.setdefault(name, threading.Lock())
+    
+    def close(self) -> None:
+        """Flush pending data and release resources."""
+        pass
+    
+    @staticmethod
+    def _validate(path: str) -> PurePosixPath:
+        """Check that a path is relative and stays inside the root."""
+        rel = PurePosixPath(path)
+        if rel.is_absolute() or ".." in rel.parts or not rel.parts:
+            raise ValueError(f"Invalid output path: {path}")
+        return rel
+    
+    def _record(self, path: str) -> PurePosixPath:
+        """Validate a relative path and remember its top-level folder."""
+        rel = self._validate(path)
+        if len(rel.parts) > 1:
+            with self._lock:
+                self._folders.add(rel.parts[0])
+        return rel
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class DirectorySink(OutputSink):
+    """Writes files into a directory tree.
+    
+    Each file is written to a temporary sibling and atomically renamed into
+    place, so readers never observe a partially written page. Locks are
+    ``<name>.lock`` files kept outside the documentation, so they coordinate
+    separate processes without ending up among the published pages.
+    
+    Attributes:
+        root: Documentation root
+        lock_dir: Directory holding the lock files. Defaults to a directory
+                  under the system temp dir derived from ``root``, which
+                  coordinates processes on one host; pass a directory on the
+                  shared volume to coordinate several hosts.
+    """
+    
+    def __init__(self, root: str | Path, lock_dir: str | Path | None = None):
+        super().__init__()
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        if lock_dir is None:
+            key = hashlib.sha256(str(self.root.resolve()).encode("utf-8")).hexdigest()
+            lock_dir = Path(tempfile.gettempdir()) / "pbi-wiki-locks" / key[:16]
+        self.lock_dir = Path(lock_dir)
+    
+    def write_text(self, path: str, content: str) -> None:
+        target = self.root / self._record(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(
+            f".{target.name}.{socket.gethostname()}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            tmp.write_text(content, encoding="utf-8")
+            os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    
+    def read_text(self, path: str) -> str | None:
+        target = (self.root / self._validate(path)).resolve()
+        if not target.is_relative_to(self.root.resolve()):
+            # E.g. a symlink or a backslash path on Windows
+            raise ValueError(f"Invalid output path: {path}")
+        if not target.is_file():
+            return None
+        try:
+            return target.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+    
+    def list_folders(self) -> list[str]:
+        return sorted(d.name for d in self.root.iterdir() if d.is_dir())
+    
+    def lock(self, name: str) -> FileLock:
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        return FileLock(self.lock_dir / f"{name}.lock")
+    
+    def __str__(self) -> str:
+        return str(self.root)
+
+
+class ZipSink(OutputSink):
+    """Streams files into a single ZIP archive."""
+    
+    supports_overwrite = False
+    
+    def __init__(
+        self,
+        archive_path: str | Path,
+        compression: int = zipfile.ZIP_DEFLATED
+    ):
+        super().__init__()
+        self.archive_path = Path(archive_path)
+        self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+        self._zip = zipfile.ZipFile(self.archive_path, "w", compression=compression)
+    
+    def write_text(self, path: str, content: str) -> None:
+        rel = self._record(path)
+        with self._lock:
+            self._zip.writestr(str(rel), content.encode("utf-8"))
+    
+    def close(self) -> None:
+        with self._lock:
+            self._zip.close()
+    
+    def __str__(self) -> str:
+        return str(self.archive_path)
+
+
+class TarSink(OutputSink):
+    """Streams files into a single gzip-compressed tar archive."""
+    
+    supports_overwrite = False
+    
+    def __init__(self, archive_path: str | Path):
+        super().__init__()
+        self.archive_path = Path(archive_path)
+        self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tar = tarfile.open(self.archive_path, "w:gz")
+    
+    def write_text(self, path: str, content: str) -> None:
+        rel = self._record(path)
+        data = content.encode("utf-8")
+        info = tarfile.TarInfo(str(rel))
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        with self._lock:
+            self._tar.addfile(info, io.BytesIO(data))
+    
+    def close(self) -> None:
+        with self._lock:
+            self._tar.close()
+    
+    def __str__(self) -> str:
+        return str(self.archive_path)
+
+
+class MemorySink(OutputSink):
+    """Keeps files in a dictionary, for tests and library use.
+    
+    Attributes:
+        files: Mapping of relative path to content
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.files: dict[str, str] = {}
+    
+    def write_text(self, path: str, content: str) -> None:
+        rel = self._record(path)
+        with self._lock:
+            self.files[str(rel)] = content
+    
+    def read_text(self, path: str) -> str | None:
+        rel = self._validate(path)
+        with self._lock:
+            return self.files.get(str(rel))
+    
+    def __str__(self) -> str:
+        return "<memory>"
+
+
+def create_sink(target: str | Path, lock_dir: str | Path | None = None) -> OutputSink:
+    """Create a sink for an output target.
+    
+    Args:
+        target: Output location. Paths ending in ``.zip`` produce a ZIP
+                archive, ``.tar.gz``/``.tgz`` a gzip tarball, anything else a
+                directory.
+        lock_dir: Lock directory of a directory sink (see ``DirectorySink``);
+                  ignored for archives
+    
+    Returns:
+        Sink writing to the target
+    """
+    name = str(target).lower()
+    if name.endswith(".zip"):
+        return ZipSink(target)
+    if name.endswith((".tar.gz", ".tgz")):
+        return TarSink(target)
+    return DirectorySink(target, lock_dir=lock_dir)
@@ -2,180 +2,972 @@
 import os
 import asyncio
 import logging
+from contextlib import aclosing, contextmanager
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterable, Sequence
 
-from ..engines import get_engine, IDocumentationEngine
-from .mermaid import generate_er_diagram
+from ..engines import get_engine, IDocumentationEngine, MetadataChunk, ModelMetadata
+from ..mcp_client.pbixray_tools import Table, Measure
+from .graph import RelationshipGraph, is_auto_date_table
+from .layout import layered_layout, render_svg
+from .mermaid import (
+    neighborhood_diagram,
+    plan_er_diagrams,
+    DEFAULT_MAX_DIAGRAM_CHARS,
+    DEFAULT_MAX_DIAGRAM_TABLES,
+)
 from .pages import (
-    generate_home_page,
-    generate_table_page,
-    generate_measures_page,
-    generate_relationships_page,
-    generate_data_sources_page,
+    build_home_page,
+    build_table_page,
+    build_measures_page,
+    build_measures_index_page,
+    build_measures_shard_page,
+    shard_measures,
+    measures_size,
+    table_measure_pages,
+    build_relationships_page,
+    build_data_sources_page,
+    build_shared_table_page,
+    group_auto_date_tables,
+    build_shared_definition_page,
+    shared_table_key,
+    shared_table_page_name,
 )
+from .cache import RenderCache
+from .document import Page
+from .emitters import Emitter, get_emitter
+from .sinks import OutputSink, DirectorySink
+from .writer import AsyncWriter
 
 
 logger = logging.getLogger(__name__)
 
+# Folder for table definitions shared by several models
+SHARED_FOLDER = "_shared"
+
+# Pages (or groups of pages) a run can be limited to
+PAGES = ("home", "tables", "measures", "relationships", "data_sources")
+
+
+def resolve_pages(pages: Iterable[str] | None) -> frozenset[str]:
+    """Validate a selection of pages, returning every page for None.
+    
+    Raises:
+        ValueError: If a name is not in ``PAGES`` or nothing is selected
+    """
+    if pages is None:
+        return frozenset(PAGES)
+    selected = frozenset(pages)
+    unknown = selected.difference(PAGES)
+    if unknown:
+        raise ValueError(
+            f"Unknown pages: {', '.join(sorted(unknown))}. Choose from: {', '.join(PAGES)}"
+        )
+    if not selected:
+        raise ValueError("At least one page is required")
+    return selected
+
+
+@dataclass
+class _Run:
+    """State of one ``generate()`` call.
+    
+    Keeping per-model state here rather than on the generator lets one
+    WikiGenerator document several models concurrently.
+    
+    Attributes:
+        model_name: Display name of the model
+        folder: Output folder of the model
+        lock: Lock on the model folder, held until the run ends
+        written: Paths of the files written, in first-write order
+        pending: Queued writes that have not completed yet
+        error: First failed write
+        pages: Pages written by this run
+    """
+    model_name: str
+    folder: str
+    pages: frozenset[str] = frozenset(PAGES)
+    lock: Any = None
+    written: dict[str, None] = field(default_factory=dict)
+    pending: set[asyncio.Future] = field(default_factory=set)
+    error: BaseException | None = None
+    table_pages: int = 0
+    definition_links: int = 0
+    auto_date_pages: int = 0
+    auto_date_tables: int = 0
+    measure_shards: int = 0
+    layout_image: str | None = None
+    
+    def track(self, future: asyncio.Future) -> None:
+        """Remember a queued write until it completes."""
+        self.pending.add(future)
+        future.add_done_callback(self._done)
+    
+    async def flush(self) -> None:
+        """Wait for this run's writes and raise the first failure."""
+        while self.pending:
+            await asyncio.wait(set(self.pending))
+        if self.error is not None:
+            raise self.error
+    
+    def _done(self, future: asyncio.Future) -> None:
+        self.pending.discard(future)
+        if not future.cancelled() and future.exception() is not None and self.error is None:
+            self.error = future.exception()
+
+
+@dataclass
+class _TableJob:
+    """Inputs of one table page.
+    
+    Pages rendered while metadata is still streaming in are compared with
+    their final inputs and rendered again if anything changed.
+    """
+    table: Table
+    measures: list[Measure]
+    links: dict[str, str]
+    graph: RelationshipGraph
+    definition_page: str | None = None
+    
+    def matches(self, other: "_TableJob") -> bool:
+        """Check whether two jobs render the same page."""
+        return (
+            self.table is other.table
+            and self.measures == other.measures
+            and self.links == other.links
+            and self.definition_page == other.definition_page
+            # Relationships only ever grow while streaming
+            and len(self.graph.relationships) == len(other.graph.relationships)
+        )
+
+
+@contextmanager
+def _engine_errors():
+    """Log engine failures and report unexpected ones as RuntimeError."""
+    try:
+        yield
+    except FileNotFoundError as e:
+        logger.error(f"Source not found: {e}")
+        raise
+    except RuntimeError as e:
+        logger.error(f"Engine error: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error during metadata extraction: {e}")
+        raise RuntimeError(f"Metadata extraction failed: {e}")
+
+
+async def _guarded(
+    engine: IDocumentationEngine,
+    include: frozenset[str] | None = None
+) -> AsyncIterator[MetadataChunk]:
+    """Stream an engine's metadata, handling its errors like ``_engine_errors``."""
+    # Engines written before projections take no arguments
+    stream = engine.iter_metadata() if include is None else engine.iter_metadata(include=include)
+    async with aclosing(stream) as chunks:
+        while True:
+            with _engine_errors():
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield chunk
+
+
+async def _single_chunk(metadata: ModelMetadata) -> AsyncIterator[MetadataChunk]:
+    """Present already extracted metadata as a stream."""
+    yield MetadataChunk(
+        summary=metadata.summary,
+        tables=metadata.tables,
+        measures=metadata.measures,
+        relationships=metadata.relationships,
+        power_query=metadata.power_query,
+    )
+
+
+async def _iterate(items: list) -> AsyncIterator:
+    for item in items:
+        yield item
+
 
 class WikiGenerator:
     """Generates documentation pages from Power BI models."""
     
-    def __init__(self, output_dir: str):
-        self.base_output_dir = Path(output_dir)
-        self.base_output_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(
+        self,
+        output_dir: str | None = None,
+        jobs: int | None = None,
+        max_pending_pages: int = 64,
+        sink: OutputSink | None = None,
+        cache: RenderCache | None = None,
+        formats: Sequence[str] = ("markdown",),
+        max_measures_per_page: int = 1000,
+        max_measures_page_bytes: int = 400_000,
+        max_diagram_tables: int = DEFAULT_MAX_DIAGRAM_TABLES,
+        max_diagram_chars: int = DEFAULT_MAX_DIAGRAM_CHARS,
+        neighborhood_hops: int = 1,
+        er_svg: bool = False,
+        dedupe_auto_date_tables: bool = True,
+        share_definitions: bool = False,
+        write_index: bool = True,
+        pages: Iterable[str] | None = None
+    ):
+        """Initialize the generator.
+        
+        Args:
+            output_dir: Base output directory (one subfolder per model).
+                        Ignored when ``sink`` is given.
+            jobs: Number of worker threads rendering table pages
+                  (defaults to the number of CPUs)
+            max_pending_pages: Maximum number of rendered pages held in
+                               memory while waiting to be written
+            sink: Destination for generated files (defaults to a
+                  DirectorySink on ``output_dir``)
+            cache: Store of rendered fragments reused across runs; only
+                   fragments whose inputs changed are re-rendered
+            formats: Output formats ("markdown", "html", "json"). Each page is
+                     built once and serialized to every format.
+            max_measures_per_page: Measures are split into per-table (and
+                                   per-display-folder) pages once a page
+                                   would hold more measures than this
+            max_measures_page_bytes: Same, for the estimated page size
+            max_diagram_tables: ER diagrams of larger connected components are
+                                summarized to their most connected tables
+            max_diagram_chars: Same, for the Mermaid source length
+            neighborhood_hops: Table pages show an ER diagram of the tables
+                               within this many relationships (0 disables)
+            er_svg: Also lay out the whole relationship graph at build time
+                    and write it as ``Relationships.svg``
+            dedupe_auto_date_tables: Document structurally identical auto
+                                     date/time tables on one shared page
+                                     instead of one page each
+            share_definitions: Document tables with a lineage tag once in
+                               ``_shared/``, keyed by name, lineage tag and
+                               structure; model table pages link there
+            write_index: Maintain the models index (``README.md``). Disable
+                         for partial runs whose outputs are merged later
+                         (see ``write_models_index``)
+            pages: Pages to write (see ``PAGES``; default: all). Engines
+                   only extract the metadata these pages need.
+        """
+        if sink is None and output_dir is None:
+            raise ValueError("Either output_dir or sink must be provided")
+        if jobs is not None and jobs < 1:
+            raise ValueError(f"jobs must be at least 1, got {jobs}")
+        if max_pending_pages < 1:
+            raise ValueError(
+                f"max_pending_pages must be at least 1, got {max_pending_pages}"
+            )
+        if neighborhood_hops < 0:
+            raise ValueError(
+                f"neighborhood_hops must not be negative, got {neighborhood_hops}"
+            )
+        if not formats:
+            raise ValueError("At least one output format is required")
+        
+        self.sink = sink if sink is not None else DirectorySink(output_dir)
+        self.writer = AsyncWriter(self.sink, max_pending_pages)
+        self.jobs = jobs or os.cpu_count() or 1
+        # Shared by all runs; threads are started on first use
+        self._render_pool = ThreadPoolExecutor(
+            max_workers=self.jobs, thread_name_prefix="render"
+        )
+        self.max_pending_pages = max_pending_pages
+        self.cache = cache
+        self.emitters: list[Emitter] = [get_emitter(f, cache) for f in formats]
+        self.max_measures_per_page = max_measures_per_page
+        self.max_measures_page_bytes = max_measures_page_bytes
+        self.max_diagram_tables = max_diagram_tables
+        self.max_diagram_chars = max_diagram_chars
+        self.neighborhood_hops = neighborhood_hops
+        self.er_svg = er_svg
+        self.dedupe_auto_date_tables = dedupe_auto_date_tables
+        self.share_definitions = share_definitions
+        self.write_index = write_index
+        self.pages = resolve_pages(pages)
+        self._shared_definitions: set[str] = set()
+        self._model_titles: dict[str, str] = {}
+        self._active_folders: set[str] = set()
+        self._index_pending = False
     
     async def generate(
         self,
         source: str,
         model_name: str | None = None,
         engine_type: str = "pbixray",
-        engine_kwargs: dict[str, Any] | None = None
-    ):
+        engine_kwargs: dict[str, Any] | None = None,
+        include: Iterable[str] | None = None
+    ) -> list[str]:
         """Generate complete documentation from a Power BI model.
         
+        Metadata is consumed from the engine's ``iter_metadata`` stream, so
+        table pages are written while the engine is still fetching the rest
+        of the model.
+        
         Args:
             source: Model source (PBIX file, PBIP folder, connection string)
             model_name: Display name for the model (derived from source if not provided)
             engine_type: Documentation engine to use ("pbixray" or "mcp")
             engine_kwargs: Engine-specific configuration options
+            include: Pages to write (see ``PAGES``; default: the generator's
+                     ``pages``). Only the metadata they need is extracted.
+        
+        Returns:
+            Paths of the files written, relative to the documentation root
         """
         if engine_kwargs is None:
             engine_kwargs = {}
         
-        if not model_name:
-            # Generate model name from source
-            if source.startswith("powerbi://") or source.startswith("localhost:"):
-                # Connection string - use a default name
-                if source.startswith("localhost:"):
-                    model_name = "PowerBI-Desktop"
-                else:
-                    # Extract workspace/model name from powerbi:// URL
-                    parts = source.split("/")
-                    model_name = parts[-1] if parts[-1] else "PowerBI-Fabric"
-            else:
-                # File path
-                model_name = Path(source).stem
+        pages = self.pages if include is None else resolve_pages(include)
+        run = await self._claim(self.resolve_model_name(source, model_name), pages)
+        try:
+            engine = self._create_engine(engine_type, engine_kwargs)
+            async with engine:
+                with _engine_errors():
+                    logger.info(f"Loading model from: {source}")
+                    await engine.load_model(source)
+                
+                # Table pages are written while the engine is still fetching
+                logger.info("Extracting metadata...")
+                parts = self.metadata_parts(pages)
+                async with aclosing(_guarded(engine, parts)) as chunks:
+                    await self._render(run, chunks)
+            await run.flush()
+        finally:
+            await self._release(run)
         
-        # Create a subfolder for this model
-        model_slug = self._slugify(model_name)
-        self.output_dir = self.base_output_dir / model_slug
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._log_summary(run)
+        return list(run.written)
+    
+    async def extract(
+        self,
+        source: str,
+        engine_type: str = "pbixray",
+        engine_kwargs: dict[str, Any] | None = None,
+        include: Iterable[str] | None = None
+    ) -> ModelMetadata:
+        """Extract a model's metadata without writing anything.
         
-        logger.info(f"Generating documentation for {model_name}...")
-        logger.info(f"Output folder: {self.output_dir}")
-        logger.info(f"Using engine: {engine_type}")
+        Together with ``render`` this splits ``generate`` into its I/O-bound
+        and CPU-bound halves, so a pipeline can overlap them across models.
+        
+        Args:
+            source: Model source (PBIX file, PBIP folder, connection string)
+            engine_type: Documentation engine to use ("pbixray" or "mcp")
+            engine_kwargs: Engine-specific configuration options
+            include: Pages the metadata is for (default: the generator's
+                     ``pages``)
         
-        # Create engine instance
+        Returns:
+            Extracted model metadata
+        """
+        return await self._extract(
+            source, engine_type, engine_kwargs or {}, self.metadata_parts(include)
+        )
+    
+    async def render(
+        self,
+        metadata: ModelMetadata,
+        model_name: str,
+        include: Iterable[str] | None = None
+    ) -> list[str]:
+        """Write documentation for previously extracted metadata.
+        
+        Args:
+            metadata: Result of ``extract``
+            model_name: Display name for the model
+            include: Pages to write (default: the generator's ``pages``)
+        
+        Returns:
+            Paths of the files written, relative to the documentation root
+        """
+        pages = self.pages if include is None else resolve_pages(include)
+        run = await self._claim(model_name, pages)
         try:
-            engine = get_engine(engine_type, **engine_kwargs)
-        except Exception as e:
-            logger.error(f"Failed to create engine '{engine_type}': {e}")
-            raise RuntimeError(f"Engine initialization failed: {e}")
+            await self._render(run, _single_chunk(metadata))
+            await run.flush()
+        finally:
+            await self._release(run)
         
-        # Extract metadata using engine
+        self._log_summary(run)
+        return list(run.written)
+    
+    @staticmethod
+    def resolve_model_name(source: str, model_name: str | None = None) -> str:
+        """Return the display name for a source, deriving it if not given."""
+        if model_name:
+            return model_name
+        # Generate model name from source
+        if source.startswith("powerbi://") or source.startswith("localhost:"):
+            # Connection string - use a default name
+            if source.startswith("localhost:"):
+                return "PowerBI-Desktop"
+            # Extract workspace/model name from powerbi:// URL
+            parts = source.split("/")
+            return parts[-1] if parts[-1] else "PowerBI-Fabric"
+        # File path
+        return Path(source).stem
+    
+    def model_folder(self, model_name: str) -> str:
+        """Return the output folder of a model."""
+        return self._slugify(model_name)
+    
+    def metadata_parts(self, include: Iterable[str] | None = None) -> frozenset[str] | None:
+        """Return the metadata parts needed to write some pages.
+        
+        Args:
+            include: Pages to write (default: the generator's ``pages``)
+        
+        Returns:
+            An ``include`` projection for ``extract_metadata``, or None when
+            every page is written and the whole model is needed
+        """
+        pages = self.pages if include is None else resolve_pages(include)
+        if pages == frozenset(PAGES):
+            return None
+        parts = set()
+        if "home" in pages:
+            parts |= {"summary", "tables", "measures"}
+            if self.dedupe_auto_date_tables:
+                # Auto date tables are grouped by columns and owning tables
+                parts |= {"columns", "relationships"}
+        if "tables" in pages:
+            parts |= {"tables", "columns", "measures"}
+            if self.neighborhood_hops or self.dedupe_auto_date_tables:
+                parts.add("relationships")
+        if "measures" in pages:
+            parts.add("measures")
+        if "relationships" in pages:
+            parts |= {"tables", "relationships"}
+        if "data_sources" in pages:
+            parts.add("power_query")
+        return frozenset(parts)
+    
+    async def _claim(self, model_name: str, pages: frozenset[str] | None = None) -> _Run:
+        """Start a run, reserving its model folder.
+        
+        Waits while another process sharing the sink generates the same
+        folder, so pages of two runs are never interleaved.
+        """
+        # Create a subfolder for this model
+        run = _Run(model_name, self.model_folder(model_name), pages or self.pages)
+        if run.folder in self._active_folders:
+            raise ValueError(f"Model folder '{run.folder}' is already being generated")
+        self._active_folders.add(run.folder)
+        
+        run.lock = self.sink.lock(run.folder)
         try:
+            # Poll rather than block a thread, so cancelling the wait never
+            # leaves the lock taken by a thread nobody is waiting for
+            delay = 0.05
+            while not run.lock.acquire(blocking=False):
+                if delay == 0.05:
+                    logger.info(f"Waiting for another writer to finish '{run.folder}'")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
+        except BaseException:
+            self._active_folders.discard(run.folder)
+            raise
+        return run
+    
+    async def _release(self, run: _Run) -> None:
+        """End a run once its queued writes are done, freeing its folder."""
+        if run.pending:
+            await asyncio.wait(set(run.pending))
+        run.lock.release()
+        self._active_folders.discard(run.folder)
+    
+    async def _extract(
+        self,
+        source: str,
+        engine_type: str,
+        engine_kwargs: dict[str, Any],
+        include: frozenset[str] | None = None
+    ) -> ModelMetadata:
+        """Load a model with a fresh engine and extract its metadata."""
+        engine = self._create_engine(engine_type, engine_kwargs)
+        
+        # Extract metadata using engine
+        with _engine_errors():
             async with engine:
                 logger.info(f"Loading model from: {source}")
                 await engine.load_model(source)
                 
                 logger.info("Extracting metadata...")
-                metadata = await engine.extract_metadata()
-                
-                summary = metadata.summary
-                tables = metadata.tables
-                measures = metadata.measures
-                relationships = metadata.relationships
-                power_query = metadata.power_query
+                if include is None:
+                    metadata = await engine.extract_metadata()
+                else:
+                    metadata = await engine.extract_metadata(include=include)
                 
                 logger.info(
-                    f"Found {len(tables)} tables, {len(measures)} measures, "
-                    f"{len(relationships)} relationships"
+                    f"Found {len(metadata.tables)} tables, {len(metadata.measures)} measures, "
+                    f"{len(metadata.relationships)} relationships"
                 )
         
-        except FileNotFoundError as e:
-            logger.error(f"Source not found: {e}")
-            raise
-        except RuntimeError as e:
-            logger.error(f"Engine error: {e}")
-            raise
+        return metadata
+    
+    def _create_engine(
+        self,
+        engine_type: str,
+        engine_kwargs: dict[str, Any]
+    ) -> IDocumentationEngine:
+        """Create an engine instance."""
+        logger.info(f"Using engine: {engine_type}")
+        try:
+            return get_engine(engine_type, **engine_kwargs)
         except Exception as e:
-            logger.error(f"Unexpected error during metadata extraction: {e}")
-            raise RuntimeError(f"Metadata extraction failed: {e}")
+            logger.error(f"Failed to create engine '{engine_type}': {e}")
+            raise RuntimeError(f"Engine initialization failed: {e}")
+    
+    async def _render(self, run: _Run, chunks: AsyncIterator[MetadataChunk]) -> None:
+        """Render and queue every page of one model as its metadata arrives.
+        
+        A table page is rendered as soon as its table has arrived and it is
+        known whether measures are split across several pages (which decides
+        where its measure links point). Pages whose inputs change later, e.g.
+        relationships arriving after the table or colliding measures page
+        names, are rendered again at the end. Sinks that cannot overwrite
+        files get all table pages at the end. Auto date/time tables wait
+        until they can be grouped. Only the pages in ``run.pages`` are
+        written.
+        """
+        model_name = run.model_name
+        pages = run.pages
+        logger.info(f"Generating documentation for {model_name}...")
+        logger.info(f"Output folder: {self.sink}/{run.folder}")
         
-        # Generate pages
-        logger.info("Generating documentation pages...")
-        self._write_page("Home", generate_home_page(
-            model_name, summary, tables, measures
-        ))
+        summary: dict[str, Any] = {}
+        power_query = None
+        tables: list[Table] = []
+        measures: list[Measure] = []
+        relationships = []
+        measures_by_table: dict[str, list[Measure]] = {}
+        streamed: dict[str, _TableJob] = {}
         
-        for table in tables:
-            page_name = f"Table-{self._slugify(table.name)}"
-        for table in tables:
-            page_name = f"Table-{self._slugify(table.name)}"
-            self._write_page(page_name, generate_table_page(
-                table, measures
-            ))
+        async def early_jobs() -> AsyncIterator[_TableJob]:
+            nonlocal summary, power_query
+            measure_bytes = 0
+            sharded = False
+            graph = None
+            held: list[Table] = []
+            
+            async for chunk in chunks:
+                if chunk.summary is not None:
+                    summary = chunk.summary
+                if chunk.power_query is not None:
+                    power_query = chunk.power_query
+                tables.extend(chunk.tables)
+                measures.extend(chunk.measures)
+                relationships.extend(chunk.relationships)
+                for m in chunk.measures:
+                    measures_by_table.setdefault(m.table, []).append(m)
+                
+                if not self.sink.supports_overwrite or "tables" not in pages:
+                    continue
+                if graph is None or chunk.relationships:
+                    graph = RelationshipGraph(relationships, [])
+                held.extend(
+                    t for t in chunk.tables
+                    if not (self.dedupe_auto_date_tables and is_auto_date_table(t.name))
+                )
+                
+                # Until the measures outgrow one page, links point to it
+                measure_bytes += measures_size(chunk.measures)
+                sharded = sharded or (
+                    len(measures) > self.max_measures_per_page
+                    or measure_bytes > self.max_measures_page_bytes
+                )
+                if not sharded or not held:
+                    continue
+                
+                ready, held = held, []
+                definition_pages = {}
+                if self.share_definitions:
+                    definition_pages = await self._write_shared_definitions(
+                        run, ready, [m for t in ready for m in measures_by_table.get(t.name, [])]
+                    )
+                for table in ready:
+                    # Copied so measures arriving later make the page stale
+                    table_measures = list(measures_by_table.get(table.name, []))
+                    job = _TableJob(
+                        table,
+                        table_measures,
+                        table_measure_pages(
+                            table.name,
+                            table_measures,
+                            self.max_measures_per_page,
+                            self.max_measures_page_bytes
+                        ),
+                        graph,
+                        definition_pages.get(table.name),
+                    )
+                    streamed[table.name] = job
+                    yield job
         
-        self._write_page("Measures", generate_measures_page(measures))
+        async with aclosing(early_jobs()) as jobs:
+            await self._write_table_pages(run, jobs)
         
-        er_diagram = generate_er_diagram(
-            relationships,
-            [t.name for t in tables]
+        logger.info(
+            f"Found {len(tables)} tables, {len(measures)} measures, "
+            f"{len(relationships)} relationships"
         )
-        self._write_page("Relationships", generate_relationships_page(
-            relationships, er_diagram
-        ))
         
-        self._write_page("Data-Sources", generate_data_sources_page(power_query))
+        graph = RelationshipGraph(relationships, [t.name for t in tables])
+        shared_tables = []
+        if self.dedupe_auto_date_tables:
+            shared_tables = group_auto_date_tables(tables, measures, graph.auto_date_owners())
+        shared = {t.name for group in shared_tables for t in group.tables}
+        
+        shards = shard_measures(
+            measures, self.max_measures_per_page, self.max_measures_page_bytes
+        )
+        measure_pages = {
+            (m.table, m.name): shard.page
+            for shard in shards
+            for m in shard.measures
+        }
+        
+        table_pages = [t for t in tables if t.name not in shared]
+        if "tables" not in pages:
+            # Home still lists auto date tables by group
+            table_pages = []
+        definition_pages = {}
+        if self.share_definitions and table_pages:
+            definition_pages = await self._write_shared_definitions(run, table_pages, measures)
+        
+        remaining = []
+        for table in table_pages:
+            table_measures = measures_by_table.get(table.name, [])
+            job = _TableJob(
+                table,
+                table_measures,
+                {
+                    m.name: measure_pages[(m.table, m.name)]
+                    for m in table_measures
+                    if (m.table, m.name) in measure_pages
+                },
+                graph,
+                definition_pages.get(table.name),
+            )
+            early = streamed.get(table.name)
+            if early is None or not early.matches(job):
+                remaining.append(job)
+        if streamed:
+            logger.debug(
+                f"{len(streamed)} table pages written while streaming, "
+                f"{len(remaining)} rendered afterwards"
+            )
+        await self._write_table_pages(run, _iterate(remaining))
+        
+        if "home" in pages:
+            await self._write_page(run, build_home_page(
+                model_name, summary, tables, measures, shared_tables
+            ))
+        if "tables" in pages:
+            for group in shared_tables:
+                await self._write_page(run, build_shared_table_page(group))
+        else:
+            shared_tables = []
+        
+        if "measures" not in pages:
+            shards = []
+        elif shards:
+            await self._write_page(run, build_measures_index_page(measures, shards))
+            for shard in shards:
+                await self._write_page(run, build_measures_shard_page(shard))
+        else:
+            await self._write_page(run, build_measures_page(measures))
+        
+        layout_image = None
+        if "relationships" in pages:
+            er_layout = plan_er_diagrams(
+                relationships,
+                [t.name for t in tables],
+                max_tables=self.max_diagram_tables,
+                max_chars=self.max_diagram_chars,
+                graph=graph
+            )
+            if self.er_svg:
+                layout = layered_layout(graph, exclude=graph.auto_date_tables)
+                if layout.nodes:
+                    layout_image = "Relationships.svg"
+                    svg = render_svg(layout, f"{model_name} Relationships")
+                    await self._write_files(run, [(layout_image, svg)])
+            await self._write_page(
+                run, build_relationships_page(relationships, er_layout, layout_image)
+            )
+        
+        if "data_sources" in pages:
+            await self._write_page(run, build_data_sources_page(power_query))
         
         # Create index page in base directory listing all models
-        self._create_models_index()
-        
-        logger.info(f"✓ Documentation generated in {self.output_dir}")
-        logger.info(f"  - Home page")
-        logger.info(f"  - {len(tables)} table pages")
-        logger.info(f"  - Measures page")
-        logger.info(f"  - Relationships page")
-        logger.info(f"  - Data Sources page")
-    
-    def _write_page(self, page_name: str, content: str):
-        """Write a wiki page to disk."""
-        file_path = self.output_dir / f"{page_name}.md"
-        file_path.write_text(content, encoding="utf-8")
-    
-    def _create_models_index(self):
-        """Create an index page listing all models in the base directory."""
-        index_path = self.base_output_dir / "README.md"
-        
-        # Find all model folders
-        model_folders = [d for d in self.base_output_dir.iterdir() if d.is_dir()]
-        
-        if not model_folders:
-            return
-        
-        content = "# Power BI Models Documentation\n\n"
-        content += f"This repository contains auto-generated documentation for {len(model_folders)} Power BI model(s).\n\n"
-        content += "## Available Models\n\n"
-        
-        for folder in sorted(model_folders):
-            # Read model name from Home.md if it exists
-            home_file = folder / "Home.md"
-            model_display_name = folder.name.replace("-", " ").title()
-            
-            if home_file.exists():
-                # Try to extract model name from Home.md first line
-                first_line = home_file.read_text(encoding="utf-8").split("\n")[0]
-                if first_line.startswith("# "):
-                    model_display_name = first_line[2:].split(" - ")[0]
-            
-            content += f"- **[{model_display_name}]({folder.name}/Home.md)**\n"
+        if "home" in pages:
+            self._model_titles[run.folder] = model_name
+            if self.write_index and self.sink.supports_overwrite:
+                await self._create_models_index(run.folder)
+            elif self.write_index:
+                self._index_pending = True
+        
+        run.table_pages = len(table_pages)
+        run.definition_links = len(definition_pages)
+        run.auto_date_pages = len(shared_tables)
+        run.auto_date_tables = len(shared)
+        run.measure_shards = len(shards)
+        run.layout_image = layout_image
+    
+    def _log_summary(self, run: _Run) -> None:
+        """Log what was written for one model."""
+        logger.info(f"✓ Documentation generated in {self.sink}/{run.folder}")
+        pages = run.pages
+        if "home" in pages:
+            logger.info(f"  - Home page")
+        if "tables" in pages:
+            logger.info(f"  - {run.table_pages} table pages")
+        if run.definition_links:
+            logger.info(f"  - {run.definition_links} tables linked to {SHARED_FOLDER}/")
+        if run.auto_date_pages:
+            logger.info(
+                f"  - {run.auto_date_pages} shared pages for {run.auto_date_tables} auto date tables"
+            )
+        if run.measure_shards:
+            logger.info(f"  - Measures index and {run.measure_shards} measures pages")
+        elif "measures" in pages:
+            logger.info(f"  - Measures page")
+        if "relationships" in pages:
+            logger.info(f"  - Relationships page")
+        if run.layout_image:
+            logger.info(f"  - Relationships layout ({run.layout_image})")
+        if "data_sources" in pages:
+            logger.info(f"  - Data Sources page")
+        if self.cache is not None:
+            logger.info(
+                f"  Render cache: {self.cache.hits} hits, {self.cache.misses} misses"
+            )
+    
+    async def _write_table_pages(
+        self,
+        run: _Run,
+        jobs: AsyncIterator[_TableJob]
+    ) -> None:
+        """Render table pages on a worker pool and write them as they complete.
+        
+        Rendering runs on ``self.jobs`` threads and finished pages are handed
+        to the async writer, so formatting overlaps with write latency. At
+        most ``self.max_pending_pages`` pages are being rendered and at most as
+        many are queued for writing at any time. While the limit is reached no
+        further job is taken from ``jobs``, which holds back streaming engines.
+        
+        Args:
+            run: Generation state of the model
+            jobs: Inputs of the table pages to write
+        """
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.max_pending_pages)
+        
+        def render_files(job: _TableJob) -> list[tuple[str, str]]:
+            neighborhood = None
+            if self.neighborhood_hops:
+                neighborhood = neighborhood_diagram(
+                    job.graph, job.table.name, self.neighborhood_hops, self.max_diagram_tables
+                )
+            return self._emit(build_table_page(
+                job.table, job.measures, job.links, neighborhood, job.definition_page
+            ))
+        
+        async def render(job: _TableJob) -> None:
+            try:
+                files = await loop.run_in_executor(self._render_pool, render_files, job)
+                await self._write_files(run, files)
+            finally:
+                slots.release()
+        
+        renderers: list[asyncio.Task] = []
+        failed: list[asyncio.Task] = []
+        
+        def check(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                failed.append(task)
+        
+        try:
+            async for job in jobs:
+                # Released once the page is handed to the writer
+                await slots.acquire()
+                if failed:
+                    failed[0].result()
+                task = asyncio.create_task(render(job))
+                task.add_done_callback(check)
+                renderers.append(task)
+            await asyncio.gather(*renderers)
+        finally:
+            for task in renderers:
+                task.cancel()
+    
+    def close(self) -> None:
+        """Write any deferred shared files and close the pools, sink and cache."""
+        self._render_pool.shutdown(wait=True)
+        self.writer.close()
+        if self._index_pending:
+            self._write_models_index()
+            self._index_pending = False
+        self.sink.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _emit(self, page: Page) -> list[tuple[str, str]]:
+        """Serialize a page to every output format.
+        
+        Returns:
+            List of (file name, content) pairs
+        """
+        return [
+            (emitter.page_file(page.name), emitter.emit(page))
+            for emitter in self.emitters
+        ]
+    
+    async def _write_files(
+        self,
+        run: _Run,
+        files: list[tuple[str, str]],
+        folder: str | None = None
+    ):
+        """Queue serialized pages for the run's model folder.
         
-        content += "\n---\n\n"
-        content += "*Documentation automatically generated by Power BI Auto-Documentation Pipeline*\n"
+        Write failures are raised by ``run.flush()``.
+        """
+        folder = folder or run.folder
+        for file_name, _ in files:
+            run.written[f"{folder}/{file_name}"] = None
+        for future in await self.writer.write_files(files, folder):
+            run.track(future)
+    
+    async def _write_page(self, run: _Run, page: Page):
+        """Queue a wiki page in every output format."""
+        await self._write_files(run, self._emit(page))
+    
+    async def _write_shared_definitions(
+        self,
+        run: _Run,
+        tables: list[Table],
+        measures: list[Measure]
+    ) -> dict[str, str]:
+        """Write shared definition pages for tables with a lineage tag.
+        
+        Each distinct definition is rendered once per generator, so a batch
+        of models writes one page per distinct table rather than per copy.
+        Page names are content-addressed; files the sink already holds from
+        an earlier run are not rewritten.
+        
+        Returns:
+            Table name to link target of its shared definition page
+        """
+        measures_by_table: dict[str, list[Measure]] = {}
+        for m in measures:
+            measures_by_table.setdefault(m.table, []).append(m)
         
-        index_path.write_text(content, encoding="utf-8")
+        targets = {}
+        for table in tables:
+            table_measures = measures_by_table.get(table.name, [])
+            key = shared_table_key(table, table_measures)
+            if key is None:
+                continue
+            page_name = shared_table_page_name(table, key)
+            if page_name not in self._shared_definitions:
+                self._shared_definitions.add(page_name)
+                files = self._emit(
+                    build_shared_definition_page(table, table_measures, page_name)
+                )
+                for name, content in files:
+                    if await self.writer.read_text(f"{SHARED_FOLDER}/{name}") is None:
+                        await self._write_files(run, [(name, content)], SHARED_FOLDER)
+            targets[table.name] = f"../{SHARED_FOLDER}/{page_name}"
+        return targets
+    
+    def write_models_index(self):
+        """Rebuild the models index from the model folders in the sink.
+        
+        Used to merge the outputs of several partial runs (e.g. CI shards)
+        into one documentation tree. Must not be called while pages are
+        being generated.
+        """
+        self._write_models_index()
+    
+    async def _create_models_index(self, finished: str):
+        """Create the models index on the writer thread, after queued pages."""
+        await self.writer.run(self._write_models_index, finished)
+    
+    def _write_models_index(self, finished: str | None = None):
+        """Create an index page listing all models in the base directory.
+        
+        The folder scan and the write happen under the index lock, so with
+        several writers sharing the sink the last index written includes
+        every finished model. Folders another run is still generating are
+        left out unless an earlier run completed them.
+        
+        Blocking; runs on the writer thread (or after it was closed).
+        
+        Args:
+            finished: Folder of the run that just completed, whose lock is
+                      still held
+        """
+        with self.sink.lock("README.md"):
+            index_emitter = next(
+                (e for e in self.emitters if e.name == "markdown"), self.emitters[0]
+            )
+            home_file = index_emitter.page_file("Home")
+            
+            # Find all model folders (underscore folders hold shared files)
+            model_folders = []
+            for folder in self.sink.list_folders():
+                if folder.startswith("_"):
+                    continue
+                if (
+                    folder != finished
+                    and self._in_progress(folder)
+                    and self.sink.read_text(f"{folder}/{home_file}") is None
+                ):
+                    continue
+                model_folders.append(folder)
+            
+            if not model_folders:
+                return
+            
+            content = "# Power BI Models Documentation\n\n"
+            content += f"This repository contains auto-generated documentation for {len(model_folders)} Power BI model(s).\n\n"
+            content += "## Available Models\n\n"
+            
+            for folder in sorted(model_folders):
+                model_display_name = self._model_titles.get(folder)
+                
+                if model_display_name is None:
+                    # Read model name from the home page if it exists
+                    model_display_name = folder.replace("-", " ").title()
+                    home = self.sink.read_text(f"{folder}/{home_file}")
+                    title = index_emitter.read_title(home) if home is not None else None
+                    if title:
+                        model_display_name = title.split(" - ")[0]
+                
+                content += f"- **[{model_display_name}]({folder}/{home_file})**\n"
+            
+            content += "\n---\n\n"
+            content += "*Documentation automatically generated by Power BI Auto-Documentation Pipeline*\n"
+            
+            self.sink.write_text("README.md", content)
+    
+    def _in_progress(self, folder: str) -> bool:
+        """Whether a run (of any writer sharing the sink) holds a folder."""
+        lock = self.sink.lock(folder)
+        if not lock.acquire(blocking=False):
+            return True
+        lock.release()
+        return False
     
     def _slugify(self, text: str) -> str:
         """Convert text to URL-safe slug."""
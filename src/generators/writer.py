@@ -0,0 +1,140 @@
+# src/generators/writer.py
+"""Executor-backed async front end for output sinks.
+
+Sinks do blocking file or archive I/O. ``AsyncWriter`` runs that I/O on a
+dedicated thread so the event loop keeps serving engine traffic (e.g. MCP
+responses for the next model) while pages are written.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from .sinks import OutputSink
+
+
+class AsyncWriter:
+    """Queues sink operations on a single writer thread.
+    
+    ``write_text`` returns as soon as the write is queued; once
+    ``max_pending`` writes are in flight it waits for one to finish, which
+    bounds the rendered content held in memory. Operations run in submission
+    order, so a read sees every write queued before it.
+    
+    Each write returns its future; callers sharing one writer can wait for
+    and check their own writes. ``flush`` waits for all writes and re-raises
+    the first failure.
+    
+    Attributes:
+        sink: Destination of all writes
+        max_pending: Maximum number of queued writes
+    """
+    
+    def __init__(self, sink: OutputSink, max_pending: int = 64):
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+        self.sink = sink
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="write")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._pending: set[asyncio.Future] = set()
+        self._error: BaseException | None = None
+    
+    async def write_text(self, path: str, content: str) -> asyncio.Future:
+        """Queue a file write, waiting while the queue is full.
+        
+        Args:
+            path: Relative path using forward slashes
+            content: File content
+        
+        Returns:
+            Future completing when the file is written
+        """
+        slots = self._bind_loop()
+        await slots.acquire()
+        future = self._loop.run_in_executor(
+            self._executor, self.sink.write_text, path, content
+        )
+        self._pending.add(future)
+        # Release the slot taken here, even if another loop is bound by then
+        future.add_done_callback(functools.partial(self._write_done, slots, self._pending))
+        return future
+    
+    async def write_files(
+        self,
+        files: list[tuple[str, str]],
+        folder: str
+    ) -> list[asyncio.Future]:
+        """Queue several files into one folder.
+        
+        Args:
+            files: (file name, content) pairs
+            folder: Folder relative to the documentation root
+        
+        Returns:
+            One future per file
+        """
+        return [
+            await self.write_text(f"{folder}/{file_name}", content)
+            for file_name, content in files
+        ]
+    
+    async def read_text(self, path: str) -> str | None:
+        """Read a file back after all previously queued writes."""
+        return await self.run(self.sink.read_text, path)
+    
+    async def list_folders(self) -> list[str]:
+        """List top-level folders after all previously queued writes."""
+        return await self.run(self.sink.list_folders)
+    
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking function on the writer thread, after queued writes."""
+        self._bind_loop()
+        return await self._loop.run_in_executor(self._executor, fn, *args)
+    
+    async def flush(self) -> None:
+        """Wait for all queued writes and raise the first failure, if any."""
+        while self._pending:
+            await asyncio.wait(set(self._pending))
+        self._raise_error()
+    
+    def close(self) -> None:
+        """Wait for queued writes on the writer thread and stop it.
+        
+        Does not close the sink.
+        """
+        self._executor.shutdown(wait=True)
+    
+    def _bind_loop(self) -> asyncio.Semaphore:
+        """Return the slot semaphore for the running loop.
+        
+        A generator may be driven by several ``asyncio.run`` calls in turn;
+        each loop gets fresh slots once the previous loop's writes are done.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._pending and not self._loop.is_closed():
+                raise RuntimeError("AsyncWriter is in use by another event loop")
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._pending = set()
+        return self._slots
+    
+    def _write_done(
+        self,
+        slots: asyncio.Semaphore,
+        pending: set[asyncio.Future],
+        future: asyncio.Future
+    ) -> None:
+        pending.discard(future)
+        slots.release()
+        if not future.cancelled() and future.exception() is not None:
+            if self._error is None:
+                self._error = future.exception()
+    
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
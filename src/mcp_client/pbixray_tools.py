@@ -1,19 +1,155 @@
 # src/mcp_client/pbixray_tools.py
 from dataclasses import dataclass
 import json
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 from .client import MCPClient
 
 
-@dataclass
+def _intern(value: str | None) -> str | None:
+    """Intern a string that repeats across a model (names, types, formats)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Field names observed across engines for each column attribute
+_COLUMN_ALIASES = {
+    "name": ("ColumnName", "Name", "name", "column_name"),
+    "data_type": ("PandasDataType", "DataType", "dataType", "data_type"),
+    "is_hidden": ("IsHidden", "isHidden", "is_hidden"),
+    "description": ("Description", "description"),
+}
+_COLUMN_KEYS = {alias: attr for attr, aliases in _COLUMN_ALIASES.items() for alias in aliases}
+# Keys used by to_dict()
+_COLUMN_DICT_KEYS = {
+    "name": "ColumnName",
+    "data_type": "DataType",
+    "is_hidden": "IsHidden",
+    "description": "Description",
+}
+
+
+class Column:
+    """A table column.
+    
+    Slotted, with interned name and data type, since large models hold tens
+    of thousands of columns. Also reads like the column dicts engines used
+    to return (``col["ColumnName"]``, ``col.get("DataType")``), under any of
+    the field names observed across engines.
+    """
+    
+    __slots__ = ("name", "data_type", "is_hidden", "description", "extra")
+    
+    def __init__(
+        self,
+        name: str,
+        data_type: str | None = None,
+        is_hidden: bool | None = None,
+        description: str | None = None,
+        extra: dict[str, Any] | None = None
+    ):
+        self.name = _intern(name)
+        self.data_type = _intern(data_type)
+        self.is_hidden = is_hidden
+        self.description = description
+        self.extra = extra or None
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Column":
+        """Build a column from an engine's column dict."""
+        values = {}
+        for attr, aliases in _COLUMN_ALIASES.items():
+            for alias in aliases:
+                if data.get(alias) not in (None, ""):
+                    values[attr] = data[alias]
+                    break
+        extra = {k: v for k, v in data.items() if k not in _COLUMN_KEYS}
+        return cls(values.get("name", ""), extra=extra, **{
+            attr: value for attr, value in values.items() if attr != "name"
+        })
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Return the column as a dict with the canonical field names."""
+        data = {"ColumnName": self.name}
+        for attr in ("data_type", "is_hidden", "description"):
+            value = getattr(self, attr)
+            if value is not None:
+                data[_COLUMN_DICT_KEYS[attr]] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+    
+    def __getitem__(self, key: str) -> Any:
+        attr = _COLUMN_KEYS.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            if value is not None:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+    
+    def keys(self) -> Iterable[str]:
+        return self.to_dict().keys()
+    
+    def items(self) -> Iterable[tuple[str, Any]]:
+        return self.to_dict().items()
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Column):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+    
+    __hash__ = None  # Mutable, like the dicts it replaces
+    
+    def __repr__(self) -> str:
+        return f"Column({self.to_dict()!r})"
+    
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+    
+    def __setstate__(self, state: tuple) -> None:
+        for attr, value in zip(self.__slots__, state):
+            setattr(self, attr, value)
+        self.name = _intern(self.name)
+        self.data_type = _intern(self.data_type)
+
+
+def as_columns(columns: Iterable[Any] | None) -> list[Column]:
+    """Convert engine column dicts to ``Column`` objects, keeping other values."""
+    return [
+        Column.from_dict(col) if isinstance(col, dict) else col
+        for col in columns or []
+    ]
+
+
+@dataclass(slots=True)
 class Table:
     name: str
-    columns: list[dict]
+    columns: list[Column]
     row_count: int | None = None
+    lineage_tag: str | None = None
+    
+    def __post_init__(self):
+        self.name = _intern(self.name)
+        self.columns = as_columns(self.columns)
 
 
-@dataclass
+@dataclass(slots=True)
 class Measure:
     name: str
     table: str
@@ -22,9 +158,14 @@ class Measure:
     format_string: str | None = None
     is_hidden: bool = False
     display_folder: str | None = None
+    
+    def __post_init__(self):
+        self.table = _intern(self.table)
+        self.format_string = _intern(self.format_string)
+        self.display_folder = _intern(self.display_folder)
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     from_table: str
     from_column: str
@@ -32,6 +173,13 @@ class Relationship:
     to_column: str
     is_active: bool
     cross_filter_direction: str
+    
+    def __post_init__(self):
+        self.from_table = _intern(self.from_table)
+        self.from_column = _intern(self.from_column)
+        self.to_table = _intern(self.to_table)
+        self.to_column = _intern(self.to_column)
+        self.cross_filter_direction = _intern(self.cross_filter_direction)
 
 
 class PBIXRayClient:
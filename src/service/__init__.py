@@ -0,0 +1,26 @@
+"""Long-running local documentation service.
+
+Keeps engines warm and serves cached metadata and generated pages over
+HTTP on a TCP port or a Unix socket, for callers that would otherwise start
+the CLI once per request.
+"""
+
+from .server import (
+    CachedModel,
+    REQUEST_OPTIONS,
+    DocumentationService,
+    parse_address,
+    serve,
+    serve_forever,
+    source_stamp,
+)
+
+__all__ = [
+    "CachedModel",
+    "DocumentationService",
+    "REQUEST_OPTIONS",
+    "parse_address",
+    "serve",
+    "serve_forever",
+    "source_stamp",
+]
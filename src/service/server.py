@@ -0,0 +1,466 @@
+# src/service/server.py
+"""Long-running documentation service with warm engines.
+
+Calling the CLI per request pays interpreter start, engine start and MCP
+server launch every time. ``DocumentationService`` keeps all of that warm:
+engines stay up in an ``EnginePool``, and each documented model's metadata
+is cached until its source changes, so repeated requests for an unchanged
+model are answered from memory.
+
+``serve`` exposes the service over a minimal HTTP/1.1 interface on a TCP
+port or a Unix socket (stdlib asyncio only)::
+    
+    GET  /health               service and engine pool status
+    POST /document             {"source": ..., "engine": ..., "name": ...,
+                                "options": {...}, "refresh": false}
+    GET  /models               documented models
+    GET  /models/<folder>      cached metadata of a model as JSON
+    GET  /docs/<path>          a generated page, e.g. /docs/sales/Home.md
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+from urllib.parse import unquote
+
+from ..engines import EnginePool, ModelMetadata
+from ..generators.wiki_generator import WikiGenerator
+
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 1 << 20
+
+_CONTENT_TYPES = {
+    ".md": "text/markdown; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json",
+    ".svg": "image/svg+xml",
+}
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+# Engine options a request may set. Options naming executables or scripts
+# (e.g. the MCP server_path) are fixed when the service starts.
+REQUEST_OPTIONS: dict[str, frozenset[str]] = {
+    "pbixray": frozenset(),
+    "mcp": frozenset({"timeout", "max_retries"}),
+}
+
+
+@dataclass
+class CachedModel:
+    """A documented model held by the service.
+    
+    Attributes:
+        source: Model source
+        engine: Engine type
+        options: Engine options
+        name: Display name
+        folder: Output folder of the model's pages
+        metadata: Extracted metadata
+        stamp: Modification stamp of the source when it was extracted
+        documented_at: Time the pages were written (epoch seconds)
+    """
+    source: str
+    engine: str
+    options: dict[str, Any]
+    name: str
+    folder: str
+    metadata: ModelMetadata
+    stamp: tuple | None
+    documented_at: float
+    
+    def describe(self) -> dict[str, Any]:
+        """Summary of the model for API responses."""
+        return {
+            "source": self.source,
+            "engine": self.engine,
+            "name": self.name,
+            "folder": self.folder,
+            "tables": len(self.metadata.tables),
+            "measures": len(self.metadata.measures),
+            "relationships": len(self.metadata.relationships),
+            "documented_at": self.documented_at,
+        }
+
+
+class DocumentationService:
+    """Documents models on request, reusing warm engines and cached results.
+    
+    A model is extracted and rendered again only when its source file or
+    folder changed, when ``refresh`` is requested, or, for live connections
+    without a modification time, once ``live_ttl`` has passed.
+    
+    Attributes:
+        generator: Generator writing the pages
+        pool: Warm engines used for extraction
+        live_ttl: Seconds a live connection's metadata is reused
+        engine_options: Options per engine type fixed by the service
+        request_options: Engine types requests may use, with the options
+                         each request may set
+    """
+    
+    def __init__(
+        self,
+        generator: WikiGenerator,
+        concurrency: int = 2,
+        pool: EnginePool | None = None,
+        live_ttl: float = 300,
+        engine_options: dict[str, dict[str, Any]] | None = None,
+        request_options: dict[str, Iterable[str]] | None = None
+    ):
+        """Create the service.
+        
+        Args:
+            generator: Generator writing the pages
+            concurrency: Maximum number of models documented at once
+            pool: Warm engines (default: a pool of ``concurrency`` engines
+                  per engine type)
+            live_ttl: Seconds a live connection's metadata is reused
+            engine_options: Options per engine type that requests cannot
+                            change (e.g. the MCP ``server_path``)
+            request_options: Engine types requests may use and the options
+                             they may set (default: ``REQUEST_OPTIONS``)
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.generator = generator
+        self.pool = pool or EnginePool(max_engines=concurrency)
+        self.live_ttl = live_ttl
+        self.engine_options = engine_options or {}
+        self.request_options = {
+            engine: frozenset(options)
+            for engine, options in (request_options or REQUEST_OPTIONS).items()
+        }
+        self._slots = asyncio.Semaphore(concurrency)
+        self._models: dict[str, CachedModel] = {}
+        self._keys: dict[str, asyncio.Lock] = {}
+    
+    async def document(
+        self,
+        source: str,
+        engine_type: str = "pbixray",
+        engine_kwargs: dict[str, Any] | None = None,
+        model_name: str | None = None,
+        refresh: bool = False
+    ) -> tuple[CachedModel, bool]:
+        """Document a model unless an up-to-date result is cached.
+        
+        Args:
+            source: Model source (PBIX file, PBIP folder, connection string)
+            engine_type: Documentation engine to use
+            engine_kwargs: Engine-specific configuration options
+            model_name: Display name (derived from source if not provided)
+            refresh: Document again even if the cached result is current
+        
+        Returns:
+            The documented model and whether it came from the cache
+        """
+        engine_kwargs = engine_kwargs or {}
+        name = self.generator.resolve_model_name(source, model_name)
+        folder = self.generator.model_folder(name)
+        # Requests for one model folder are handled one at a time
+        lock = self._keys.setdefault(folder, asyncio.Lock())
+        async with lock:
+            stamp = await asyncio.to_thread(source_stamp, source)
+            cached = self._models.get(folder)
+            if (
+                not refresh
+                and cached is not None
+                and (cached.source, cached.engine, cached.options)
+                == (source, engine_type, engine_kwargs)
+                and self._current(cached, stamp)
+            ):
+                return cached, True
+            
+            async with self._slots:
+                metadata = await self.pool.extract(
+                    source, engine_type, engine_kwargs, self.generator.metadata_parts()
+                )
+                await self.generator.render(metadata, name)
+            model = CachedModel(
+                source, engine_type, engine_kwargs, name, folder, metadata, stamp, time.time()
+            )
+            self._models[folder] = model
+            return model, False
+    
+    def request_kwargs(self, engine_type: str, options: dict[str, Any]) -> dict[str, Any]:
+        """Build engine options for a request from its allowed options.
+        
+        Args:
+            engine_type: Engine requested
+            options: Options sent with the request
+        
+        Returns:
+            The service's fixed options for the engine, updated with the
+            request's options
+        
+        Raises:
+            ValueError: If the engine or an option may not be set by requests
+        """
+        allowed = self.request_options.get(engine_type)
+        if allowed is None:
+            raise ValueError(f"Engine '{engine_type}' is not available")
+        refused = sorted(set(options) - allowed)
+        if refused:
+            raise ValueError(
+                f"Options not allowed for engine '{engine_type}': {', '.join(refused)}"
+            )
+        return {**self.engine_options.get(engine_type, {}), **options}
+    
+    def models(self) -> list[CachedModel]:
+        """Documented models, by folder."""
+        return [self._models[folder] for folder in sorted(self._models)]
+    
+    def model(self, folder: str) -> CachedModel | None:
+        """A documented model by output folder."""
+        return self._models.get(folder)
+    
+    async def read_page(self, path: str) -> str | None:
+        """Read a generated file, after any writes still queued."""
+        return await self.generator.writer.read_text(path)
+    
+    async def close(self) -> None:
+        """Close the warm engines."""
+        await self.pool.close()
+    
+    def _current(self, model: CachedModel, stamp: tuple | None) -> bool:
+        if stamp is None:
+            return time.time() - model.documented_at < self.live_ttl
+        return stamp == model.stamp
+
+
+def source_stamp(source: str) -> tuple | None:
+    """Modification stamp of a file or folder source.
+    
+    Returns:
+        Latest modification time, total size and file count, or None for
+        sources that are not paths (e.g. live connections)
+    """
+    path = Path(source)
+    try:
+        if path.is_file():
+            stat = path.stat()
+            return (stat.st_mtime_ns, stat.st_size, 1)
+        if not path.is_dir():
+            return None
+        latest = size = count = 0
+        for root, _, files in os.walk(path):
+            for file_name in files:
+                stat = os.stat(os.path.join(root, file_name))
+                latest = max(latest, stat.st_mtime_ns)
+                size += stat.st_size
+                count += 1
+        return (latest, size, count)
+    except OSError:
+        return None
+
+
+def parse_address(address: str) -> tuple[str, int] | str:
+    """Parse a service address.
+    
+    Args:
+        address: ``HOST:PORT``, ``PORT``, or a Unix socket path (containing
+                 a slash or ending in ``.sock``)
+    
+    Returns:
+        (host, port) for TCP, or the socket path
+    
+    Raises:
+        ValueError: If the address is invalid
+    """
+    if "/" in address or address.endswith(".sock"):
+        return address
+    host, _, port = address.rpartition(":")
+    if not port.isdigit() or not 0 <= int(port) <= 65535:
+        raise ValueError(f"Invalid service address: {address!r}")
+    return host or "127.0.0.1", int(port)
+
+
+async def serve(service: DocumentationService, address: str) -> asyncio.AbstractServer:
+    """Start serving HTTP requests.
+    
+    Args:
+        service: Service handling the requests
+        address: ``HOST:PORT``, ``PORT`` or a Unix socket path
+    
+    Returns:
+        Started server; close it and then ``service.close()`` to stop
+    """
+    handler = _Handler(service)
+    target = parse_address(address)
+    if isinstance(target, str):
+        server = await asyncio.start_unix_server(handler, path=target)
+    else:
+        server = await asyncio.start_server(handler, target[0], target[1])
+    for sock in server.sockets:
+        logger.info(f"Documentation service listening on {sock.getsockname()}")
+    return server
+
+
+async def serve_forever(service: DocumentationService, address: str) -> None:
+    """Serve requests until cancelled, then close the warm engines."""
+    server = await serve(service, address)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+        if isinstance(parse_address(address), str):
+            Path(address).unlink(missing_ok=True)
+
+
+class _Handler:
+    """Answers one HTTP request per connection."""
+    
+    def __init__(self, service: DocumentationService):
+        self.service = service
+    
+    async def __call__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            try:
+                method, path, body = await _read_request(reader)
+                status, content_type, content = await self.route(method, path, body)
+            except _HTTPError as e:
+                status, content_type, content = _json(e.status, {"error": str(e)})
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(content)}\r\n"
+                "Connection: close\r\n\r\n".encode("latin-1") + content
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def route(self, method: str, path: str, body: bytes) -> tuple[int, str, bytes]:
+        """Dispatch a request; returns status, content type and body."""
+        path = unquote(path.split("?", 1)[0])
+        if path == "/health":
+            _expect(method, "GET")
+            return _json(200, {"status": "ok", **self.service.pool.stats()})
+        if path == "/document":
+            _expect(method, "POST")
+            return await self.document(body)
+        if path == "/models":
+            _expect(method, "GET")
+            return _json(200, {"models": [m.describe() for m in self.service.models()]})
+        if path.startswith("/models/"):
+            _expect(method, "GET")
+            model = self.service.model(path[len("/models/"):])
+            if model is None:
+                raise _HTTPError(404, f"Unknown model: {path[len('/models/'):]}")
+            return _json(200, {**model.describe(), "metadata": model.metadata})
+        if path.startswith("/docs/"):
+            _expect(method, "GET")
+            page = path[len("/docs/"):]
+            try:
+                content = await self.service.read_page(page) if page else None
+            except (ValueError, OSError):
+                # Paths outside the documentation root, folders, unreadable files
+                content = None
+            if content is None:
+                raise _HTTPError(404, f"No such page: {page}")
+            content_type = _CONTENT_TYPES.get(Path(page).suffix, "text/plain; charset=utf-8")
+            return 200, content_type, content.encode("utf-8")
+        raise _HTTPError(404, f"Not found: {path}")
+    
+    async def document(self, body: bytes) -> tuple[int, str, bytes]:
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            raise _HTTPError(400, "Request body must be JSON")
+        if not isinstance(request, dict) or not isinstance(request.get("source"), str):
+            raise _HTTPError(400, "'source' is required")
+        options = request.get("options") or {}
+        if not isinstance(options, dict):
+            raise _HTTPError(400, "'options' must be an object")
+        engine_type = request.get("engine", "pbixray")
+        if not isinstance(engine_type, str):
+            raise _HTTPError(400, "'engine' must be a string")
+        try:
+            engine_kwargs = self.service.request_kwargs(engine_type, options)
+        except ValueError as e:
+            raise _HTTPError(400, str(e))
+        
+        start = time.perf_counter()
+        try:
+            model, cached = await self.service.document(
+                request["source"],
+                engine_type=engine_type,
+                engine_kwargs=engine_kwargs,
+                model_name=request.get("name"),
+                refresh=bool(request.get("refresh", False)),
+            )
+        except Exception as e:
+            logger.error(f"Failed to document {request['source']}: {e}")
+            return _json(500, {"error": str(e) or type(e).__name__})
+        return _json(200, {
+            **model.describe(),
+            "cached": cached,
+            "seconds": round(time.perf_counter() - start, 4),
+        })
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _expect(method: str, allowed: str) -> None:
+    if method != allowed:
+        raise _HTTPError(405, f"Use {allowed}")
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    """Read a request line, headers and body."""
+    parts = (await reader.readline()).decode("latin-1").split()
+    if len(parts) != 3:
+        raise _HTTPError(400, "Malformed request line")
+    method, path, _ = parts
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            try:
+                length = int(value.strip())
+            except ValueError:
+                raise _HTTPError(400, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise _HTTPError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path, body
+
+
+def _json(status: int, payload: Any) -> tuple[int, str, bytes]:
+    return status, "application/json", json.dumps(payload, default=_encode).encode("utf-8")
+
+
+def _encode(obj: Any) -> Any:
+    """JSON fallback encoder for metadata objects."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    return repr(obj)
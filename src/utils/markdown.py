@@ -26,12 +26,15 @@ def create_table(headers: list[str], rows: list[list[str]]) -> str:
         return ""
     
     # Build header
-    header_row = "| " + " | ".join(headers) + " |"
+    header_row = create_table_row(headers)
     separator = "|" + "|".join(["-" * (len(h) + 2) for h in headers]) + "|"
     
     # Build rows
-    data_rows = []
-    for row in rows:
-        data_rows.append("| " + " | ".join(str(cell) for cell in row) + " |")
+    data_rows = [create_table_row(row) for row in rows]
     
     return "\n".join([header_row, separator] + data_rows)
+
+
+def create_table_row(cells: list) -> str:
+    """Create a single markdown table row."""
+    return "| " + " | ".join(str(cell) for cell in cells) + " |"
@@ -0,0 +1,201 @@
+"""Tests for batch source expansion, scheduling and running."""
+
+import asyncio
+import json
+
+import pytest
+from src.batch import BatchJob, expand_sources, load_manifest, run_batch, run_pipeline, schedule, summarize
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import make_metadata
+
+
+pytestmark = pytest.mark.usefixtures("static_engine")
+
+
+def test_expand_globs_and_literals(tmp_path):
+    """Test that globs expand and unmatched sources are kept."""
+    (tmp_path / "a.pbix").write_bytes(b"a")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.pbix").write_bytes(b"bb")
+    
+    jobs = expand_sources([f"{tmp_path}/**/*.pbix", "localhost:1234", str(tmp_path / "a.pbix")])
+    
+    assert [j.source for j in jobs] == [
+        str(tmp_path / "a.pbix"),
+        str(tmp_path / "sub" / "b.pbix"),
+        "localhost:1234",
+    ]
+
+
+def test_schedule_longest_first(tmp_path):
+    """Test longest-processing-time-first ordering by file size."""
+    for name, size in [("small", 1), ("big", 100), ("mid", 10)]:
+        (tmp_path / f"{name}.pbix").write_bytes(b"x" * size)
+    jobs = expand_sources([str(tmp_path / f"{n}.pbix") for n in ("small", "big", "mid")])
+    jobs.append(BatchJob("localhost:1234"))
+    
+    assert [j.cost for j in schedule(jobs)] == [100, 10, 1, 0]
+
+
+def test_manifest_options(tmp_path):
+    """Test per-model engine, name and options from a manifest."""
+    (tmp_path / "sales.pbix").write_bytes(b"x")
+    (tmp_path / "manifest.json").write_text(json.dumps({
+        "defaults": {"options": {"timeout": 30}},
+        "models": [
+            "*.pbix",
+            {"source": "Sales.SemanticModel", "engine": "mcp", "name": "Sales", "options": {"timeout": 90}},
+        ],
+    }))
+    
+    jobs = load_manifest(tmp_path / "manifest.json", engine_kwargs={"mcp": {"mode": "readonly"}})
+    
+    assert jobs[0].source == str(tmp_path / "sales.pbix")
+    assert jobs[0].engine_kwargs == {"timeout": 30}
+    assert jobs[1].name == "Sales"
+    assert jobs[1].engine_kwargs == {"mode": "readonly", "timeout": 90}
+    
+    (tmp_path / "bad.json").write_text('{"models": [{"name": "x"}]}')
+    with pytest.raises(ValueError, match="without source"):
+        load_manifest(tmp_path / "bad.json")
+
+
+@pytest.mark.asyncio
+async def test_failed_job_does_not_abort_batch():
+    """Test that one failing model is reported while the others complete."""
+    jobs = [
+        BatchJob("Alpha.pbix", engine="static", engine_kwargs={"metadata": make_metadata()}),
+        BatchJob("Broken.pbix", engine="static", engine_kwargs={"metadata": None}),
+        BatchJob("Gamma.pbix", engine="static", engine_kwargs={"metadata": make_metadata(5)}),
+    ]
+    sink = MemorySink()
+    with WikiGenerator(sink=sink) as generator:
+        results = await run_batch(generator, jobs, workers=2)
+    
+    assert [r.ok for r in results] == [True, False, True]
+    assert "alpha/Home.md" in sink.files and "gamma/Home.md" in sink.files
+    assert "2 succeeded, 1 failed" in summarize(results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("runner", [run_batch, run_pipeline])
+async def test_same_model_folder_rejected_up_front(runner):
+    """Test that sources sharing a model folder are rejected before any work."""
+    jobs = [
+        BatchJob(f"{folder}/Sales.pbix", engine="static", engine_kwargs={"metadata": make_metadata()})
+        for folder in ("north", "south")
+    ]
+    sink = MemorySink()
+    with WikiGenerator(sink=sink) as generator:
+        with pytest.raises(ValueError, match="both be documented in folder 'sales'"):
+            await runner(generator, jobs)
+        
+        jobs[1].name = "Sales South"
+        assert all(r.ok for r in await runner(generator, jobs))
+    assert "sales/Home.md" in sink.files and "sales-south/Home.md" in sink.files
+
+
+@pytest.mark.asyncio
+async def test_pipeline_matches_batch_output():
+    """Test that the pipelined mode writes the same files and reports failures."""
+    def make_jobs():
+        return [
+            BatchJob("Alpha.pbix", engine="static", engine_kwargs={"metadata": make_metadata()}),
+            BatchJob("Broken.pbix", engine="static", engine_kwargs={"metadata": None}),
+            BatchJob("Gamma.pbix", name="Gamma Model", engine="static",
+                     engine_kwargs={"metadata": make_metadata(5)}),
+        ]
+    
+    expected = MemorySink()
+    with WikiGenerator(sink=expected) as generator:
+        await run_batch(generator, make_jobs())
+    
+    sink = MemorySink()
+    with WikiGenerator(sink=sink) as generator:
+        results = await run_pipeline(generator, make_jobs(), extractors=2, renderers=2)
+    
+    assert [r.ok for r in results] == [True, False, True]
+    assert sink.files == expected.files
+
+
+@pytest.mark.asyncio
+async def test_pipeline_bounds_extracted_models():
+    """Test that extraction runs ahead of rendering only up to the queue depth."""
+    jobs = [
+        BatchJob(f"Model{i}.pbix", engine="static", engine_kwargs={"metadata": make_metadata()})
+        for i in range(8)
+    ]
+    held = 0
+    peak = 0
+    
+    with WikiGenerator(sink=MemorySink()) as generator:
+        extract, render = generator.extract, generator.render
+        
+        async def counting_extract(*args, **kwargs):
+            nonlocal held, peak
+            metadata = await extract(*args, **kwargs)
+            held += 1
+            peak = max(peak, held)
+            return metadata
+        
+        async def slow_render(metadata, model_name):
+            nonlocal held
+            await asyncio.sleep(0.01)
+            await render(metadata, model_name)
+            held -= 1
+        
+        generator.extract, generator.render = counting_extract, slow_render
+        results = await run_pipeline(generator, jobs, extractors=2, renderers=1, queue_depth=2)
+    
+    assert all(r.ok for r in results)
+    # Extractors ran ahead of the renderer, but never further than the bound
+    assert 1 < peak <= 2 + 2 + 1
+
+
+class Abort(BaseException):
+    """Error that per-job ``except Exception`` handlers do not catch."""
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stops_extractors_when_a_renderer_dies():
+    """Test that extractors blocked on the full queue are cancelled."""
+    jobs = [
+        BatchJob(f"Model{i}.pbix", engine="static", engine_kwargs={"metadata": make_metadata()})
+        for i in range(6)
+    ]
+    
+    async def dying_render(metadata, model_name):
+        await asyncio.sleep(0.01)
+        raise Abort()
+    
+    with WikiGenerator(sink=MemorySink()) as generator:
+        generator.render = dying_render
+        with pytest.raises(Abort):
+            await asyncio.wait_for(
+                run_pipeline(generator, jobs, extractors=2, renderers=1, queue_depth=1), 5
+            )
+        await asyncio.sleep(0)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_times_exclude_queue_wait():
+    """Test that a model's time counts extraction and rendering, not waiting."""
+    jobs = [
+        BatchJob(f"Model{i}.pbix", engine="static", engine_kwargs={"metadata": make_metadata()})
+        for i in range(4)
+    ]
+    
+    with WikiGenerator(sink=MemorySink()) as generator:
+        render = generator.render
+        
+        async def slow_render(metadata, model_name):
+            await asyncio.sleep(0.05)
+            await render(metadata, model_name)
+        
+        generator.render = slow_render
+        results = await run_pipeline(generator, jobs, extractors=4, renderers=1, queue_depth=4)
+    
+    # Queued models waited for up to three renders before their own
+    assert all(r.ok and r.seconds < 0.1 for r in results)
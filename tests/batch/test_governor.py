@@ -0,0 +1,109 @@
+"""Tests for per-model resource limits."""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from src.batch import BatchJob, ResourceGovernor, ResourceLimitExceeded, run_batch
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import StaticEngine, make_metadata
+
+
+class MisbehavingEngine(StaticEngine):
+    """Engine that hangs, hogs memory or fails depending on its source.
+    
+    Each load appends the source to ``log``; a hanging load starts a child
+    "server" process and records its pid there first.
+    """
+    
+    def __init__(self, log: str):
+        super().__init__(make_metadata(2))
+        self.log = log
+    
+    async def load_model(self, source: str, **kwargs) -> None:
+        with open(self.log, "a") as f:
+            f.write(f"{source}\n")
+        if source.startswith("hang"):
+            server = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+            with open(self.log, "a") as f:
+                f.write(f"server {server.pid}\n")
+            time.sleep(60)
+        elif source.startswith("hog"):
+            hog = bytearray(400 * 2**20)
+            time.sleep(60)
+            del hog
+        elif source.startswith("broken"):
+            raise ValueError("Corrupt model")
+        print("noise on stdout")
+
+
+@pytest.fixture(autouse=True)
+def misbehaving_engine(use_engine):
+    use_engine("misbehaving", MisbehavingEngine)
+
+
+def job(source, log):
+    return BatchJob(source, engine="misbehaving", engine_kwargs={"log": str(log)})
+
+
+def alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    with open(f"/proc/{pid}/stat") as f:
+        return f.read().split(")")[-1].split()[0] != "Z"
+
+
+@pytest.mark.asyncio
+async def test_extracts_in_a_separate_process(tmp_path):
+    """Test that metadata comes back from the child despite engine output."""
+    governor = ResourceGovernor(max_rss_mb=1000, timeout=30)
+    metadata = await governor.extract(job("ok.pbix", tmp_path / "log"))
+    
+    assert [t.name for t in metadata.tables] == [t.name for t in make_metadata(2).tables]
+    with pytest.raises(RuntimeError, match="Corrupt model"):
+        await governor.extract(job("broken.pbix", tmp_path / "log"))
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+@pytest.mark.asyncio
+async def test_limits_kill_the_whole_session(tmp_path):
+    """Test that a breach kills the extraction and any server it started."""
+    governor = ResourceGovernor(max_rss_mb=200, timeout=6, poll_seconds=0.05)
+    
+    start = time.monotonic()
+    with pytest.raises(ResourceLimitExceeded, match="MB"):
+        await governor.extract(job("hog.pbix", tmp_path / "log"))
+    with pytest.raises(ResourceLimitExceeded, match="timed out"):
+        await governor.extract(job("hang.pbix", tmp_path / "log"))
+    assert time.monotonic() - start < 30
+    
+    server = int((tmp_path / "log").read_text().split("server ")[1])
+    for _ in range(50):
+        if not alive(server):
+            break
+        time.sleep(0.1)
+    assert not alive(server)
+
+
+@pytest.mark.asyncio
+async def test_batch_retries_breaches_once(tmp_path):
+    """Test that an offending model is retried once, then fails alone."""
+    log = tmp_path / "log"
+    jobs = [job("hang.pbix", log), job("a.pbix", log), job("broken.pbix", log), job("b.pbix", log)]
+    governor = ResourceGovernor(timeout=6, poll_seconds=0.05)
+    
+    with WikiGenerator(sink=MemorySink()) as generator:
+        results = await run_batch(generator, jobs, workers=2, governor=governor)
+    
+    assert [r.ok for r in results] == [False, True, False, True]
+    assert "timed out" in results[0].error
+    assert results[2].error == "Corrupt model"
+    loads = [line for line in log.read_text().splitlines() if not line.startswith("server")]
+    # The retry runs after every other model
+    assert loads.count("hang.pbix") == 2 and loads.count("broken.pbix") == 1
+    assert loads[-1] == "hang.pbix"
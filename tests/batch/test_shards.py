@@ -0,0 +1,97 @@
+"""Tests for CI sharding of batch runs."""
+
+import random
+import shutil
+
+import pytest
+from src.batch import (
+    BatchJob,
+    BatchResult,
+    assign_shards,
+    load_timings,
+    parse_shard,
+    shard_jobs,
+    write_report,
+)
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import make_metadata
+
+
+pytestmark = pytest.mark.usefixtures("static_engine")
+
+
+def make_jobs(tmp_path, sizes):
+    jobs = []
+    for i, size in enumerate(sizes):
+        path = tmp_path / f"model{i:02d}.pbix"
+        path.write_bytes(b"x" * size)
+        jobs.append(BatchJob(str(path)))
+    return jobs
+
+
+def test_parse_shard():
+    """Test shard specifications are 1-based and validated."""
+    assert parse_shard("2/4") == (2, 4)
+    for spec in ("0/4", "5/4", "1/0", "1", "a/b"):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            parse_shard(spec)
+
+
+def test_shards_balanced_and_order_independent(tmp_path):
+    """Test that every job lands on exactly one shard regardless of input order."""
+    jobs = make_jobs(tmp_path, [90, 70, 60, 40, 30, 30, 20, 10])
+    shards = assign_shards(jobs, 3)
+    
+    shuffled = list(jobs)
+    random.Random(1).shuffle(shuffled)
+    assert [[j.source for j in s] for s in assign_shards(shuffled, 3)] == [
+        [j.source for j in s] for s in shards
+    ]
+    assert sorted(j.source for s in shards for j in s) == sorted(j.source for j in jobs)
+    assert [sum(j.cost for j in s) for s in shards] == [120, 120, 110]
+    assert shard_jobs(jobs, 2, 3) == shards[1]
+    
+    # Sources without a size are spread evenly
+    unknown = [BatchJob(f"localhost:{port}") for port in range(4)]
+    assert [len(s) for s in assign_shards(unknown, 2)] == [2, 2]
+
+
+def test_shards_use_previous_timings(tmp_path):
+    """Test that measured times override sizes and scale untimed models."""
+    jobs = make_jobs(tmp_path, [100, 100, 100, 50])
+    results = [
+        BatchResult(jobs[0], True, 60.0),
+        BatchResult(jobs[1], True, 10.0),
+        BatchResult(jobs[2], False, 5.0, "boom"),
+    ]
+    write_report(results, tmp_path / "out" / "report.json")
+    timings = load_timings(tmp_path / "out" / "report.json")
+    
+    assert timings[jobs[2].source] == 5.0
+    # The slow model gets a shard to itself; the 50-byte model is estimated at 12.5s
+    assert assign_shards(jobs, 2, timings) == [[jobs[0]], [jobs[3], jobs[1], jobs[2]]]
+    
+    (tmp_path / "bad.json").write_text("{}")
+    with pytest.raises(ValueError, match="Invalid report"):
+        load_timings(tmp_path / "bad.json")
+
+
+@pytest.mark.asyncio
+async def test_merge_index_after_shards(tmp_path):
+    """Test that shards skip the models index and a merge step rebuilds it."""
+    for shard, name in enumerate(["Alpha", "Beta"]):
+        with WikiGenerator(str(tmp_path / f"shard{shard}"), write_index=False) as generator:
+            await generator.generate(
+                f"{name}.pbix",
+                engine_type="static",
+                engine_kwargs={"metadata": make_metadata()}
+            )
+        assert not (tmp_path / f"shard{shard}" / "README.md").exists()
+        shutil.copytree(tmp_path / f"shard{shard}", tmp_path / "docs", dirs_exist_ok=True)
+    
+    with WikiGenerator(str(tmp_path / "docs")) as generator:
+        generator.write_models_index()
+    
+    index = (tmp_path / "docs" / "README.md").read_text(encoding="utf-8")
+    assert "- **[Alpha](alpha/Home.md)**" in index
+    assert "- **[Beta](beta/Home.md)**" in index
@@ -0,0 +1,159 @@
+"""Tests for the filesystem work queue."""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+from src.batch import BatchJob, enqueue, queue_status, reclaim_expired, run_worker, summarize
+from src.batch import workqueue
+from src.batch.workqueue import QueuedJob, claim_next
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import StaticEngine, make_metadata
+
+
+class SampleEngine(StaticEngine):
+    """Static engine configured by JSON-serializable options."""
+    
+    def __init__(self, tables: int = 3):
+        super().__init__(make_metadata(tables))
+
+
+@pytest.fixture(autouse=True)
+def sample_engine(use_engine):
+    use_engine("sample", SampleEngine)
+
+
+def sample_jobs(*names, **options):
+    return [BatchJob(f"{name}.pbix", engine="sample", engine_kwargs=dict(options)) for name in names]
+
+
+def age(path, seconds):
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def test_enqueue_is_idempotent(tmp_path):
+    """Test that sources are queued once and claimed in rank order."""
+    (tmp_path / "big.pbix").write_bytes(b"x" * 100)
+    jobs = [BatchJob("localhost:1234"), BatchJob(str(tmp_path / "big.pbix"))]
+    
+    assert enqueue(tmp_path / "q", jobs) == 2
+    assert enqueue(tmp_path / "q", jobs) == 0
+    
+    entry, job = claim_next(tmp_path / "q", "node-a")
+    assert job.source == str(tmp_path / "big.pbix")
+    assert (tmp_path / "q" / "claimed" / f"{entry.file_name}.lease").read_text() == "node-a"
+    assert queue_status(tmp_path / "q") == {"pending": 1, "claimed": 1, "done": 0, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_nodes_share_the_queue(tmp_path):
+    """Test that concurrent nodes document every model exactly once."""
+    queue = tmp_path / "q"
+    enqueue(queue, sample_jobs("A", "B", "C", "D", "E"))
+    enqueue(queue, [BatchJob("Broken.pbix", engine="missing")])
+    
+    sinks = [MemorySink(), MemorySink()]
+    generators = [WikiGenerator(sink=sink) for sink in sinks]
+    results = await asyncio.gather(*(
+        run_worker(generator, queue, workers=2, node=f"node-{i}", poll_seconds=0.01)
+        for i, generator in enumerate(generators)
+    ))
+    for generator in generators:
+        generator.close()
+    
+    documented = sorted(r.job.source for node in results for r in node)
+    assert documented == ["A.pbix", "B.pbix", "Broken.pbix", "C.pbix", "D.pbix", "E.pbix"]
+    assert queue_status(queue) == {"pending": 0, "claimed": 0, "done": 5, "failed": 1}
+    homes = [p for sink in sinks for p in sink.files if p.endswith("/Home.md")]
+    assert len(homes) == 5
+    
+    failure = json.loads(next((queue / "failed").glob("*.json")).read_text())
+    assert failure["source"] == "Broken.pbix" and not failure["ok"]
+
+
+@pytest.mark.asyncio
+async def test_crashed_node_work_is_reclaimed(tmp_path):
+    """Test that an expired claim is returned to the queue and documented."""
+    queue = tmp_path / "q"
+    enqueue(queue, sample_jobs("Orphan"))
+    entry, _ = claim_next(queue, "crashed-node")
+    claimed = queue / "claimed" / entry.file_name
+    age(claimed, 60)
+    age(claimed.with_name(claimed.name + ".lease"), 60)
+    
+    with WikiGenerator(sink=MemorySink()) as generator:
+        results = await run_worker(generator, queue, lease_seconds=30, poll_seconds=0.01)
+    
+    assert [r.ok for r in results] == [True]
+    record = json.loads((queue / "done" / f"{entry.key}.json").read_text())
+    assert record["attempt"] == 1
+    assert queue_status(queue)["claimed"] == 0
+
+
+def test_repeatedly_expired_job_fails(tmp_path):
+    """Test that a job whose lease keeps expiring is recorded as failed."""
+    queue = tmp_path / "q"
+    enqueue(queue, sample_jobs("Crashy"))
+    for _ in range(2):
+        entry, _ = claim_next(queue, "node")
+        age(queue / "claimed" / entry.file_name, 60)
+        (queue / "claimed" / f"{entry.file_name}.lease").unlink()
+        assert reclaim_expired(queue, lease_seconds=30, max_attempts=2) == 1
+    
+    assert queue_status(queue) == {"pending": 0, "claimed": 0, "done": 0, "failed": 1}
+    record = json.loads((queue / "failed" / f"{entry.key}.json").read_text())
+    assert record["error"] == "Lease expired 2 times"
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_result_leaves_other_workers_running(tmp_path, monkeypatch):
+    """Test that a failure to record one result only affects that job."""
+    queue = tmp_path / "q"
+    enqueue(queue, sample_jobs("A", "B", "C"))
+    write_result = workqueue._write_result
+    failures = []
+    
+    def flaky_write_result(queue_dir, state, key, record):
+        if record["source"] == "B.pbix" and not failures:
+            failures.append(key)
+            raise OSError("No space left on device")
+        write_result(queue_dir, state, key, record)
+    
+    monkeypatch.setattr(workqueue, "_write_result", flaky_write_result)
+    with WikiGenerator(sink=MemorySink()) as generator:
+        results = await run_worker(
+            generator, queue, workers=2, lease_seconds=0.2, poll_seconds=0.01
+        )
+    
+    outcomes = sorted((r.job.source, r.ok) for r in results)
+    assert outcomes == [("A.pbix", True), ("B.pbix", False), ("B.pbix", True), ("C.pbix", True)]
+    assert "Could not record result" in next(r.error for r in results if not r.ok)
+    assert queue_status(queue) == {"pending": 0, "claimed": 0, "done": 3, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_lost_lease_is_reported(tmp_path):
+    """Test that a job taken over by another node shows up in the results."""
+    queue = tmp_path / "q"
+    enqueue(queue, sample_jobs("Slow"))
+    
+    with WikiGenerator(sink=MemorySink()) as generator:
+        generate = generator.generate
+        
+        async def reclaimed_meanwhile(source, **kwargs):
+            claimed = next((queue / "claimed").glob("*.json"), None)
+            entry = QueuedJob.parse(claimed.name)
+            if entry.attempt == 0:
+                # Another node reclaims the job while it is being documented
+                os.rename(claimed, queue / "pending" / entry.retry().file_name)
+            return await generate(source, **kwargs)
+        
+        generator.generate = reclaimed_meanwhile
+        results = await run_worker(generator, queue, poll_seconds=0.01)
+    
+    assert [(r.ok, r.superseded) for r in results] == [(True, True), (True, False)]
+    assert "1 succeeded, 0 failed, 1 taken over by other nodes" in summarize(results)
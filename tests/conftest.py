@@ -0,0 +1,26 @@
+"""Shared fixtures."""
+
+import pytest
+from src.engines import ModelMetadata, registry
+from tests.helpers import StaticEngine, make_metadata
+
+
+@pytest.fixture
+def use_engine(monkeypatch):
+    """Register engines for one test; they are unregistered afterwards."""
+    def register(name, engine_class):
+        monkeypatch.setitem(registry._ENGINE_REGISTRY, name, engine_class)
+    
+    return register
+
+
+@pytest.fixture
+def static_engine(use_engine):
+    """Register ``StaticEngine`` as the "static" engine."""
+    use_engine("static", StaticEngine)
+
+
+@pytest.fixture
+def metadata() -> ModelMetadata:
+    """Small sample model."""
+    return make_metadata()
@@ -0,0 +1,153 @@
+"""Tests for metadata loaded on first access."""
+
+import asyncio
+
+import pytest
+from src.engines import LazyModelMetadata, MetadataChunk, ModelMetadata, resolve_include
+from src.engines.mcp import ModelingMCPEngine
+from src.engines.pbixray import PBIXRayEngine
+from src.mcp_client.pbixray_tools import Table
+from tests.helpers import FakePBIXRayClient, FakeServer, StaticEngine, make_metadata
+
+
+class CountingEngine(StaticEngine):
+    """Engine over a fixed model that counts table fetches."""
+    
+    def __init__(self, tables: int):
+        super().__init__(make_metadata(tables))
+        self.fetched = []
+        self.in_flight = 0
+        self.peak = 0
+        self.extracts = []
+    
+    async def extract_metadata(self, include=None) -> ModelMetadata:
+        parts = resolve_include(include)
+        self.extracts.append(parts)
+        full = self.metadata
+        return ModelMetadata(
+            summary=full.summary if "summary" in parts else {},
+            tables=[Table(t.name, []) for t in full.tables] if "tables" in parts else [],
+            measures=[],
+            relationships=full.relationships if "relationships" in parts else [],
+            power_query=full.power_query if "power_query" in parts else None,
+        )
+    
+    async def extract_table(self, table_name: str) -> MetadataChunk:
+        self.fetched.append(table_name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if table_name == "Dim 5":
+            raise RuntimeError("schema unavailable")
+        table = next(t for t in self.metadata.tables if t.name == table_name)
+        return MetadataChunk(
+            tables=[table],
+            measures=[m for m in self.metadata.measures if m.table == table_name],
+        )
+
+
+@pytest.mark.asyncio
+async def test_tables_load_on_first_access_with_siblings():
+    """Test memoized, batched loading of tables and other parts."""
+    engine = CountingEngine(tables=8)
+    metadata = await LazyModelMetadata.open(engine, prefetch=3)
+    assert metadata.table_names[:2] == ["Sales", "Dim 1"] and engine.fetched == []
+    
+    # Concurrent requests share one fetch; two siblings come along
+    first, again = await asyncio.gather(metadata.columns("Sales"), metadata.columns("Sales"))
+    assert [c["ColumnName"] for c in first] == ["Key", "Name"] and again is first
+    assert engine.fetched == ["Sales", "Dim 1", "Dim 2"]
+    assert [m.name for m in await metadata.table_measures("Sales")] == ["Total", "Count"]
+    assert metadata.is_loaded("Dim 2") and not metadata.is_loaded("Dim 3")
+    assert len(engine.fetched) == 3
+    
+    with pytest.raises(RuntimeError, match="schema unavailable"):
+        await metadata.columns("Dim 5")
+    with pytest.raises(ValueError, match="No table named"):
+        await metadata.columns("Nope")
+    
+    assert len(await metadata.relationships()) == 7
+    await metadata.relationships()
+    assert [parts for parts in engine.extracts if "relationships" in parts] == [{"relationships"}]
+    assert engine.peak <= 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("started", [False, True])
+async def test_cancelled_prefetch_fails_waiters_and_retries(started):
+    """Test that cancelling a batch leaves no table hanging."""
+    engine = CountingEngine(tables=4)
+    metadata = await LazyModelMetadata.open(engine, prefetch=2)
+    waiter = asyncio.create_task(metadata.columns("Sales"))
+    await asyncio.sleep(0)
+    if started:
+        await asyncio.sleep(0.005)
+        assert engine.in_flight
+    for batch in list(metadata._batches):
+        batch.cancel()
+    
+    with pytest.raises(RuntimeError, match="was cancelled"):
+        await asyncio.wait_for(waiter, 1)
+    assert not metadata.is_loaded("Dim 1")
+    columns = await asyncio.wait_for(metadata.columns("Dim 1"), 1)
+    assert [c["ColumnName"] for c in columns] == ["Key", "Name"]
+    
+    # A cancelled table future counts as not loaded rather than raising
+    metadata._loading["Dim 3"] = asyncio.get_running_loop().create_future()
+    metadata._loading["Dim 3"].cancel()
+    assert not metadata.is_loaded("Dim 3")
+
+
+class WholeModelEngine(StaticEngine):
+    """Engine that can only extract whole models."""
+    
+    calls = 0
+    
+    async def extract_metadata(self, include=None) -> ModelMetadata:
+        WholeModelEngine.calls += 1
+        return self.metadata
+
+
+@pytest.mark.asyncio
+async def test_load_and_engines_without_extract_table():
+    """Test materializing everything, and the fallback for whole-model engines."""
+    metadata = await LazyModelMetadata.open(WholeModelEngine(make_metadata(4)))
+    assert [c["ColumnName"] for c in await metadata.columns("Dim 3")] == ["Key", "Name"]
+    assert all(metadata.is_loaded(name) for name in metadata.table_names)
+    
+    full = await metadata.load()
+    assert [t.name for t in full.tables] == ["Sales", "Dim 1", "Dim 2", "Dim 3"]
+    assert len(full.measures) == 2 and full.power_query is not None
+    # Open, all tables, relationships and Power Query
+    assert WholeModelEngine.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_mcp_table_needs_one_schema_call(tmp_path):
+    """Test that a lazily loaded MCP table costs a single GetSchema call."""
+    (tmp_path / "Sales").mkdir()
+    engine = ModelingMCPEngine()
+    engine.mcp_client = server = FakeServer()
+    engine._connection = object()  # Server already running
+    await engine.load_model(str(tmp_path / "Sales"))
+    metadata = await LazyModelMetadata.open(engine)
+    
+    server.requests = []
+    table = await metadata.table("Sales Facts")
+    assert table.columns == [{"ColumnName": "Key", "DataType": "int64", "IsHidden": False}]
+    assert [m.name for m in await metadata.table_measures("Sales Facts")] == ["Sales Total"]
+    assert [r["operation"] for _, r in server.requests] == ["GetSchema"]
+
+
+@pytest.mark.asyncio
+async def test_pbixray_fetches_measures_once():
+    """Test that PBIXRay tables share one measures call."""
+    engine = PBIXRayEngine()
+    engine.pbi_client = client = FakePBIXRayClient()
+    sales, dates = await asyncio.gather(
+        engine.extract_table("Sales"), engine.extract_table("Dates")
+    )
+    assert [m.name for m in sales.measures] == ["Total"] and dates.measures == []
+    assert client.calls.count("get_measures") == 1
+    assert client.calls.count("get_schema") == 2
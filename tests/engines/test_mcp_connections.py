@@ -0,0 +1,102 @@
+"""Tests for named connections on one Modeling MCP engine."""
+
+import asyncio
+
+import pytest
+from src.engines.mcp import ModelingMCPEngine
+from tests.helpers import FakeServer
+
+
+@pytest.fixture
+def engine():
+    engine = ModelingMCPEngine()
+    engine.mcp_client = FakeServer()
+    engine._connection = object()  # Server already running
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_concurrent_extraction_on_named_connections(engine, tmp_path):
+    """Test that each extraction is routed through its own connection."""
+    for name in ("Sales", "Finance"):
+        (tmp_path / name).mkdir()
+    await engine.load_model(str(tmp_path / "Sales"))
+    assert await engine.connect(str(tmp_path / "Finance"), name="finance") == "finance"
+    assert engine.connections == ["finance"]
+    
+    sales, finance = await asyncio.gather(
+        engine.extract_metadata(),
+        engine.extract_metadata(connection="finance"),
+    )
+    assert sales.summary["name"] == "Sales"
+    assert [m.name for m in sales.measures] == ["Sales Total"]
+    assert finance.summary["name"] == "Finance"
+    assert [t.name for t in finance.tables] == ["Finance Facts"]
+    
+    schemas = len(engine.mcp_client.requests)
+    chunks = [c async for c in engine.iter_metadata(connection="finance")]
+    assert chunks[1].tables[0].columns[0].name == "Key"
+    assert chunks[1].measures[0].name == "Finance Total"
+    # Columns and measures come from one GetSchema call per table
+    assert [
+        r["operation"] for _, r in engine.mcp_client.requests[schemas:]
+    ].count("GetSchema") == 1
+    
+    with pytest.raises(ValueError, match="No connection named"):
+        await engine.extract_metadata(connection="hr")
+    with pytest.raises(ValueError, match="already open"):
+        await engine.connect(str(tmp_path / "Sales"), name="finance")
+    
+    await engine.disconnect("finance")
+    assert engine.connections == [] and list(engine.mcp_client.folders) == ["conn-1"]
+
+
+@pytest.mark.asyncio
+async def test_close_disconnects_every_connection(engine, tmp_path):
+    """Test that closing the engine disconnects named and loaded models."""
+    server = engine.mcp_client
+    for name in ("A", "B", "C"):
+        (tmp_path / name).mkdir()
+        await engine.connect(str(tmp_path / name))
+    assert engine.connections == [str(tmp_path / name) for name in "ABC"]
+    
+    engine._connection = None  # Nothing to shut down
+    await engine.close()
+    assert server.folders == {}
+    assert engine.connections == []
+
+
+class UnnamedServer(FakeServer):
+    """Leaves connections unnamed, routing requests to the last one used."""
+    
+    async def call_tool(self, tool, arguments):
+        request = arguments["request"]
+        if "connectionName" not in request and self.folders:
+            request["connectionName"] = list(self.folders)[-1]
+        response = await super().call_tool(tool, arguments)
+        if request["operation"] == "ConnectFolder":
+            response["data"] = {}
+        return response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("named_first", [True, False])
+async def test_unroutable_connection_is_closed(tmp_path, named_first):
+    """Test that an unnamed connection next to others is closed and rejected."""
+    engine = ModelingMCPEngine()
+    engine.mcp_client = server = UnnamedServer()
+    engine._connection = object()
+    for name in ("A", "B"):
+        (tmp_path / name).mkdir()
+    
+    if named_first:
+        await engine.connect(str(tmp_path / "A"), name="a")
+        with pytest.raises(RuntimeError, match="did not name every connection"):
+            await engine.load_model(str(tmp_path / "B"))
+        assert engine._loaded_source is None
+    else:
+        await engine.load_model(str(tmp_path / "A"))
+        with pytest.raises(RuntimeError, match="did not name every connection"):
+            await engine.connect(str(tmp_path / "B"), name="b")
+        assert engine.connections == []
+    assert list(server.folders) == ["conn-1"]
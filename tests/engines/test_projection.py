@@ -0,0 +1,74 @@
+"""Tests for extracting only the requested metadata parts."""
+
+import pytest
+from src.engines.mcp import ModelingMCPEngine
+from src.engines.pbixray import PBIXRayEngine
+from src.mcp_client.pbixray_tools import Table
+from tests.helpers import FakePBIXRayClient, FakeServer
+
+
+@pytest.mark.asyncio
+async def test_pbixray_skips_unrequested_parts():
+    """Test that only the tools for the requested parts are called."""
+    engine = PBIXRayEngine()
+    engine.pbi_client = FakePBIXRayClient()
+    metadata = await engine.extract_metadata(include=["measures"])
+    assert engine.pbi_client.calls == ["get_measures"]
+    assert [m.name for m in metadata.measures] == ["Total"]
+    assert metadata.summary == {} and metadata.power_query is None
+    
+    engine.pbi_client.calls = []
+    await engine.extract_metadata()
+    assert engine.pbi_client.calls == [
+        "get_model_summary", "get_tables", "get_measures", "get_relationships", "get_power_query"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pbixray_streams_one_table_at_a_time():
+    """Test that each table is yielded with its measures after its schema call."""
+    class Client(FakePBIXRayClient):
+        async def get_tables(self):
+            self.calls.append("get_tables")
+            return [Table(name="Sales", columns=[]), Table(name="Dates", columns=[])]
+        
+        async def get_schema(self, table_name):
+            self.calls.append(f"get_schema {table_name}")
+            return [{"name": f"{table_name} Key", "data_type": "int64"}]
+    
+    engine = PBIXRayEngine()
+    engine.pbi_client = client = Client()
+    stream = engine.iter_metadata(include=["tables", "columns", "measures"])
+    head = await anext(stream)
+    assert head.summary is None and client.calls == []
+    
+    sales = await anext(stream)
+    assert client.calls == ["get_measures", "get_tables", "get_schema Sales"]
+    assert sales.tables[0].columns[0].name == "Sales Key"
+    assert [m.name for m in sales.measures] == ["Total"]
+    dates = await anext(stream)
+    assert dates.tables[0].name == "Dates" and dates.measures == []
+    assert [c async for c in stream] == []
+
+
+@pytest.mark.asyncio
+async def test_mcp_skips_unrequested_calls(tmp_path):
+    """Test that table names need no schema calls and relationships no table calls."""
+    (tmp_path / "Sales").mkdir()
+    engine = ModelingMCPEngine()
+    engine.mcp_client = server = FakeServer()
+    engine._connection = object()  # Server already running
+    await engine.load_model(str(tmp_path / "Sales"))
+    
+    server.requests = []
+    metadata = await engine.extract_metadata(include=["tables", "relationships"])
+    assert [t.name for t in metadata.tables] == ["Sales Facts"]
+    assert metadata.tables[0].columns == [] and metadata.measures == []
+    assert [(tool, r["operation"]) for tool, r in server.requests] == [
+        ("table_operations", "List"), ("relationship_operations", "List")
+    ]
+    
+    server.requests = []
+    chunks = [c async for c in engine.iter_metadata(include=["relationships"])]
+    assert len(chunks) == 1 and chunks[0].summary is None
+    assert [tool for tool, _ in server.requests] == ["relationship_operations"]
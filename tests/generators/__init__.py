@@ -0,0 +1 @@
+"""Generator tests package."""
@@ -0,0 +1,135 @@
+"""Tests for the render fragment cache."""
+
+import dataclasses
+import importlib.util
+import types
+
+import pytest
+from src import __version__
+from src.generators import cache as cache_module
+from src.generators.cache import RenderCache, fingerprint, renderer_version
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import make_metadata
+
+
+pytestmark = pytest.mark.usefixtures("static_engine")
+
+
+def test_fingerprint_tracks_content():
+    """Test that fingerprints change only when inputs change."""
+    metadata = make_metadata()
+    measure = metadata.measures[0]
+    
+    assert fingerprint(measure) == fingerprint(dataclasses.replace(measure))
+    assert fingerprint(measure) != fingerprint(
+        dataclasses.replace(measure, expression="SUM(Sales[Qty])")
+    )
+
+
+def test_memoize_reuses_across_instances(tmp_path):
+    """Test that fragments survive reopening the cache."""
+    calls = []
+    
+    def render(value):
+        calls.append(value)
+        return f"<{value}>"
+    
+    cache = RenderCache(tmp_path)
+    assert cache.memoize("kind", render)("a") == "<a>"
+    cache.close()
+    
+    cache = RenderCache(tmp_path)
+    assert cache.memoize("kind", render)("a") == "<a>"
+    assert cache.memoize("kind", render)("b") == "<b>"
+    cache.close()
+    
+    assert calls == ["a", "b"]
+
+
+def test_version_change_invalidates(tmp_path):
+    """Test that fragments from another generator version are not reused."""
+    RenderCache(tmp_path, version="1").close()
+    cache = RenderCache(tmp_path, version="1")
+    cache.put("kind", "key", "old")
+    cache.close()
+    
+    cache = RenderCache(tmp_path, version="2")
+    assert cache.get("kind", "key") is None
+    cache.close()
+
+
+def test_versions_share_a_cache_until_pruned(tmp_path):
+    """Test that opening one version keeps recently used versions' entries."""
+    for version in ("1", "2"):
+        cache = RenderCache(tmp_path, version=version)
+        cache.put("kind", "key", f"v{version}")
+        cache.close()
+    
+    cache = RenderCache(tmp_path, version="1")
+    assert cache.get("kind", "key") == "v1"
+    cache.close()
+    cache = RenderCache(tmp_path, version="2")
+    assert cache.get("kind", "key") == "v2"
+    assert cache.prune() == 1
+    cache.close()
+    
+    cache = RenderCache(tmp_path, version="1")
+    assert cache.get("kind", "key") is None
+    cache.close()
+
+
+def test_renderer_change_invalidates(tmp_path, monkeypatch):
+    """Test that editing a renderer module changes the cache version."""
+    pages = tmp_path / "pages.py"
+    pages.write_text("HEADER = '#'\n")
+    find_spec = importlib.util.find_spec
+    
+    def find_edited_spec(name):
+        if name.endswith(".pages"):
+            return types.SimpleNamespace(origin=str(pages))
+        return find_spec(name)
+    
+    monkeypatch.setattr(cache_module.importlib.util, "find_spec", find_edited_spec)
+    renderer_version.cache_clear()
+    try:
+        before = renderer_version()
+        pages.write_text("HEADER = '##'\n")
+        renderer_version.cache_clear()
+        after = renderer_version()
+    finally:
+        renderer_version.cache_clear()
+    
+    assert before != after
+    assert before.startswith(f"{__version__}+")
+    cache = RenderCache(tmp_path / "cache")
+    assert cache.version == renderer_version()
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_rerun_only_renders_changed_fragments(tmp_path):
+    """Test that a second run re-renders only the edited measure's fragments."""
+    metadata = make_metadata(table_count=5)
+    
+    async def run(cache):
+        sink = MemorySink()
+        with WikiGenerator(sink=sink, cache=cache) as generator:
+            await generator.generate(
+                "Model.pbix",
+                engine_type="static",
+                engine_kwargs={"metadata": metadata}
+            )
+        return sink.files
+    
+    first = await run(RenderCache(tmp_path))
+    
+    metadata.measures[0].expression = "SUM(Sales[Qty])"
+    cache = RenderCache(tmp_path)
+    second = await run(cache)
+    
+    # Sales table page and the Sales measures section changed
+    assert cache.misses == 2
+    assert cache.hits == 4 + len(metadata.relationships)
+    assert "SUM(Sales[Qty])" in second["model/Measures.md"]
+    assert second["model/Table-dim-1.md"] == first["model/Table-dim-1.md"]
@@ -0,0 +1,100 @@
+"""Tests for the document tree and its emitters."""
+
+import json
+
+import pytest
+from src.generators import document as doc
+from src.generators.emitters import HtmlEmitter, JsonEmitter, MarkdownEmitter, get_emitter
+from src.generators.pages import build_table_page
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+
+
+pytestmark = pytest.mark.usefixtures("static_engine")
+
+
+def test_markdown_escapes_pipes_only_in_tables():
+    """Test that pipe escaping is applied by the emitter, not the builder."""
+    page = doc.Page("P", "P", [
+        doc.Paragraph(["a | b"]),
+        doc.Table(["Col"], [[doc.Code("x | y")]]),
+    ])
+    
+    assert MarkdownEmitter().emit(page) == (
+        "a | b\n\n| Col |\n|-----|\n| `x \\| y` |\n"
+    )
+
+
+def test_html_escapes_text():
+    """Test that HTML output escapes markup in metadata."""
+    page = doc.Page("P", "<P>", [doc.Paragraph(["<script>"]), doc.Diagram("A --> B")])
+    
+    output = HtmlEmitter().emit(page)
+    assert "&lt;script&gt;" in output
+    assert "<title>&lt;P&gt;</title>" in output
+    assert '<pre class="mermaid">A --&gt; B</pre>' in output
+
+
+def test_json_output_is_valid(metadata):
+    """Test that JSON pages parse and keep link targets format-neutral."""
+    page = build_table_page(metadata.tables[0], metadata.measures)
+    data = json.loads(JsonEmitter().emit(page))
+    
+    assert data["name"] == "Table-sales"
+    table = next(b for b in data["blocks"] if b["type"] == "table" and "Measure" in b["headers"])
+    assert table["rows"][0][0] == {"link": "Total", "target": "Measures"}
+
+
+def test_section_built_once_for_all_formats(metadata):
+    """Test that one tree build feeds every emitter."""
+    calls = []
+    
+    def builder(text):
+        calls.append(text)
+        return [doc.Paragraph([text])]
+    
+    page = doc.Page("P", "P", [doc.Section("test", ("hello",), builder)])
+    for name in ("markdown", "html", "json"):
+        assert "hello" in get_emitter(name).emit(page)
+    
+    assert calls == ["hello"]
+
+
+def test_unknown_format():
+    """Test that unknown formats are rejected."""
+    with pytest.raises(ValueError, match="Unknown output format"):
+        get_emitter("pdf")
+
+
+@pytest.mark.asyncio
+async def test_generate_multiple_formats(metadata):
+    """Test that every page is written once per format."""
+    sink = MemorySink()
+    with WikiGenerator(sink=sink, formats=("markdown", "html", "json")) as generator:
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="static",
+            engine_kwargs={"metadata": metadata}
+        )
+    
+    for page in ("Home", "Measures", "Relationships", "Data-Sources", "Table-sales"):
+        for ext in (".md", ".html", ".json"):
+            assert f"sample/{page}{ext}" in sink.files
+    assert 'href="Table-sales.html"' in sink.files["sample/Home.html"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["html", "json"])
+async def test_index_reads_titles_of_earlier_runs(metadata, fmt):
+    """Test that the models index names models from non-Markdown home pages."""
+    sink = MemorySink()
+    for name in ("ACME Sales.pbix", "Other.pbix"):
+        # A fresh generator only knows the titles of models it generated
+        with WikiGenerator(sink=sink, formats=(fmt,)) as generator:
+            await generator.generate(
+                name,
+                engine_type="static",
+                engine_kwargs={"metadata": metadata}
+            )
+    
+    assert f"[ACME Sales](acme-sales/Home.{fmt})" in sink.files["README.md"]
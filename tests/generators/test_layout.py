@@ -0,0 +1,70 @@
+"""Tests for the layered relationship layout and SVG renderer."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+from src.generators.graph import RelationshipGraph
+from src.generators.layout import layered_layout, render_svg
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import rel
+
+
+pytestmark = pytest.mark.usefixtures("static_engine")
+
+
+def test_facts_are_layered_above_dimensions():
+    """Test longest-path layering and dummy routing of long edges."""
+    graph = RelationshipGraph(
+        [rel("Sales", "Product"), rel("Product", "Category"), rel("Sales", "Category", "CatKey")],
+        ["Sales", "Product", "Category"],
+    )
+    layout = layered_layout(graph)
+    
+    assert [layout.nodes[t].layer for t in ("Sales", "Product", "Category")] == [0, 1, 2]
+    # Sales -> Category skips a layer, so it bends through a dummy node
+    assert [len(e.points) for e in layout.edges] == [2, 2, 3]
+    assert layout.edges[2].points[0][1] < layout.edges[2].points[-1][1]
+
+
+def test_cycles_and_exclusions():
+    """Test that cyclic graphs are laid out and excluded tables are dropped."""
+    graph = RelationshipGraph(
+        [rel("A", "B"), rel("B", "C"), rel("C", "A"), rel("A", "LocalDateTable_1")],
+        ["A", "B", "C", "LocalDateTable_1", "Unrelated"],
+    )
+    layout = layered_layout(graph, exclude=graph.auto_date_tables)
+    
+    assert set(layout.nodes) == {"A", "B", "C"}
+    assert len({n.layer for n in layout.nodes.values()}) == 3
+    for edge in layout.edges:
+        assert len(edge.points) >= 2
+
+
+def test_render_svg_is_well_formed():
+    """Test that the SVG parses and escapes table names."""
+    graph = RelationshipGraph(
+        [rel("Sales & Returns", "Date", active=False)],
+        ["Sales & Returns", "Date"],
+    )
+    root = ET.fromstring(render_svg(layered_layout(graph)))
+    
+    ns = {"svg": "http://www.w3.org/2000/svg"}
+    names = [t.text for t in root.findall(".//svg:text", ns)]
+    assert names == ["Sales & Returns", "Date"]
+    assert root.find(".//svg:polyline", ns).get("class") == "rel inactive"
+
+
+@pytest.mark.asyncio
+async def test_generator_writes_svg(metadata):
+    """Test that the layout is written next to Relationships.md on request."""
+    sink = MemorySink()
+    with WikiGenerator(sink=sink, er_svg=True) as generator:
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="static",
+            engine_kwargs={"metadata": metadata}
+        )
+    
+    assert sink.files["sample/Relationships.svg"].startswith("<svg")
+    assert "![Entity relationship layout](Relationships.svg)" in sink.files["sample/Relationships.md"]
@@ -0,0 +1,69 @@
+"""Tests for the document_many library API."""
+
+import asyncio
+
+import pytest
+from src.generators import document_many
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import StaticEngine, make_metadata
+
+
+class DelayEngine(StaticEngine):
+    """Static engine whose load time depends on the source name."""
+    
+    def __init__(self):
+        super().__init__(make_metadata(2))
+    
+    async def load_model(self, source: str, **kwargs) -> None:
+        if source.startswith("broken"):
+            raise FileNotFoundError(f"No such model: {source}")
+        await asyncio.sleep(0.2 if source.startswith("slow") else 0.01)
+
+
+@pytest.fixture(autouse=True)
+def delay_engine(use_engine):
+    use_engine("delay", DelayEngine)
+
+
+@pytest.mark.asyncio
+async def test_results_in_completion_order():
+    """Test that fast models are yielded first and failures are reported."""
+    sink = MemorySink()
+    with WikiGenerator(sink=sink) as generator:
+        results = [
+            result async for result in document_many(
+                ["slow.pbix", "fast.pbix", "broken.pbix"],
+                concurrency=3,
+                engine_type="delay",
+                generator=generator,
+            )
+        ]
+    
+    assert [r.source for r in results] == ["broken.pbix", "fast.pbix", "slow.pbix"]
+    broken, fast, slow = results
+    assert not broken.ok and broken.metadata is None and "No such model" in broken.error
+    assert fast.ok and len(fast.metadata.tables) == 2
+    assert "fast/Home.md" in fast.pages and "fast/Table-sales.md" in fast.pages
+    assert all(page in sink.files for page in fast.pages + slow.pages)
+    assert slow.extract_seconds >= 0.2 and slow.seconds >= slow.render_seconds
+
+
+@pytest.mark.asyncio
+async def test_sources_consumed_lazily():
+    """Test that only `concurrency` models are in flight and closing cancels them."""
+    pulled = []
+    
+    def sources():
+        for i in range(1000):
+            pulled.append(i)
+            yield f"model{i}.pbix"
+    
+    with WikiGenerator(sink=MemorySink()) as generator:
+        results = document_many(sources(), concurrency=2, engine_type="delay", generator=generator)
+        first = await results.__anext__()
+        assert first.ok
+        assert len(pulled) <= 3
+        await results.aclose()
+    
+    assert len(pulled) <= 3
@@ -0,0 +1,105 @@
+"""Tests for relationship graph and ER diagram generation."""
+
+from src.generators.graph import RelationshipGraph, is_auto_date_table
+from src.generators.mermaid import neighborhood_diagram, plan_er_diagrams
+from tests.helpers import rel
+
+
+def test_components_largest_first():
+    """Test that connected components are found and ordered by size."""
+    graph = RelationshipGraph(
+        [rel("Sales", "Date"), rel("Sales", "Product"), rel("Budget", "Scenario")],
+        ["Sales", "Date", "Product", "Budget", "Scenario", "Notes"],
+    )
+    
+    assert graph.components() == [
+        ["Sales", "Date", "Product"],
+        ["Budget", "Scenario"],
+        ["Notes"],
+    ]
+    assert graph.neighbors("Sales") == ["Date", "Product"]
+
+
+def test_auto_date_table_names():
+    """Test detection of Power BI auto date/time tables."""
+    assert is_auto_date_table("LocalDateTable_6f19fed3-1fc0-4f7a-878d-34aca93d6782")
+    assert is_auto_date_table("DateTableTemplate_92fd358c-bb4c-4d52-9f5b-e9a59dc2315d")
+    assert is_auto_date_table("LocalDateTable")
+    assert not is_auto_date_table("Date")
+
+
+def test_layout_separates_subject_areas():
+    """Test that auto date and standalone tables are not drawn as entities."""
+    local = "LocalDateTable_6f19fed3-1fc0-4f7a-878d-34aca93d6782"
+    layout = plan_er_diagrams(
+        [rel("Sales", "Date"), rel("Budget", "Scenario"), rel("Sales", local, "OrderDate")],
+        ["Sales", "Date", "Budget", "Scenario", "Notes", local],
+    )
+    
+    assert [d.tables for d in layout.diagrams] == [["Sales", "Date"], ["Budget", "Scenario"]]
+    assert layout.standalone_tables == ["Notes"]
+    assert layout.auto_date_tables == {local: [("Sales", "OrderDate")]}
+    assert "placeholder" not in layout.diagrams[0].source
+    assert "LocalDateTable" not in layout.diagrams[0].source
+
+
+def test_oversized_component_is_summarized():
+    """Test the fallback to a summarized diagram plus connection table."""
+    relationships = [rel("Sales", f"Dim{i}") for i in range(20)]
+    relationships += [rel("Sales", "Dim0", "AltKey", active=False)]
+    tables = ["Sales"] + [f"Dim{i}" for i in range(20)]
+    
+    layout = plan_er_diagrams(relationships, tables, max_tables=5)
+    
+    diagram = layout.diagrams[0]
+    assert diagram.summarized
+    assert len(diagram.tables) == 21
+    assert diagram.source.count("Sales") == 4
+    assert '"2 relationships"' in diagram.source
+    assert diagram.connections["Dim7"] == ["Sales"]
+    
+    layout = plan_er_diagrams(relationships, tables, max_chars=200)
+    assert layout.diagrams[0].summarized
+    assert len(layout.diagrams[0].source) <= 200
+
+
+def test_neighborhood_hops():
+    """Test k-hop neighborhoods on a chain of tables."""
+    graph = RelationshipGraph(
+        [rel("A", "B"), rel("B", "C"), rel("C", "D"), rel("B", "LocalDateTable_1")],
+        ["A", "B", "C", "D"],
+    )
+    
+    tables, edges, truncated = graph.neighborhood("B")
+    assert tables == ["B", "A", "C", "LocalDateTable_1"]
+    assert len(edges) == 3
+    assert not truncated
+    
+    tables, edges, truncated = graph.neighborhood("A", hops=2)
+    assert tables == ["A", "B", "C", "LocalDateTable_1"]
+    assert [(r.from_table, r.to_table) for r in edges] == [
+        ("A", "B"), ("B", "C"), ("B", "LocalDateTable_1")
+    ]
+    
+    diagram = neighborhood_diagram(graph, "B", max_tables=2)
+    assert diagram.tables == ["B", "A"]
+    assert diagram.summarized
+    assert "LocalDateTable" not in diagram.source
+    
+    assert neighborhood_diagram(RelationshipGraph([], ["A"]), "A") is None
+
+
+def test_neighborhood_keeps_edges_between_outer_tables():
+    """Test that relationships between the farthest tables are drawn."""
+    graph = RelationshipGraph(
+        [rel("A", "B"), rel("A", "C"), rel("B", "D"), rel("C", "E"), rel("D", "E"),
+         rel("E", "F")],
+        ["A", "B", "C", "D", "E", "F"],
+    )
+    tables, edges, _ = graph.neighborhood("A", hops=2)
+    assert tables == ["A", "B", "C", "D", "E"]
+    assert ("D", "E") in [(r.from_table, r.to_table) for r in edges]
+    assert len(edges) == 5
+    
+    tables, edges, _ = graph.neighborhood("D")
+    assert tables == ["D", "B", "E"] and len(edges) == 2
@@ -0,0 +1,73 @@
+"""Tests for limiting runs to some pages."""
+
+import pytest
+from src.engines import ModelMetadata, resolve_include
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import StaticEngine, make_metadata
+
+
+class ProjectingEngine(StaticEngine):
+    """Static engine that honours ``include`` and records it."""
+    
+    requested = []
+    
+    def __init__(self):
+        super().__init__(make_metadata(3))
+    
+    async def extract_metadata(self, include=None) -> ModelMetadata:
+        ProjectingEngine.requested.append(include)
+        parts = resolve_include(include)
+        full = self.metadata
+        return ModelMetadata(
+            summary=full.summary if "summary" in parts else {},
+            tables=full.tables if "tables" in parts else [],
+            measures=full.measures if "measures" in parts else [],
+            relationships=full.relationships if "relationships" in parts else [],
+            power_query=full.power_query if "power_query" in parts else None,
+        )
+
+
+@pytest.fixture(autouse=True)
+def projecting_engine(use_engine):
+    use_engine("projecting", ProjectingEngine)
+
+
+def test_metadata_parts():
+    """Test the metadata each page needs."""
+    generator = WikiGenerator(sink=MemorySink(), pages=["measures", "relationships"])
+    assert generator.metadata_parts() == {"measures", "tables", "relationships"}
+    assert generator.metadata_parts(["data_sources"]) == {"power_query"}
+    assert generator.metadata_parts(["home"]) == {
+        "summary", "tables", "columns", "measures", "relationships"
+    }
+    assert WikiGenerator(sink=MemorySink()).metadata_parts() is None
+    with pytest.raises(ValueError, match="Unknown pages: glossary"):
+        generator.metadata_parts(["glossary"])
+    with pytest.raises(ValueError, match="Unknown metadata parts"):
+        resolve_include(["views"])
+    assert resolve_include(["columns"]) == {"columns", "tables"}
+    generator.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_only_requested_pages():
+    """Test that only the requested pages are written and extracted."""
+    ProjectingEngine.requested = []
+    sink = MemorySink()
+    with WikiGenerator(sink=sink) as generator:
+        written = await generator.generate(
+            "Sales.pbix", engine_type="projecting", include=["measures", "relationships"]
+        )
+        assert sorted(written) == ["sales/Measures.md", "sales/Relationships.md"]
+        assert ProjectingEngine.requested == [{"measures", "tables", "relationships"}]
+        assert "Dim 1" in sink.files["sales/Relationships.md"]
+        
+        # The generator's pages apply when a call does not override them
+        generator.pages = frozenset({"data_sources"})
+        written = await generator.generate("Finance.pbix", engine_type="projecting")
+        assert written == ["finance/Data-Sources.md"]
+        assert "let Source = 1" in sink.files["finance/Data-Sources.md"]
+    
+    # Without a Home page there is nothing to link from the models index
+    assert "README.md" not in sink.files
@@ -0,0 +1,215 @@
+"""Tests for documentation output sinks."""
+
+import asyncio
+import multiprocessing
+import tarfile
+import zipfile
+
+import pytest
+from src.engines import register_engine
+from src.generators.sinks import (
+    DirectorySink,
+    FileLock,
+    MemorySink,
+    TarSink,
+    ZipSink,
+    create_sink,
+)
+from src.generators.wiki_generator import WikiGenerator
+from tests.helpers import StaticEngine, make_metadata
+
+
+pytestmark = pytest.mark.usefixtures("static_engine")
+
+
+def test_directory_sink_writes_atomically(tmp_path):
+    """Test that directory writes leave no temporary files behind."""
+    sink = DirectorySink(tmp_path)
+    sink.write_text("model/Home.md", "# Model")
+    sink.write_text("model/Home.md", "# Model v2")
+    
+    assert sink.read_text("model/Home.md") == "# Model v2"
+    assert [p.name for p in (tmp_path / "model").iterdir()] == ["Home.md"]
+    assert sink.list_folders() == ["model"]
+
+
+def test_file_lock_excludes_other_holders(tmp_path):
+    """Test that a directory lock is exclusive across lock objects."""
+    sink = DirectorySink(tmp_path / "docs", lock_dir=tmp_path / "locks")
+    first, second = sink.lock("model"), sink.lock("model")
+    
+    assert first.acquire(blocking=False)
+    assert not second.acquire(blocking=False)
+    first.release()
+    with second:
+        assert not FileLock(tmp_path / "locks" / "model.lock").acquire(blocking=False)
+    assert list((tmp_path / "docs").iterdir()) == []
+
+
+def test_sink_rejects_escaping_paths():
+    """Test that paths outside the documentation root are rejected."""
+    sink = MemorySink()
+    with pytest.raises(ValueError, match="Invalid output path"):
+        sink.write_text("../outside.md", "x")
+    with pytest.raises(ValueError, match="Invalid output path"):
+        sink.write_text("/abs.md", "x")
+
+
+def test_create_sink_by_extension(tmp_path):
+    """Test that the archive format is chosen from the target name."""
+    assert isinstance(create_sink(tmp_path / "docs"), DirectorySink)
+    locked = create_sink(tmp_path / "docs", lock_dir=tmp_path / "locks")
+    assert locked.lock_dir == tmp_path / "locks"
+    
+    zip_sink = create_sink(tmp_path / "docs.zip")
+    tar_sink = create_sink(tmp_path / "docs.tar.gz")
+    assert isinstance(zip_sink, ZipSink)
+    assert isinstance(tar_sink, TarSink)
+    zip_sink.close()
+    tar_sink.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_into_memory(metadata):
+    """Test a full run into an in-memory sink."""
+    sink = MemorySink()
+    with WikiGenerator(sink=sink) as generator:
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="static",
+            engine_kwargs={"metadata": metadata}
+        )
+    
+    assert "sample/Home.md" in sink.files
+    assert "sample/Table-sales.md" in sink.files
+    assert "[Sample](sample/Home.md)" in sink.files["README.md"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("archive", ["docs.zip", "docs.tar.gz"])
+async def test_generate_into_archive(tmp_path, metadata, archive):
+    """Test that archives contain each page once, including the index."""
+    target = tmp_path / archive
+    with WikiGenerator(sink=create_sink(target)) as generator:
+        for name in ("First.pbix", "Second.pbix"):
+            await generator.generate(
+                name,
+                engine_type="static",
+                engine_kwargs={"metadata": metadata}
+            )
+    
+    if archive.endswith(".zip"):
+        with zipfile.ZipFile(target) as zf:
+            names = zf.namelist()
+            index = zf.read("README.md").decode("utf-8")
+    else:
+        with tarfile.open(target) as tf:
+            names = tf.getnames()
+            index = tf.extractfile("README.md").read().decode("utf-8")
+    
+    assert len(names) == len(set(names))
+    assert "first/Home.md" in names
+    assert "second/Table-dim-1.md" in names
+    assert "2 Power BI model(s)" in index
+
+
+@pytest.mark.asyncio
+async def test_directory_run_leaves_only_pages(tmp_path, metadata):
+    """Test that a directory run leaves no lock or temporary files behind."""
+    sinks = [DirectorySink(tmp_path), MemorySink()]
+    for sink in sinks:
+        with WikiGenerator(sink=sink) as generator:
+            await generator.generate(
+                "Sample.pbix",
+                engine_type="static",
+                engine_kwargs={"metadata": metadata}
+            )
+    
+    files = {p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*") if p.is_file()}
+    assert files == set(sinks[1].files)
+
+
+@pytest.mark.asyncio
+async def test_index_skips_models_in_progress(tmp_path, metadata):
+    """Test that the index leaves out folders another writer is creating."""
+    sink = DirectorySink(tmp_path)
+    sink.write_text("partial/Table-sales.md", "# Sales")
+    sink.write_text("rerun/Home.md", "# Rerun - Documentation")
+    with sink.lock("partial"), sink.lock("rerun"):
+        with WikiGenerator(sink=sink) as generator:
+            await generator.generate(
+                "Sample.pbix",
+                engine_type="static",
+                engine_kwargs={"metadata": metadata}
+            )
+        index = sink.read_text("README.md")
+    
+    assert "[Sample](sample/Home.md)" in index
+    assert "[Rerun](rerun/Home.md)" in index
+    assert "partial" not in index
+
+
+@pytest.mark.asyncio
+async def test_cancelled_wait_leaves_folder_unlocked(tmp_path, metadata):
+    """Test that cancelling a run waiting for a folder lock never takes it."""
+    sink = DirectorySink(tmp_path)
+    with WikiGenerator(sink=sink) as generator:
+        with sink.lock("sample"):
+            task = asyncio.create_task(generator.generate(
+                "Sample.pbix",
+                engine_type="static",
+                engine_kwargs={"metadata": metadata}
+            ))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        await asyncio.sleep(0.2)  # A thread left waiting would take it now
+        
+        lock = sink.lock("sample")
+        assert lock.acquire(blocking=False)
+        lock.release()
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="static",
+            engine_kwargs={"metadata": metadata}
+        )
+    
+    assert sink.read_text("sample/Home.md") is not None
+
+
+def _generate_models(root, names):
+    # Runs in a fresh process, outside the test's fixtures
+    register_engine("static", StaticEngine)
+    
+    async def run():
+        with WikiGenerator(str(root)) as generator:
+            for name in names:
+                await generator.generate(
+                    f"{name}.pbix",
+                    engine_type="static",
+                    engine_kwargs={"metadata": make_metadata(2)}
+                )
+    
+    asyncio.run(run())
+
+
+def test_processes_share_output_root(tmp_path):
+    """Test that concurrent processes on one root build a complete index."""
+    context = multiprocessing.get_context("spawn")
+    names = [[f"Model{p}{i}" for i in range(3)] for p in range(4)]
+    processes = [
+        context.Process(target=_generate_models, args=(tmp_path, batch))
+        for batch in names
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+    
+    assert [p.exitcode for p in processes] == [0] * 4
+    index = (tmp_path / "README.md").read_text(encoding="utf-8")
+    assert "12 Power BI model(s)" in index
+    for name in sum(names, []):
+        assert f"[{name}]({name.lower()}/Home.md)" in index
+    assert not list(tmp_path.rglob("*.tmp"))
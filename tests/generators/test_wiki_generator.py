@@ -0,0 +1,323 @@
+"""Tests for the wiki generator."""
+
+import asyncio
+
+import pytest
+from src.engines import MetadataChunk
+from src.generators.emitters import MarkdownEmitter
+from src.generators.graph import RelationshipGraph
+from src.generators.mermaid import neighborhood_diagram
+from src.generators.pages import build_table_page, generate_table_page, shard_measures
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from src.mcp_client.pbixray_tools import Measure, Relationship, Table
+from tests.helpers import StaticEngine, make_metadata
+
+
+class StreamingEngine(StaticEngine):
+    """Engine that yields one table per chunk, like a live server.
+    
+    Before yielding the last table it waits for a table page to appear in
+    ``sink`` and records whether one did in ``progress``.
+    """
+    
+    def __init__(self, metadata, sink=None, progress=None, relationships_last=False):
+        super().__init__(metadata)
+        self.sink = sink
+        self.progress = progress
+        self.relationships_last = relationships_last
+    
+    async def iter_metadata(self):
+        m = self.metadata
+        first = MetadataChunk(summary=m.summary, power_query=m.power_query)
+        if not self.relationships_last:
+            first.relationships = m.relationships
+        yield first
+        for i, table in enumerate(m.tables):
+            if self.sink is not None and i == len(m.tables) - 1:
+                for _ in range(200):
+                    if any("/Table-" in path for path in self.sink.files):
+                        break
+                    await asyncio.sleep(0.005)
+                self.progress.append(sorted(self.sink.files))
+            yield MetadataChunk(
+                tables=[table],
+                measures=[x for x in m.measures if x.table == table.name],
+            )
+        if self.relationships_last:
+            yield MetadataChunk(relationships=m.relationships)
+
+
+@pytest.fixture(autouse=True)
+def streaming_engine(static_engine, use_engine):
+    use_engine("streaming", StreamingEngine)
+
+
+@pytest.mark.asyncio
+async def test_generate_writes_all_pages(tmp_path, metadata):
+    """Test that a full run writes every page into the model folder."""
+    generator = WikiGenerator(str(tmp_path))
+    await generator.generate(
+        "Sample.pbix",
+        engine_type="static",
+        engine_kwargs={"metadata": metadata}
+    )
+    
+    model_dir = tmp_path / "sample"
+    names = sorted(p.name for p in model_dir.iterdir())
+    assert names == [
+        "Data-Sources.md",
+        "Home.md",
+        "Measures.md",
+        "Relationships.md",
+        "Table-dim-1.md",
+        "Table-dim-2.md",
+        "Table-sales.md",
+    ]
+    assert (tmp_path / "README.md").exists()
+
+
+@pytest.mark.asyncio
+async def test_parallel_table_pages_match_serial_rendering(tmp_path):
+    """Test that pooled rendering with a tiny queue produces identical pages."""
+    metadata = make_metadata(table_count=40)
+    generator = WikiGenerator(str(tmp_path), jobs=4, max_pending_pages=2)
+    await generator.generate(
+        "Big.pbix",
+        engine_type="static",
+        engine_kwargs={"metadata": metadata}
+    )
+    
+    graph = RelationshipGraph(metadata.relationships, [t.name for t in metadata.tables])
+    for table in metadata.tables:
+        page = tmp_path / "big" / f"Table-{generator._slugify(table.name)}.md"
+        expected = build_table_page(
+            table, metadata.measures, neighborhood=neighborhood_diagram(graph, table.name)
+        )
+        assert page.read_text(encoding="utf-8") == MarkdownEmitter().emit(expected)
+
+
+def test_invalid_jobs():
+    """Test that non-positive worker counts are rejected."""
+    with pytest.raises(ValueError, match="jobs"):
+        WikiGenerator("unused", jobs=0)
+
+
+def test_shard_measures_by_table_and_folder():
+    """Test that oversized tables are split by display folder, then into parts."""
+    measures = [
+        Measure(name=f"M{i}", table="Sales", expression="1", display_folder="KPIs\\Revenue")
+        for i in range(5)
+    ] + [
+        Measure(name="Other", table="Sales", expression="1"),
+        Measure(name="Small", table="Dim", expression="1"),
+    ]
+    
+    shards = shard_measures(measures, max_measures=3, max_bytes=10**6)
+    
+    assert [s.page for s in shards] == [
+        "Measures-dim",
+        "Measures-sales",
+        "Measures-sales-kpis-revenue",
+        "Measures-sales-kpis-revenue-2",
+    ]
+    assert [len(s.measures) for s in shards] == [1, 1, 3, 2]
+    assert shard_measures(measures, max_measures=100, max_bytes=10**6) == []
+
+
+@pytest.mark.asyncio
+async def test_sharded_measures_links(metadata):
+    """Test that table pages link to the shard holding each measure."""
+    sink = MemorySink()
+    with WikiGenerator(sink=sink, max_measures_per_page=1) as generator:
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="static",
+            engine_kwargs={"metadata": metadata}
+        )
+    
+    files = sink.files
+    assert "[Sales / Counts](Measures-sales-counts.md)" in files["sample/Measures.md"]
+    assert "COUNTROWS(Sales)" in files["sample/Measures-sales-counts.md"]
+    assert "COUNTROWS(Sales)" not in files["sample/Measures.md"]
+    assert "[Count](Measures-sales-counts.md)" in files["sample/Table-sales.md"]
+    assert "[Total](Measures-sales.md)" in files["sample/Table-sales.md"]
+
+
+@pytest.mark.asyncio
+async def test_table_pages_show_neighborhood(metadata):
+    """Test that table pages get a local ER diagram unless disabled."""
+    sink = MemorySink()
+    with WikiGenerator(sink=sink) as generator:
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="static",
+            engine_kwargs={"metadata": metadata}
+        )
+    
+    sales = sink.files["sample/Table-sales.md"]
+    assert "## Related Tables" in sales
+    assert "Dim_1 ||--o{ Sales" in sales
+    assert "Dim_2 ||--o{ Sales" in sales
+    assert "Dim_2" not in sink.files["sample/Table-dim-1.md"]
+    
+    sink = MemorySink()
+    with WikiGenerator(sink=sink, neighborhood_hops=0) as generator:
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="static",
+            engine_kwargs={"metadata": metadata}
+        )
+    assert "Related Tables" not in sink.files["sample/Table-sales.md"]
+
+
+@pytest.mark.asyncio
+async def test_auto_date_tables_share_one_page(metadata):
+    """Test that identical auto date tables are documented once."""
+    columns = [
+        {"ColumnName": "Date", "DataType": "DateTime"},
+        {"ColumnName": "Year", "DataType": "Int64"},
+    ]
+    for i, owner_column in enumerate(["OrderDate", "ShipDate"]):
+        local = f"LocalDateTable_{i:08x}-0000-0000-0000-000000000000"
+        metadata.tables.append(Table(name=local, columns=[dict(c, TableName=local) for c in columns]))
+        metadata.relationships.append(Relationship(
+            from_table="Sales",
+            from_column=owner_column,
+            to_table=local,
+            to_column="Date",
+            is_active=True,
+            cross_filter_direction="OneWay",
+        ))
+    metadata.tables.append(Table(name="DateTableTemplate_1", columns=[columns[0]]))
+    
+    sink = MemorySink()
+    with WikiGenerator(sink=sink) as generator:
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="static",
+            engine_kwargs={"metadata": metadata}
+        )
+    
+    shared = [f for f in sink.files if "Table-auto-date-" in f]
+    assert len(shared) == 1
+    assert not any("localdatetable" in f for f in sink.files)
+    assert "sample/Table-datetabletemplate-1.md" in sink.files
+    
+    page = sink.files[shared[0]]
+    assert "| Sales[OrderDate] |" in page
+    assert "| Sales[ShipDate] |" in page
+    assert "Auto Date Table (2 copies)" in sink.files["sample/Home.md"]
+
+
+@pytest.mark.asyncio
+async def test_shared_definitions_across_models():
+    """Test that identical lineage-tagged tables are written once per batch."""
+    first, second = make_metadata(), make_metadata()
+    for metadata in (first, second):
+        metadata.tables[1].lineage_tag = "7a0e1c52-dim-1"
+    second.tables[2].lineage_tag = "changed"
+    second.tables[2].columns = second.tables[2].columns[:1]
+    
+    sink = MemorySink()
+    with WikiGenerator(sink=sink, share_definitions=True) as generator:
+        for name, metadata in (("First", first), ("Second", second)):
+            await generator.generate(
+                f"{name}.pbix",
+                engine_type="static",
+                engine_kwargs={"metadata": metadata}
+            )
+    
+    shared = sorted(f for f in sink.files if f.startswith("_shared/"))
+    assert len(shared) == 2
+    dim1 = next(f for f in shared if "Table-dim-1-" in f)
+    for model in ("first", "second"):
+        page = sink.files[f"{model}/Table-dim-1.md"]
+        assert f"(../{dim1})" in page
+        assert "## Columns" not in page
+    assert "## Columns" in sink.files["first/Table-dim-2.md"]
+    assert "_shared" not in sink.files["README.md"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generate_calls():
+    """Test that one generator can document several models at once."""
+    sink = MemorySink()
+    models = {"Alpha": make_metadata(table_count=5), "Beta": make_metadata(table_count=8)}
+    with WikiGenerator(sink=sink, jobs=2, max_pending_pages=2) as generator:
+        await asyncio.gather(*(
+            generator.generate(
+                f"{name}.pbix",
+                engine_type="static",
+                engine_kwargs={"metadata": metadata}
+            )
+            for name, metadata in models.items()
+        ))
+        
+        results = await asyncio.gather(*(
+            generator.generate(
+                "Alpha.pbix",
+                engine_type="static",
+                engine_kwargs={"metadata": models["Alpha"]}
+            )
+            for _ in range(2)
+        ), return_exceptions=True)
+        assert "alpha/Home.md" in results[0]
+        assert "already being generated" in str(results[1])
+    
+    for name, metadata in models.items():
+        folder = name.lower()
+        assert sink.files[f"{folder}/Home.md"].startswith(f"# {name} - ")
+        table_files = [f for f in sink.files if f.startswith(f"{folder}/Table-")]
+        assert len(table_files) == len(metadata.tables)
+    assert "[Alpha]" in sink.files["README.md"] and "[Beta]" in sink.files["README.md"]
+
+
+@pytest.mark.asyncio
+async def test_table_pages_written_while_streaming():
+    """Test that table pages are written before the engine has finished."""
+    sink = MemorySink()
+    progress = []
+    with WikiGenerator(sink=sink, max_measures_per_page=1) as generator:
+        await generator.generate(
+            "Sample.pbix",
+            engine_type="streaming",
+            engine_kwargs={"metadata": make_metadata(5), "sink": sink, "progress": progress}
+        )
+    
+    assert "sample/Table-sales.md" in progress[0]
+    assert "sample/Home.md" not in progress[0]
+    assert "sample/Table-dim-4.md" in sink.files
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("relationships_last", [False, True])
+@pytest.mark.parametrize("max_measures", [1, 100])
+async def test_streaming_matches_single_chunk(relationships_last, max_measures):
+    """Test that streamed output equals output from fully extracted metadata."""
+    metadata = make_metadata(5)
+    # A folder page of "Dim 1" and the page of "Dim 1 X" collide
+    metadata.tables.append(Table(name="Dim 1 X", columns=[]))
+    metadata.measures += [
+        Measure(name="A", table="Dim 1", expression="1", display_folder="X"),
+        Measure(name="B", table="Dim 1", expression="2"),
+        Measure(name="C", table="Dim 1 X", expression="3"),
+    ]
+    
+    outputs = []
+    for engine, kwargs in [
+        ("static", {}),
+        ("streaming", {"relationships_last": relationships_last}),
+    ]:
+        sink = MemorySink()
+        with WikiGenerator(sink=sink, max_measures_per_page=max_measures) as generator:
+            await generator.generate(
+                "Sample.pbix",
+                engine_type=engine,
+                engine_kwargs={"metadata": metadata, **kwargs}
+            )
+        outputs.append(sink.files)
+    
+    assert outputs[0] == outputs[1]
+    if max_measures == 1:
+        assert "[C](Measures-dim-1-x-2.md)" in outputs[1]["sample/Table-dim-1-x.md"]
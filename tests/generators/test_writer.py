@@ -0,0 +1,58 @@
+"""Tests for the async writer."""
+
+import asyncio
+import threading
+
+import pytest
+from src.generators.sinks import MemorySink
+from src.generators.writer import AsyncWriter
+
+
+class BlockingSink(MemorySink):
+    """Memory sink whose writes wait until released."""
+    
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+    
+    def write_text(self, path: str, content: str) -> None:
+        self.release.wait(timeout=5)
+        if path.endswith("bad.md"):
+            raise OSError("disk full")
+        super().write_text(path, content)
+
+
+@pytest.mark.asyncio
+async def test_writes_do_not_block_the_loop():
+    """Test that queued writes leave the loop free and apply backpressure."""
+    sink = BlockingSink()
+    writer = AsyncWriter(sink, max_pending=2)
+    
+    await writer.write_text("m/a.md", "a")
+    await writer.write_text("m/b.md", "b")
+    third = asyncio.create_task(writer.write_text("m/c.md", "c"))
+    await asyncio.sleep(0.05)
+    
+    # The loop kept running, but the third write waits for a free slot
+    assert not third.done()
+    assert sink.files == {}
+    
+    sink.release.set()
+    await third
+    await writer.flush()
+    assert await writer.read_text("m/c.md") == "c"
+    assert await writer.list_folders() == ["m"]
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_write_errors_surface_on_flush():
+    """Test that a failed background write is re-raised."""
+    sink = BlockingSink()
+    sink.release.set()
+    writer = AsyncWriter(sink)
+    
+    await writer.write_text("m/bad.md", "x")
+    with pytest.raises(OSError, match="disk full"):
+        await writer.flush()
+    writer.close()
@@ -0,0 +1,123 @@
+"""Fake engines, servers and sample models shared by the tests."""
+
+import asyncio
+
+from src.engines import IDocumentationEngine, ModelMetadata
+from src.mcp_client.pbixray_tools import Measure, Relationship, Table
+
+
+class StaticEngine(IDocumentationEngine):
+    """Engine that serves a fixed ModelMetadata instead of reading a model."""
+    
+    def __init__(self, metadata: ModelMetadata):
+        self.metadata = metadata
+    
+    async def load_model(self, source: str, **kwargs) -> None:
+        pass
+    
+    async def extract_metadata(self) -> ModelMetadata:
+        return self.metadata
+    
+    async def close(self) -> None:
+        pass
+
+
+def make_metadata(table_count: int = 3) -> ModelMetadata:
+    """Build a small star-schema model with one fact and N-1 dimensions."""
+    tables = [
+        Table(
+            name="Sales" if i == 0 else f"Dim {i}",
+            columns=[
+                {"ColumnName": "Key", "DataType": "Int64"},
+                {"ColumnName": "Name", "DataType": "String", "Description": "a | b"},
+            ],
+        )
+        for i in range(table_count)
+    ]
+    measures = [
+        Measure(name="Total", table="Sales", expression="SUM(Sales[Amount])"),
+        Measure(
+            name="Count",
+            table="Sales",
+            expression="COUNTROWS(Sales)",
+            display_folder="Counts",
+        ),
+    ]
+    relationships = [
+        Relationship(
+            from_table="Sales",
+            from_column="Key",
+            to_table=t.name,
+            to_column="Key",
+            is_active=True,
+            cross_filter_direction="OneWay",
+        )
+        for t in tables[1:]
+    ]
+    return ModelMetadata(
+        summary={"SizeBytes": 1024},
+        tables=tables,
+        measures=measures,
+        relationships=relationships,
+        power_query={"query": "let Source = 1 in Source"},
+    )
+
+
+def rel(from_table, to_table, column="Key", active=True):
+    """Build a one-way relationship joining two tables on one column."""
+    return Relationship(
+        from_table=from_table,
+        from_column=column,
+        to_table=to_table,
+        to_column=column,
+        is_active=active,
+        cross_filter_direction="OneWay",
+    )
+
+
+class FakeServer:
+    """Answers Modeling MCP tool calls, one model per connection."""
+    
+    def __init__(self):
+        self.requests = []
+        self.folders = {}
+    
+    async def call_tool(self, tool, arguments):
+        request = arguments["request"]
+        self.requests.append((tool, dict(request)))
+        await asyncio.sleep(0)
+        operation = request["operation"]
+        if operation == "ConnectFolder":
+            name = f"conn-{len(self.folders) + 1}"
+            self.folders[name] = request["folderPath"].rsplit("/", 1)[-1]
+            return {"success": True, "data": {"connectionName": name}}
+        if operation == "Disconnect":
+            self.folders.pop(request["connectionName"])
+            return {"success": True}
+        
+        model = self.folders[request["connectionName"]]
+        if tool == "model_operations":
+            return {"success": True, "data": {"name": model}}
+        if tool == "relationship_operations":
+            return {"success": True, "data": []}
+        if operation == "List":
+            return {"success": True, "data": [{"name": f"{model} Facts"}]}
+        return {"success": True, "data": {
+            "Columns": [{"name": "Key", "dataType": "int64"}],
+            "Measures": [{"name": f"{model} Total", "expression": "1"}],
+        }}
+
+
+class FakePBIXRayClient:
+    """Records which PBIXRay tools were called."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __getattr__(self, name):
+        async def call(*args):
+            self.calls.append(name)
+            if name == "get_measures":
+                return [Measure(name="Total", table="Sales", expression="1")]
+            return []
+        return call
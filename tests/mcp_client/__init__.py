@@ -0,0 +1 @@
+"""MCP client tests package."""
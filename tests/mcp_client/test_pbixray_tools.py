@@ -0,0 +1,44 @@
+"""Tests for the compact metadata model."""
+
+import json
+import pickle
+import sys
+
+from src.mcp_client.pbixray_tools import Column, Measure, Relationship, Table
+
+
+def test_column_reads_like_a_dict():
+    """Test that columns answer the dict lookups generators use."""
+    column = Column.from_dict({
+        "ColumnName": "Date", "PandasDataType": "datetime64", "TableName": "Sales"
+    })
+    assert column["ColumnName"] == column["name"] == column.get("Name") == "Date"
+    assert column.get("DataType") == "datetime64"
+    assert column["TableName"] == "Sales"
+    assert "Description" not in column and column.get("Description", "-") == "-"
+    assert column == {"ColumnName": "Date", "DataType": "datetime64", "TableName": "Sales"}
+    assert json.loads(json.dumps(column.to_dict()))["DataType"] == "datetime64"
+
+
+def test_metadata_is_slotted_and_interned():
+    """Test that repeated strings are shared and objects carry no __dict__."""
+    tables = [
+        Table("".join(["Sa", "les"]), [{"ColumnName": "Key", "DataType": "".join(["Int", "64"])}])
+        for _ in range(2)
+    ]
+    assert tables[0].name is tables[1].name
+    assert tables[0].columns[0].data_type is tables[1].columns[0].data_type
+    assert isinstance(tables[0].columns[0], Column)
+    measure = Measure("Total", "".join(["Sa", "les"]), "1", format_string="".join(["0.", "00"]))
+    assert measure.table is tables[0].name and measure.format_string is sys.intern("0.00")
+    relationship = Relationship("Sales", "Key", "Dim", "Key", True, "OneWay")
+    for obj in (tables[0], tables[0].columns[0], measure, relationship):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_metadata_pickles():
+    """Test the round trip used to ship metadata between processes."""
+    table = Table("Sales", [{"ColumnName": "Key", "DataType": "Int64", "IsHidden": True}])
+    copy = pickle.loads(pickle.dumps(table))
+    assert copy == table and copy.columns[0]["IsHidden"] is True
+
@@ -0,0 +1,187 @@
+"""Tests for the warm engine pool and the documentation service."""
+
+import asyncio
+import json
+
+import pytest
+from src.engines import EnginePool
+from src.generators.sinks import MemorySink
+from src.generators.wiki_generator import WikiGenerator
+from src.service import DocumentationService, parse_address, serve
+from tests.helpers import StaticEngine, make_metadata
+
+
+class WarmEngine(StaticEngine):
+    """Static engine that records engine starts and model loads."""
+    
+    started = 0
+    loads: list[str] = []
+    
+    def __init__(self, tables: int = 3):
+        super().__init__(make_metadata(tables))
+        WarmEngine.started += 1
+    
+    async def load_model(self, source: str, **kwargs) -> None:
+        await asyncio.sleep(0.01)
+        if "broken" in source:
+            raise RuntimeError(f"Cannot load {source}")
+        WarmEngine.loads.append(source)
+
+
+@pytest.fixture(autouse=True)
+def warm_engine(use_engine):
+    use_engine("warm", WarmEngine)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    WarmEngine.started = 0
+    WarmEngine.loads = []
+
+
+async def request(path, method="GET", body=None, socket_path=None):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), content
+
+
+def test_parse_address():
+    """Test TCP and Unix socket addresses."""
+    assert parse_address("8765") == ("127.0.0.1", 8765)
+    assert parse_address("0.0.0.0:80") == ("0.0.0.0", 80)
+    assert parse_address("/tmp/docs.sock") == "/tmp/docs.sock"
+    with pytest.raises(ValueError, match="Invalid service address"):
+        parse_address("localhost:http")
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_engines():
+    """Test that engines stay up across models and are replaced after a failure."""
+    pool = EnginePool(max_engines=2)
+    results = await asyncio.gather(*(
+        pool.extract(f"{name}.pbix", "warm", {"tables": 2}) for name in "ABCD"
+    ))
+    assert [len(m.tables) for m in results] == [2, 2, 2, 2]
+    assert WarmEngine.started == 2
+    
+    with pytest.raises(RuntimeError, match="Cannot load"):
+        await pool.extract("broken.pbix", "warm", {"tables": 2})
+    assert pool.stats()["engines"] == 1
+    await asyncio.gather(*(
+        pool.extract(f"{name}.pbix", "warm", {"tables": 2}) for name in "EF"
+    ))
+    assert WarmEngine.started == 3
+    
+    await pool.close()
+    assert pool.stats() == {"engines": 0, "idle": 0, "waiting": 0}
+
+
+@pytest.mark.asyncio
+async def test_docs_stay_inside_the_output_root(tmp_path):
+    """Test that page paths outside the docs, and folders, are not found."""
+    socket_path = str(tmp_path / "docs.sock")
+    (tmp_path / "secret.txt").write_text("secret")
+    (tmp_path / "docs" / "sales").mkdir(parents=True)
+    (tmp_path / "docs" / "sales" / "Home.md").write_text("# Sales")
+    
+    with WikiGenerator(str(tmp_path / "docs")) as generator:
+        service = DocumentationService(generator)
+        server = await serve(service, socket_path)
+        async with server:
+            status, body = await request("/docs/sales/Home.md", socket_path=socket_path)
+            assert status == 200 and body == b"# Sales"
+            for path in ("/docs/../secret.txt", "/docs/%2E%2E/secret.txt",
+                         "/docs//etc/passwd", "/docs/sales", "/docs/sales/"):
+                status, body = await request(path, socket_path=socket_path)
+                assert status == 404 and b"No such page" in body, path
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_service_serves_cached_results(tmp_path):
+    """Test documenting over a socket, then answering from the cache."""
+    socket_path = str(tmp_path / "docs.sock")
+    source = tmp_path / "Sales.pbix"
+    source.write_bytes(b"v1")
+    job = {"source": str(source), "engine": "warm", "options": {"tables": 3}}
+    
+    with WikiGenerator(sink=MemorySink()) as generator:
+        service = DocumentationService(
+            generator, concurrency=2, request_options={"warm": {"tables"}}
+        )
+        server = await serve(service, socket_path)
+        async with server:
+            status, body = await request("/document", "POST", job, socket_path)
+            first = json.loads(body)
+            assert status == 200 and not first["cached"]
+            assert first["folder"] == "sales" and first["tables"] == 3
+            
+            status, body = await request("/document", "POST", job, socket_path)
+            assert json.loads(body)["cached"]
+            assert WarmEngine.loads == [str(source)]
+            
+            # A changed source is documented again on the warm engine
+            source.write_bytes(b"version 2")
+            status, body = await request("/document", "POST", job, socket_path)
+            assert not json.loads(body)["cached"]
+            assert WarmEngine.started == 1
+            
+            status, body = await request("/docs/sales/Home.md", socket_path=socket_path)
+            assert status == 200 and body.startswith(b"# Sales")
+            status, body = await request("/models/sales", socket_path=socket_path)
+            assert [t["name"] for t in json.loads(body)["metadata"]["tables"]][0] == "Sales"
+            status, body = await request("/models", socket_path=socket_path)
+            assert [m["name"] for m in json.loads(body)["models"]] == ["Sales"]
+            
+            status, body = await request("/docs/nope/Home.md", socket_path=socket_path)
+            assert status == 404
+            status, body = await request("/document", "POST", {
+                "source": "x.pbix", "engine": "warm", "options": {"server_path": "/bin/sh"}
+            }, socket_path)
+            assert status == 400 and "server_path" in json.loads(body)["error"]
+            status, body = await request(
+                "/document", "POST", {"source": "x.pbix", "engine": "mcp"}, socket_path
+            )
+            assert status == 400 and "not available" in json.loads(body)["error"]
+            status, body = await request("/document", "POST", {"name": "x"}, socket_path)
+            assert status == 400
+            status, body = await request(
+                "/document", "POST", {"source": "broken.pbix", "engine": "warm"}, socket_path
+            )
+            assert status == 500 and "Cannot load" in json.loads(body)["error"]
+        await service.close()
+
+
+class UnstartableEngine(StaticEngine):
+    """Engine whose server never starts."""
+    
+    starts = 0
+    
+    def __init__(self):
+        super().__init__(make_metadata())
+    
+    async def __aenter__(self):
+        UnstartableEngine.starts += 1
+        raise RuntimeError("server not found")
+
+
+@pytest.mark.asyncio
+async def test_pool_gives_up_on_engines_that_never_start(use_engine):
+    """Test that failed starts back off and then fail the waiting models."""
+    use_engine("unstartable", UnstartableEngine)
+    pool = EnginePool(max_engines=1, max_start_failures=3, start_backoff=0.01)
+    
+    results = await asyncio.wait_for(asyncio.gather(*(
+        pool.extract(f"{name}.pbix", "unstartable") for name in "AB"
+    ), return_exceptions=True), 5)
+    assert all("failed to start: server not found" in str(r) for r in results)
+    assert UnstartableEngine.starts == 3
+    await pool.close()